@@ -1,4 +1,5 @@
 import math
+import timeit
 
 import pytest
 
@@ -6,6 +7,7 @@ from pyaedt.generic.constants import AXIS
 from pyaedt.generic.constants import PLANE
 from pyaedt.generic.constants import SWEEPDRAFT
 from pyaedt.generic.constants import unit_converter
+from pyaedt.generic.constants import unit_converter_function
 from pyaedt.modeler.calculators import StandardWaveguide as wg
 from pyaedt.modeler.calculators import TransmissionLine as tl
 from pyaedt.modeler.geometry_operators import GeometryOperators as go
@@ -420,6 +422,37 @@ class TestClass:
         assert unit_converter(10, "Power", "dBm", "W") == 0.01
         assert unit_converter(10, "Power", "dBW", "W") == 10
 
+    def test_unit_converter_array(self):
+        np = pytest.importorskip("numpy")
+        assert unit_converter_function("Lengths") is None
+        assert unit_converter_function("Length", "meter", "mm") is unit_converter_function("Length", "meter", "mm")
+        values = np.arange(11, dtype=float)
+        assert np.allclose(unit_converter(values, "Length", "meter", "mm"), values * 1000)
+        assert np.allclose(unit_converter(np.array([10.0, 100.0]), "Temperature", "cel", "fah"), [50, 212])
+        assert np.allclose(unit_converter(np.array([10.0, 1.0]), "Power", "W", "dBm"), [40, 30])
+        assert np.allclose(unit_converter(np.array([10.0, 0.0]), "Power", "dBW", "W"), [10, 1])
+        assert np.allclose(unit_converter(np.array([10.0]), "Power", "dBm", "dBW"), [-20])
+
+    def test_unit_converter_function_benchmark(self):
+        np = pytest.importorskip("numpy")
+        values = [float(i) for i in range(1, 100001)]
+        array = np.array(values)
+        for unit_system, input_units, output_units in [("Freq", "Hz", "GHz"), ("Power", "W", "dBm")]:
+            converter = unit_converter_function(unit_system, input_units, output_units)
+            assert np.allclose(converter(array), unit_converter(values, unit_system, input_units, output_units))
+            # the timings are only reported, as they depend on the load of the machine
+            timings = {
+                "unit_converter list": lambda: unit_converter(values, unit_system, input_units, output_units),
+                "cached function array": lambda: converter(array),
+                "unit_converter per value": lambda: [
+                    unit_converter(v, unit_system, input_units, output_units) for v in values
+                ],
+                "cached function per value": lambda: [converter(v) for v in values],
+            }
+            for name, function in timings.items():
+                elapsed = min(timeit.repeat(function, number=1, repeat=3))
+                print("{} -> {} {}: {:.5f} s".format(input_units, output_units, name, elapsed))
+
     def test_are_segments_intersecting(self):
         # crossing
         assert not go.are_segments_intersecting([1, 1], [10, 1], [1, 2], [10, 2])
@@ -1,7 +1,10 @@
+import os
+
 import pytest
 
 from pyaedt.generic.DataHandlers import str_to_bool
 from pyaedt.generic.general_methods import number_aware_string_key
+from pyaedt.generic.settings import ProjectPropertiesCache
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -30,3 +33,33 @@ class TestClass(object):
         assert True in list(map(str_to_bool, test_list_1))
         test_list_2 = ["Stop", "go", "run", "crawl", "False"]
         assert False in list(map(str_to_bool, test_list_2))
+
+    def test_03_project_properties_cache(self, tmp_path):
+        projects = []
+        for i in range(3):
+            project_file = os.path.join(str(tmp_path), "project{}.aedt".format(i))
+            with open(project_file, "w") as f:
+                f.write("$begin 'AnsoftProject'\n$end 'AnsoftProject'\n")
+            projects.append(project_file)
+        cache = ProjectPropertiesCache(max_entries=2)
+        for i, project_file in enumerate(projects):
+            cache.set(project_file, {"AnsoftProject": {"Id": i}})
+        assert projects[0] not in cache
+        assert cache.get(projects[1]) == {"AnsoftProject": {"Id": 1}}
+        assert cache.get(projects[0]) is None
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["evictions"] == 1
+        time_stamp = os.path.getmtime(projects[2])
+        os.utime(projects[2], (time_stamp + 10, time_stamp + 10))
+        cache.set(projects[2], {"AnsoftProject": {"Id": 2}}, block_hashes={"hash": [{"Id": 2}]})
+        time_stamp = os.path.getmtime(projects[2])
+        os.utime(projects[2], (time_stamp + 20, time_stamp + 20))
+        assert cache.get(projects[2]) is None
+        assert cache.block_hashes(projects[2]) == {"hash": [{"Id": 2}]}
+        assert len(cache) == 2
+        del cache[projects[1]]
+        cache.max_memory = 1e-6
+        cache.set(projects[0], {"AnsoftProject": {"Id": 0}})
+        assert len(cache) == 1
+        assert cache.stats["memory"] > 0
@@ -0,0 +1,189 @@
+import os
+import random
+import struct
+
+import numpy as np
+import pytest
+
+from pyaedt.sbrplus.hdm_parser import Parser
+from pyaedt.sbrplus.hdm_parser import RecordParser
+from pyaedt.sbrplus.hdm_utils import get_ray_paths
+
+header = """#header start
+{'message': {'type': 'Bundle'},
+ 'types': {
+  'int32': {'type': 'int', 'size': 4},
+  'float64': {'type': 'float', 'size': 8},
+  'complex128': {'type': 'complex', 'size': 16},
+  'TrackType': {'type': 'enum', 'size': 1, 'values': ['SBR', 'UTD'], 'start': 0},
+  'BounceFlags': {'type': 'flag', 'size': 1, 'values': {'has_refl': 0, 'has_trans': 1}},
+  'Vec3': {'type': 'vector', 'base': 'float64', 'size': 3},
+  'CVec3': {'type': 'vector', 'base': 'complex128', 'size': 3},
+  'Bounce': {'type': 'object', 'layout': [
+      {'type': 'Vec3', 'field_names': ('hit_pt', 'surf_norm')},
+      {'type': 'list', 'base': 'Vec3', 'size': 3, 'field_names': 'footprint_vertices'},
+      {'type': 'CVec3', 'field_names': ('h_inc', 'h_refl')},
+      {'type': 'BounceFlags', 'field_names': 'flags'},
+      {'type': 'CVec3', 'field_names': 'h_trans', 'optional': ('flags', 'has_trans')},
+      {'type': 'Bounce', 'field_names': 'refl_bounce', 'optional': ('flags', 'has_refl')},
+      {'type': 'Bounce', 'field_names': 'trans_bounce', 'optional': ('flags', 'has_trans')}]},
+  'RayTrack': {'type': 'object', 'layout': [
+      {'type': 'TrackType', 'field_names': 'track_type'},
+      {'type': 'int32', 'field_names': 'sweep_angle_index'},
+      {'type': 'Vec3', 'field_names': 'source_point'},
+      {'type': 'Vec3', 'field_names': 'utd_point', 'optional': ('track_type', 'UTD')},
+      {'type': 'int32', 'field_names': 'num_weights'},
+      {'type': 'vector', 'base': 'float64', 'size': 'num_weights', 'field_names': 'weights'},
+      {'type': 'Bounce', 'field_names': 'first_bounce'}]},
+  'Bundle': {'type': 'object', 'layout': [
+      {'type': 'int32', 'field_names': 'num_rays'},
+      {'type': 'float64', 'field_names': 'frequency'},
+      {'type': 'list', 'base': 'RayTrack', 'size': 'num_rays', 'field_names': 'ray_tracks'}]}}}
+#header end
+"""
+
+
+def write_bounce(rng, depth):
+    data = struct.pack("<15d", *[rng.uniform(-10, 10) for _ in range(15)])
+    data += struct.pack("<12d", *[rng.uniform(-1, 1) for _ in range(12)])
+    refl = depth < 4 and rng.random() < 0.7
+    trans = depth < 4 and rng.random() < 0.3
+    data += struct.pack("<B", refl + 2 * trans)
+    if trans:
+        data += struct.pack("<6d", *[rng.uniform(-1, 1) for _ in range(6)])
+    if refl:
+        data += write_bounce(rng, depth + 1)
+    if trans:
+        data += write_bounce(rng, depth + 1)
+    return data
+
+
+def write_hdm(filename, num_rays):
+    rng = random.Random(0)
+    with open(filename, "wb") as f:
+        f.write(header.encode())
+        f.write(struct.pack("<id", num_rays, 1e10))
+        for i in range(num_rays):
+            utd = rng.random() < 0.3
+            f.write(struct.pack("<Bi3d", utd, i // 4, *[rng.uniform(-10, 10) for _ in range(3)]))
+            if utd:
+                f.write(struct.pack("<3d", *[rng.uniform(-10, 10) for _ in range(3)]))
+            num_weights = rng.randint(1, 3)
+            f.write(struct.pack("<i{}d".format(num_weights), num_weights, *range(num_weights)))
+            f.write(write_bounce(rng, 1))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def desktop():
+    return
+
+
+@pytest.fixture(scope="module")
+def hdm_file(local_scratch):
+    filename = os.path.join(local_scratch.path, "rays.hdm")
+    write_hdm(filename, 50)
+    return filename
+
+
+def test_record_parser(hdm_file):
+    bundle = Parser(hdm_file).parse_message()
+    parser = RecordParser(hdm_file)
+    records = parser.parse()
+    rays = records["RayTrack"]
+    bounces = records["Bounce"]
+    assert records["Bundle"]["num_rays"][0] == len(rays) == len(bundle.ray_tracks)
+    assert np.shares_memory(records["Bundle"]["frequency"], parser.binarycontent)
+    assert records["Bundle"].children["ray_tracks"].tolist() == list(range(len(rays)))
+    assert rays.child_types["first_bounce"] == "Bounce"
+
+    def check_bounce(bounce, index):
+        assert np.array_equal(bounce.hit_pt, bounces["hit_pt"][index])
+        assert np.array_equal(bounce.footprint_vertices, bounces["footprint_vertices"][index])
+        assert np.array_equal(bounce.h_refl, bounces["h_refl"][index])
+        assert bounces.present("h_trans")[index] == (bounce.h_trans is not None)
+        for field in ["refl_bounce", "trans_bounce"]:
+            if getattr(bounce, field) is None:
+                assert bounces.children[field][index] == -1
+            else:
+                check_bounce(getattr(bounce, field), bounces.children[field][index])
+
+    for i, ray in enumerate(bundle.ray_tracks):
+        assert ray.track_type.value == rays["track_type"][i]
+        assert ray.sweep_angle_index == rays["sweep_angle_index"][i]
+        assert np.array_equal(ray.source_point, rays["source_point"][i])
+        if ray.utd_point is None:
+            assert not rays.present("utd_point")[i]
+        else:
+            assert np.array_equal(ray.utd_point, rays["utd_point"][i])
+        weights = rays["weights"][rays.offsets["weights"][i] : rays.offsets["weights"][i + 1]]
+        assert np.array_equal(np.atleast_1d(ray.weights), weights)
+        check_bounce(ray.first_bounce, rays.children["first_bounce"][i])
+
+    ray_records = rays.records(["track_type", "sweep_angle_index"])
+    assert ray_records.dtype.names == ("track_type", "sweep_angle_index")
+    assert np.array_equal(ray_records["sweep_angle_index"], rays["sweep_angle_index"])
+
+
+def test_record_parser_batches(hdm_file):
+    parser = RecordParser(hdm_file)
+    records = parser.parse()
+    rays = records["RayTrack"]
+    bounces = records["Bounce"]
+    num_rays = 0
+    num_bounces = 0
+    for batch in parser.iter_batches(batch_size=8, block_size=512):
+        assert batch["Bundle"]["num_rays"][0] == len(rays)
+        batch_rays = batch["RayTrack"]
+        batch_bounces = batch["Bounce"]
+        assert len(batch_rays) <= 8
+        assert batch["Bundle"].children["ray_tracks"].tolist() == list(range(len(batch_rays)))
+        ray_slice = slice(num_rays, num_rays + len(batch_rays))
+        bounce_slice = slice(num_bounces, num_bounces + len(batch_bounces))
+        assert np.array_equal(batch_rays["source_point"], rays["source_point"][ray_slice])
+        assert np.array_equal(batch_rays["utd_point"], rays["utd_point"][ray_slice])
+        assert np.array_equal(batch_bounces["hit_pt"], bounces["hit_pt"][bounce_slice])
+        first_bounces = batch_rays.children["first_bounce"] + num_bounces
+        assert np.array_equal(first_bounces, rays.children["first_bounce"][ray_slice])
+        num_rays += len(batch_rays)
+        num_bounces += len(batch_bounces)
+    assert num_rays == len(rays)
+    assert num_bounces == len(bounces)
+
+
+def test_ray_paths(hdm_file):
+    bundle = Parser(hdm_file).parse_message()
+    records = RecordParser(hdm_file).parse()
+
+    def segments(ray_indices, max_depth=None):
+        res = []
+
+        def add_bounce(bounce, depth):
+            for next_bounce in [bounce.refl_bounce, bounce.trans_bounce]:
+                if next_bounce is not None and (max_depth is None or depth <= max_depth):
+                    res.append(np.concatenate([bounce.hit_pt, next_bounce.hit_pt, [depth]]))
+                    add_bounce(next_bounce, depth + 1)
+
+        for i in ray_indices:
+            track = bundle.ray_tracks[i]
+            path = [track.source_point, track.first_bounce.hit_pt]
+            if track.utd_point is not None:
+                path.insert(1, track.utd_point)
+            for start, end in zip(path[:-1], path[1:]):
+                res.append(np.concatenate([start, end, [1]]))
+            add_bounce(track.first_bounce, 2)
+        return np.array(sorted(map(tuple, res)))
+
+    def paths(**kwargs):
+        points, lines, depths = get_ray_paths(records["RayTrack"], records["Bounce"], **kwargs)
+        lines = lines.reshape(-1, 3)
+        assert np.all(lines[:, 0] == 2)
+        res = np.hstack([points[lines[:, 1]], points[lines[:, 2]], depths[lines[:, 1], None]])
+        return np.array(sorted(map(tuple, res)))
+
+    assert np.array_equal(paths(), segments(range(50)))
+    assert np.array_equal(paths(decimation=4), segments(range(0, 50, 4)))
+    assert np.array_equal(paths(ray_indices=[3, 7], depths=[1, 2]), segments([3, 7], max_depth=2))
+    all_paths = paths()
+    box = [-5, -5, -5, 5, 5, 5]
+    inside = np.all(np.abs(all_paths[:, :3]) <= 5, axis=1) | np.all(np.abs(all_paths[:, 3:6]) <= 5, axis=1)
+    assert np.array_equal(paths(bounding_box=box), all_paths[inside])
@@ -8,6 +8,8 @@ from pyaedt import Icepak
 from pyaedt import Maxwell3d
 from pyaedt.modules.Material import MatProperties
 from pyaedt.modules.Material import SurfMatProperties
+from pyaedt.modules.MaterialLib import AmatCatalog
+from pyaedt.modules.MaterialLib import get_amat_catalog
 
 test_subfolder = "T03"
 
@@ -366,3 +368,26 @@ class TestClass:
             self.aedtapp.materials["mat_test"].set_coreloss_at_frequency(
                 points_list_at_freq={60: [[0, 0], [1, 3.5], [2, 7.4]]}, thickness=50
             )
+
+    def test_15_amat_catalog(self):
+        library = os.path.join(self.local_scratch.path, "amat_library")
+        os.makedirs(library)
+        amat_file = self.local_scratch.copyfile(
+            os.path.join(local_path, "example_models", "syslib", "Materials.amat"),
+            os.path.join(library, "Materials.amat"),
+        )
+        catalog = get_amat_catalog(library)
+        assert catalog.names == ["FC-78", "Polyflon CuFlon (tm)", "Water(@360K)", "steel_stainless"]
+        assert catalog.read_material("FC-78")["mass_density"] == "1700"
+        assert not catalog.read_material("copper")
+        assert os.path.exists(catalog.catalog_file)
+        new_catalog = AmatCatalog(library)
+        assert new_catalog.load()
+        assert new_catalog.files == catalog.files
+        with open(amat_file, "a") as f:
+            f.write("$begin 'new_material'\n$begin 'MaterialDef'\n$begin 'new_material'\n")
+            f.write("permittivity='2.2'\n$end 'new_material'\n$end 'MaterialDef'\n$end 'new_material'\n")
+        assert not catalog.is_valid()
+        catalog = get_amat_catalog(library)
+        assert catalog.names[-1] == "new_material"
+        assert catalog.read_material("new_material") == {"permittivity": "2.2"}
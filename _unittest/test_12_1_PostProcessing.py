@@ -1,3 +1,4 @@
+import math
 import os
 import sys
 import uuid
@@ -10,6 +11,7 @@ from pyaedt.generic.DataHandlers import json_to_dict
 from pyaedt.generic.general_methods import is_linux
 from pyaedt.generic.plot import _parse_aedtplt
 from pyaedt.generic.plot import _parse_streamline
+from pyaedt.modules.solutions import SolutionData
 
 if config["desktopVersion"] > "2022.2":
     test_field_name = "Potter_Horn_231"
@@ -34,6 +36,46 @@ test_subfolder = "T12"
 settings.enable_pandas_output = True
 
 
+class SolutionDataMock(object):
+    """Mimic the solution data of one variation returned by ``GetSolutionDataPerVariation``."""
+
+    def __init__(self, variables, freq, phi, offset=0.0):
+        self.variables = variables
+        self.sweeps = {"Freq": [f for f in freq for _ in phi], "Phi": [p for _ in freq for p in phi]}
+        self.real = [offset + i for i in range(len(freq) * len(phi))]
+        self.imag = [-1.0 * i for i in range(len(freq) * len(phi))]
+
+    def GetDesignVariableNames(self):
+        return list(self.variables.keys())
+
+    def GetDesignVariableValue(self, name):
+        return self.variables[name]
+
+    def GetSweepNames(self):
+        return ["Phi", "Freq"]
+
+    def GetSweepValues(self, name, full=False):
+        return self.sweeps[name]
+
+    def GetSweepUnits(self, name):
+        return "GHz" if name == "Freq" else "deg"
+
+    def GetDataExpressions(self):
+        return ["S(1,1)", "Gain"]
+
+    def GetRealDataValues(self, expression, full=False):
+        return self.real
+
+    def GetImagDataValues(self, expression, full=False):
+        return self.imag
+
+    def IsDataComplex(self, expression):
+        return expression == "S(1,1)"
+
+    def GetDataUnits(self, expression):
+        return ""
+
+
 @pytest.fixture(scope="class")
 def aedtapp(add_app):
     app = add_app(project_name=test_project_name, subfolder=test_subfolder)
@@ -629,3 +671,150 @@ class TestClass:
         val = self.aedtapp.post.update_report_dynamically
         self.aedtapp.post.update_report_dynamically = not val
         assert self.aedtapp.post.update_report_dynamically != val
+
+    def test_75_solution_data_arrays(self):
+        freq = [1.0, 2.0, 3.0]
+        phi = [0.0, 90.0]
+        data = SolutionData(
+            [SolutionDataMock({"a": "1mm"}, freq, phi), SolutionDataMock({"a": "2mm"}, freq, phi, offset=100.0)]
+        )
+        data.enable_pandas_output = False
+        assert data.primary_sweep == "Freq"
+        assert data.data_real("S(1,1)") == [0.0, 2.0, 4.0]
+        assert data.data_imag("S(1,1)") == [0.0, -2.0, -4.0]
+        assert data.data_magnitude("S(1,1)")[1] == abs(complex(2.0, -2.0))
+        assert data.data_imag("Gain") == [0.0, 0.0, 0.0]
+        assert not data.is_real_only("S(1,1)")
+        assert data.is_real_only("Gain")
+        data.active_variation = data.variations[1]
+        data.active_intrinsic["Phi"] = 90.0
+        assert data.data_real("S(1,1)") == [101.0, 103.0, 105.0]
+        data.primary_sweep = "Phi"
+        data.active_intrinsic["Freq"] = 2.0
+        assert data.data_real("S(1,1)") == [102.0, 103.0]
+        data.active_intrinsic["Freq"] = 4.0
+        assert data.data_real("S(1,1)") == [None, None]
+        real, imag = data.full_matrix_real_imag
+        assert real["S(1,1)"][("2mm", 3.0, 90.0)] == 105.0
+        assert imag["Gain"][("1mm", 1.0, 0.0)] == 0.0
+        assert len(real["S(1,1)"]) == 12
+        output = os.path.join(self.local_scratch.path, "solution_data.csv")
+        assert data.export_data_to_csv(output)
+        with open(output, "r") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 13
+        assert lines[0] == "a;Freq;Phi;S(1,1) (Real);S(1,1) (Imag);Gain"
+
+    def test_76_solution_data_lazy(self):
+        freq = [1.0, 2.0, 3.0]
+        phi = [0.0, 90.0]
+        settings.enable_lazy_solution_data = True
+        try:
+            data = SolutionData([SolutionDataMock({"a": "1mm"}, freq, phi)])
+        finally:
+            settings.enable_lazy_solution_data = False
+        data.enable_pandas_output = False
+        stats = data.stats
+        assert stats["expressions"] == 2
+        assert not stats["loaded_expressions"]
+        assert stats["memory"] == 0
+        assert data.data_db20("S(1,1)")[1] == 20 * math.log10(abs(complex(2.0, -2.0)))
+        assert data.data_phase("S(1,1)", radians=False)[1] == -45.0
+        stats = data.stats
+        assert stats["loaded_expressions"] == ["S(1,1)"]
+        assert sorted(stats["derived"]["S(1,1)"]) == ["db20", "mag", "phase"]
+        assert stats["memory"] > 0
+        assert stats["load_time"] >= 0.0
+        assert data.data_real("Gain") == [0.0, 2.0, 4.0]
+        assert data.stats["loaded_expressions"] == ["S(1,1)", "Gain"]
+
+    def test_77_solution_data_select(self):
+        freq = [1.0, 2.0, 3.0]
+        phi = [0.0, 90.0]
+        data = SolutionData(
+            [
+                SolutionDataMock({"a": "1mm", "b": "1mm"}, freq, phi),
+                SolutionDataMock({"a": "2mm", "b": "1mm"}, freq, phi, offset=100.0),
+                SolutionDataMock({"a": "1mm", "b": "2mm"}, freq, phi, offset=200.0),
+            ]
+        )
+        assert data.variation_values("a") == ["1mm", "2mm"]
+        assert data.find_variations(a="1mm") == [0, 2]
+        assert data.find_variations(a="1mm", b="2mm") == [2]
+        assert data.find_variations(a=["1mm", "2mm"], b="1mm") == [0, 1]
+        assert data.find_variations(a="3mm") == []
+        assert data.find_variations() == [0, 1, 2]
+        values = data.select("S(1,1)", a="1mm")
+        assert values.shape == (2, 3)
+        assert list(values.real[1]) == [200.0, 202.0, 204.0]
+        assert list(values.imag[0]) == [0.0, -2.0, -4.0]
+        values = data.select("S(1,1)", b="1mm", Phi=90.0)
+        assert list(values.real[1]) == [101.0, 103.0, 105.0]
+        assert data.select("S(1,1)", a="3mm").shape == (0, 3)
+        data.primary_sweep = "a"
+        assert not data.select("S(1,1)")
+
+    def test_78_solution_data_table_export(self):
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("h5py")
+        freq = [1.0, 2.0, 3.0]
+        phi = [0.0, 90.0]
+        data = SolutionData(
+            [SolutionDataMock({"a": "1mm"}, freq, phi), SolutionDataMock({"a": "2mm"}, freq, phi, offset=100.0)]
+        )
+        data.enable_pandas_output = False
+        data.primary_sweep = "Phi"
+        for file_format in ["parquet", "arrow", "hdf5"]:
+            output = os.path.join(self.local_scratch.path, "solution_data." + file_format)
+            assert getattr(data, "export_data_to_" + file_format)(output, chunk_size=4)
+            new_data = getattr(SolutionData, "from_" + file_format)(output)
+            new_data.enable_pandas_output = False
+            assert new_data.variations == data.variations
+            assert new_data.expressions == data.expressions
+            assert new_data.primary_sweep == "Phi"
+            assert new_data.is_real_only("Gain")
+            assert new_data.full_matrix_real_imag[0]["S(1,1)"] == data.full_matrix_real_imag[0]["S(1,1)"]
+            assert new_data.full_matrix_real_imag[1]["S(1,1)"] == data.full_matrix_real_imag[1]["S(1,1)"]
+
+    def test_79_solution_data_snapshot(self):
+        freq = [1.0, 2.0, 3.0]
+        phi = [0.0, 90.0]
+        data = SolutionData(
+            [SolutionDataMock({"a": "1mm"}, freq, phi), SolutionDataMock({"a": "2mm"}, freq, phi, offset=100.0)]
+        )
+        data.enable_pandas_output = False
+        data.set_active_variation(1)
+        data.active_intrinsic["Phi"] = 90.0
+        output = os.path.join(self.local_scratch.path, "solution_data.npz")
+        assert data.export_snapshot(output)
+        new_data = SolutionData.from_snapshot(output)
+        new_data.enable_pandas_output = False
+        assert new_data.expressions == data.expressions
+        assert new_data.intrinsics == data.intrinsics
+        assert new_data.units_sweeps == data.units_sweeps
+        assert new_data.active_variation == data.variations[1]
+        assert new_data.data_real("S(1,1)") == [101.0, 103.0, 105.0]
+        assert new_data.data_db20("S(1,1)") == data.data_db20("S(1,1)")
+        assert new_data.is_real_only("Gain")
+        assert new_data.select("S(1,1)").shape == (2, 3)
+
+    def test_80_solution_data_time_domain(self):
+        np = pytest.importorskip("numpy")
+        freq = [1.0, 2.0, 3.0, 4.0]
+        phi = [0.0, 90.0]
+        data = SolutionData([SolutionDataMock({"a": "1mm"}, freq, phi)])
+        data.enable_pandas_output = False
+        time_data = data.time_domain_transform("S(1,1)", window="hanning", n_points=8)
+        time_data.enable_pandas_output = False
+        time_data.primary_sweep = "Time"
+        assert time_data.units_sweeps["Time"] == "s"
+        assert len(time_data.variation_values("Time")) == 8
+        assert abs(time_data.variation_values("Time")[1] - 1.0 / (8 * 1e9)) < 1e-20
+        spectrum = np.array(data.data_real("S(1,1)")) + 1j * np.array(data.data_imag("S(1,1)"))
+        expected = np.fft.ifft(spectrum * np.hanning(4), 8)
+        assert np.allclose(time_data.data_real("S(1,1)"), expected.real)
+        assert np.allclose(time_data.data_imag("S(1,1)"), expected.imag)
+        real_data = data.time_domain_transform(real=True)
+        assert real_data.is_real_only("Gain")
+        assert len(real_data.intrinsics["Time"]) == 6
+        assert not data.time_domain_transform(sweep="Phase")
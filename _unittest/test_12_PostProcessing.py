@@ -2,6 +2,7 @@ import os
 import sys
 
 from _unittest.conftest import config
+import numpy as np
 import pytest
 
 from pyaedt import Circuit
@@ -14,6 +15,7 @@ from pyaedt.generic.general_methods import is_linux
 from pyaedt.generic.plot import _parse_aedtplt
 from pyaedt.generic.plot import _parse_streamline
 from pyaedt.modules.solutions import FfdSolutionData
+from pyaedt.modules.solutions import UpdateBeamForm
 
 if config["desktopVersion"] > "2022.2":
     test_field_name = "Potter_Horn_231"
@@ -570,6 +572,32 @@ class TestClass:
 
         ffdata.taper = "cosine"
         assert ffdata.combine_farfield()
+        farfield = ffdata.combine_farfield(phi_scan=30, theta_scan=20)
+        assert farfield["rETheta"].shape == (farfield["nTheta"], farfield["nPhi"])
+        # steered beam against the superposition of the element patterns port by port
+        theta, phi = np.meshgrid(np.deg2rad(farfield["Theta"]), np.deg2rad(farfield["Phi"]), indexing="ij")
+        k = 2 * np.pi * ffdata.frequency_value / 299792458
+        wave_vector = [k * np.sin(theta) * np.cos(phi), k * np.sin(theta) * np.sin(phi), k * np.cos(theta)]
+        reference = np.zeros(theta.shape, dtype=complex)
+        for port_id, port in enumerate(ffdata.all_port_names):
+            a, b = [i - 1 for i in ffdata.port_index[port]]
+            magnitude = ffdata._assign_weight(a=a, b=b) * ffdata.mag_offset[port_id]
+            phase = np.deg2rad(ffdata.phase_offset[port_id] + ffdata._phase_shift_steering(a, b, 20, 30))
+            position = np.subtract(ffdata.port_position[port], ffdata.origin)
+            phase = phase + sum(p * kp for p, kp in zip(position, wave_vector))
+            pattern = ffdata._read_ffd_file(ffdata.eep_file_info[port][0])[2][:, 0].reshape(theta.shape)
+            reference += np.sqrt(magnitude) * np.exp(1j * phase) * pattern
+        assert np.max(np.abs(farfield["rETheta"] - reference)) < 1e-12 * np.max(np.abs(reference))
+        assert len(farfield["Element_Location"]) == len(ffdata.all_port_names)
+        scan = ffdata.scan_farfield(phi_scan=[0, 90], theta_scan=[0, 10, 20], tapers=["flat", "cosine"])
+        assert scan["RealizedGain"].shape == (12, farfield["nTheta"], farfield["nPhi"])
+        assert len(scan["SidelobeLevel_dB"]) == 12
+        assert abs(scan["ScanLoss_dB"][0]) < 1e-6
+        scan = ffdata.scan_farfield(phi_scan=0, theta_scan=[0, 10], chunk_size=1, store_farfield=False)
+        assert "RealizedGain" not in scan
+        assert len(scan["PeakRealizedGain_dB"]) == 2
+        assert not ffdata.scan_farfield(phi_scan=0, theta_scan=0, tapers="taper")
+        assert not ffdata.scan_farfield(phi_scan=0, theta_scan=0, farfield_quantity="rEPhi")
         ffdata.taper = "taper"
         assert not ffdata.taper == "taper"
 
@@ -610,6 +638,57 @@ class TestClass:
             show_geometry=False,
         )
         assert data_pyvista
+        mesh = ffdata.get_far_field_mesh(farfield_quantity="RealizedGain", quantity_format="dB10")
+        ffdata.mesh = mesh
+        points = mesh.points.copy()
+        beam_form = UpdateBeamForm(ffdata, "RealizedGain", "dB10")
+        beam_form.update_theta(20)
+        assert ffdata.mesh is mesh
+        assert mesh.n_points == len(points)
+        assert (mesh.points != points).any()
+        # the same scan angle is computed again when the beam settings change
+        points = mesh.points.copy()
+        beam_form.update_theta(20)
+        assert (mesh.points == points).all()
+        ffdata.taper = "hamming"
+        beam_form.update_theta(20)
+        assert (mesh.points != points).any()
+
+    def test_70a_far_field_data_cache(self):
+        local_path = os.path.dirname(os.path.realpath(__file__))
+        eep_folder = os.path.join(self.local_scratch.path, "eep_cache")
+        self.local_scratch.copyfolder(os.path.join(local_path, "example_models", test_subfolder, "eep"), eep_folder)
+        eep_file = os.path.join(eep_folder, "eep.txt")
+        ffdata = FfdSolutionData(frequencies=0.9e9, eep_files=eep_file)
+        assert not [i for i in os.listdir(eep_folder) if i.endswith(".npz")]
+        settings.enable_ffd_file_cache = True
+        try:
+            ffdata_cached = FfdSolutionData(frequencies=0.9e9, eep_files=eep_file)
+            assert len([i for i in os.listdir(eep_folder) if i.endswith(".npz")]) == 1
+            ffdata_cached = FfdSolutionData(frequencies=0.9e9, eep_files=eep_file)
+            assert (ffdata_cached.farfield_data["rETheta"] == ffdata.farfield_data["rETheta"]).all()
+            ffd_files = [ffdata.eep_file_info[port][0] for port in ffdata.all_port_names]
+            assert ffdata._load_ffd_cache(ffd_files) is not None
+            with open(ffd_files[0], "a") as f:
+                f.write("\n")
+            assert ffdata._load_ffd_cache(ffd_files) is None
+        finally:
+            settings.enable_ffd_file_cache = False
+
+    def test_70b_far_field_data_reduced_precision(self):
+        local_path = os.path.dirname(os.path.realpath(__file__))
+        eep_file = os.path.join(local_path, "example_models", test_subfolder, "eep", "eep.txt")
+        ffdata = FfdSolutionData(frequencies=0.9e9, eep_files=eep_file)
+        ffdata_single = FfdSolutionData(
+            frequencies=0.9e9, eep_files=eep_file, reduced_precision=True, port_chunk_size=5
+        )
+        assert ffdata_single.reduced_precision
+        assert ffdata_single._element_patterns["rETheta"].nbytes * 2 == ffdata._element_patterns["rETheta"].nbytes
+        farfield = ffdata.combine_farfield(phi_scan=45, theta_scan=30)
+        farfield_single = ffdata_single.combine_farfield(phi_scan=45, theta_scan=30)
+        assert "rETotal_ErrorBound" not in farfield
+        error = abs(farfield["rETotal"] - farfield_single["rETotal"])
+        assert (error <= farfield_single["rETotal_ErrorBound"]).all()
 
     @pytest.mark.skipif(is_linux or sys.version_info < (3, 8), reason="FarFieldSolution not supported by IronPython")
     def test_71_antenna_plot(self, field_test):
@@ -1,14 +1,27 @@
 import base64
 import filecmp
+import glob
 import os
+import re
 import sys
 
 from _unittest.conftest import config
 from _unittest.conftest import local_path
 import pytest
 
+from pyaedt.generic.LoadAEDTFile import AedtFileParser
+from pyaedt.generic.LoadAEDTFile import _decode_subkey
+from pyaedt.generic.LoadAEDTFile import _disk_cache_header
+from pyaedt.generic.LoadAEDTFile import _load_from_disk_cache
+from pyaedt.generic.LoadAEDTFile import _parse_value
+from pyaedt.generic.LoadAEDTFile import _save_to_disk_cache
+from pyaedt.generic.LoadAEDTFile import clear_aedt_file_cache
+from pyaedt.generic.LoadAEDTFile import get_block_index
 from pyaedt.generic.LoadAEDTFile import load_entire_aedt_file
 from pyaedt.generic.LoadAEDTFile import load_keyword_in_aedt_file
+from pyaedt.generic.LoadAEDTFile import update_aedt_file
+from pyaedt.generic.LoadAEDTFile import write_aedt_file
+from pyaedt.generic.settings import settings
 
 test_subfolder = "T13"
 if config["desktopVersion"] > "2022.2":
@@ -26,6 +39,71 @@ else:
     cs3_name = "Coordinate_System3"
     image_f = "Coax_HFSS.jpg"
 
+# every .aedt, .amat and .asol file of the example models is used to check the line decoding
+corpus_files = sorted(
+    i
+    for extension in ["aedt", "amat", "asol"]
+    for i in glob.glob(os.path.join(local_path, "example_models", "**", "*." + extension), recursive=True)
+)
+
+# reference line decoding, based on regular expressions
+_ref_split_list_elements = re.compile(",(?=(?:[^']*'[^']*')*[^']*$)")
+_ref_round_bracket_list = re.compile(
+    r"^(?P<SKEY1>[^\s=]+?)\((?P<LIST1>.+)\)|^'(?P<SKEY2>.+?\s.+)'(?<=')\((?P<LIST2>.+)\)"
+)
+_ref_square_bracket_list = re.compile(
+    r"^(?P<SKEY1>\S+?)\[\d+:(?P<LIST1>.+)\]|^'(?P<SKEY2>.+?\s.+)'(?<=')\[\d+:(?P<LIST2>.+)\]"
+)
+_ref_key_parse = re.compile(r"(^'(?P<KEY1>.+?)')(?<=')=(?P<VAL1>.+$)|(?P<KEY2>^.+?)=(?P<VAL2>.+$)")
+
+
+def _ref_separate_list_elements(v):
+    if "(" in v or "=" in v:
+        elements = _ref_split_list_elements.split(v)
+    else:
+        elements = v.split(",")
+    return [_parse_value(i.strip()) for i in elements]
+
+
+def _ref_decode_subkey(line, d):
+    if line.startswith("simple("):
+        m = _ref_round_bracket_list.search(line)
+        if m and m.group("SKEY1") == "simple":
+            elems = _ref_separate_list_elements(m.group("LIST1"))
+            if elems[0] == "thermal_expansion_coeffcient":
+                elems[0] = "thermal_expansion_coefficient"
+            d[elems[0]] = str(elems[1])
+            return
+    elif re.search(r"^\w+IDMap\(.*\)$", line, re.IGNORECASE):
+        m = re.search(r"^(?P<SKEY>[^\s=]+?)\((?P<LIST>.*)\)", line)
+        if m and "idmap" in m.group("SKEY").lower():
+            d[m.group("SKEY")] = m.group("LIST").split(",") if m.group("LIST") else None
+            return
+    if line.startswith("WireSeg("):
+        d.setdefault("WireSeg", []).append([_parse_value(i) for i in line.lstrip("WireSeg(").rstrip(")").split(", ")])
+        return
+    if line.startswith("PC("):
+        d.setdefault("PC", []).append(line.lstrip("PC(").rstrip(")").split(", "))
+        return
+    for bracket_list in [_ref_round_bracket_list, _ref_square_bracket_list]:
+        m = bracket_list.search(line)
+        if m and m.group("SKEY1"):
+            d[m.group("SKEY1")] = _ref_separate_list_elements(m.group("LIST1"))
+            return
+        elif m and m.group("SKEY2"):
+            d[m.group("SKEY2")] = _ref_separate_list_elements(m.group("LIST2"))
+            return
+    m = _ref_key_parse.search(line)
+    if m:
+        k, v = (m.group("KEY1"), m.group("VAL1")) if m.group("KEY1") else (m.group("KEY2"), m.group("VAL2"))
+        v2 = v.replace("\\'", '"')
+        if not re.search(r"\s", v2) or re.search(r"^'([^']*\s[^']*)(?=')", v2):
+            d[k] = _parse_value(v)
+        else:
+            d[line] = None
+    else:
+        d[line] = None
+
 
 def _write_jpg(design_info, scratch):
     """writes the jpg Image64 property of the design info
@@ -214,3 +292,151 @@ class TestClass:
         assert dd_array["Rotation"]["columns"] == 8
         assert dd_array["Rotation"]["matrix"] == rotation
         assert dd_array["PostProcessingCells"] == onecell
+
+    def test_10_parse_files_concurrently(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        files = [
+            os.path.join(local_path, "example_models", test_subfolder, i)
+            for i in ["assembly.aedt", "Cassegrain.aedt", "phased_array.aedt", "material_sample.amat"]
+        ]
+        sequential = [AedtFileParser(f).load_entire() for f in files]
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            concurrent = list(executor.map(load_entire_aedt_file, files * 2))
+        assert concurrent[: len(files)] == sequential
+        assert concurrent[len(files) :] == sequential
+
+    def test_11_block_index(self):
+        aedt_file = os.path.join(local_path, "example_models", test_subfolder, "Cassegrain.aedt")
+        index = get_block_index(aedt_file)
+        assert "AnsoftProject" in index.blocks
+        assert "ProjectPreview" in index.blocks
+        assert "Definitions" in index.blocks
+        assert get_block_index(aedt_file) is index
+        full_parser = AedtFileParser(aedt_file)
+        full_parser.read()
+        for keyword in ["ProjectPreview", "Definitions", "AnsoftProject"]:
+            expected = {}
+            full_parser._count = 0
+            full_parser._walk_through_structure(keyword, expected)
+            assert load_keyword_in_aedt_file(aedt_file, keyword) == expected
+
+    def test_12_disk_cache(self, monkeypatch):
+        aedt_file = self.local_scratch.copyfile(
+            os.path.join(local_path, "example_models", test_subfolder, "Cassegrain.aedt")
+        )
+        settings.enable_aedt_file_cache = True
+        settings.aedt_file_cache_path = os.path.join(self.local_scratch.path, "aedt_file_cache")
+        try:
+            expected = AedtFileParser(os.path.normpath(aedt_file)).load_entire()
+            assert load_entire_aedt_file(aedt_file) == expected
+            assert len(os.listdir(settings.aedt_file_cache_path)) == 1
+            assert load_entire_aedt_file(aedt_file) == expected
+            if hasattr(os, "getuid"):
+                # the folder is private to the user, and the entries of another user are not loaded
+                assert not os.stat(settings.aedt_file_cache_path).st_mode & 0o077
+                filename = os.path.normpath(aedt_file)
+                header = _disk_cache_header(filename)
+                monkeypatch.setattr(os, "getuid", lambda: os.stat(filename).st_uid + 1)
+                assert _load_from_disk_cache(filename, header) is None
+                assert not _save_to_disk_cache(filename, expected, header)
+                monkeypatch.undo()
+                assert _load_from_disk_cache(filename, header) == expected
+            with open(aedt_file, "a") as f:
+                f.write("$begin 'CacheTest'\n$end 'CacheTest'\n")
+            assert "CacheTest" in load_entire_aedt_file(aedt_file)
+            assert clear_aedt_file_cache()
+            assert not os.listdir(settings.aedt_file_cache_path)
+            # a file saved while it is parsed must not be cached as up to date
+            load_entire = AedtFileParser.load_entire
+
+            def load_and_save(parser):
+                main_dict = load_entire(parser)
+                with open(aedt_file, "a") as f:
+                    f.write("$begin 'SavedDuringParse'\n$end 'SavedDuringParse'\n")
+                return main_dict
+
+            monkeypatch.setattr(AedtFileParser, "load_entire", load_and_save)
+            assert "SavedDuringParse" not in load_entire_aedt_file(aedt_file)
+            monkeypatch.undo()
+            assert "SavedDuringParse" in load_entire_aedt_file(aedt_file)
+        finally:
+            settings.enable_aedt_file_cache = False
+
+    def test_13_skip_binary_content(self):
+        project_dict = load_entire_aedt_file(
+            os.path.join(local_path, "example_models", test_subfolder, "Coax_HFSS_t13_231.aedt")
+        )
+        geometry_files = project_dict["AllReferencedFilesForProject"]["Design_0.setup/NativeGeometryFiles"]
+        assert len(geometry_files["x_b"]) == 5
+        assert "BIN000000004832" in geometry_files["x_b"][0]
+        assert "ProjectPreview" in project_dict
+
+    @pytest.mark.parametrize("corpus_file", corpus_files, ids=[os.path.basename(i) for i in corpus_files])
+    def test_14_line_decoding_corpus(self, corpus_file):
+        parser = AedtFileParser(corpus_file)
+        parser.read()
+        for line in parser._all_lines:
+            if line.startswith(("$begin '", "$end '")):
+                continue
+            expected = {}
+            _ref_decode_subkey(line, expected)
+            decoded = {}
+            _decode_subkey(line, decoded)
+            # repr also checks the types, as 1 == 1.0 == True
+            assert repr(decoded) == repr(expected), line
+
+    def test_15_write_aedt_file(self):
+        aedt_file = os.path.join(local_path, "example_models", test_subfolder, "Coax_HFSS_t13_231.aedt")
+        project_dict = load_entire_aedt_file(aedt_file)
+        output_file = os.path.join(self.local_scratch.path, "Coax_HFSS_written.aedt")
+        assert write_aedt_file(output_file, project_dict, aedt_file)
+        assert repr(load_entire_aedt_file(output_file)) == repr(project_dict)
+        payloads = []
+        for filename in [aedt_file, output_file]:
+            with open(filename, "rb") as f:
+                content = f.read()
+            payloads.append(
+                [content[m.end() : m.end() + int(m.group(1))] for m in re.finditer(rb"BIN(\d+)\r?\n", content)]
+            )
+        assert len(payloads[0]) == 5
+        assert payloads[1] == payloads[0]
+        assert b"Design_0.setup/NativeGeometryFiles/0000006.x_b" in content
+        with pytest.raises(ValueError):
+            write_aedt_file(output_file, project_dict)
+        project_dict["AnsoftProject"]["Desktop"]["Version"] = [2024, 1]
+        project_dict["AnsoftProject"]["NewBlock"] = {"Name": "a b", "Value": 1.5, "Flag": True, "List": ["a", 1]}
+        assert write_aedt_file(output_file, project_dict, aedt_file)
+        assert repr(load_entire_aedt_file(output_file)) == repr(project_dict)
+        del project_dict["AllReferencedFilesForProject"]
+        assert write_aedt_file(output_file, project_dict)
+        written_dict = load_entire_aedt_file(output_file)
+        assert written_dict["AnsoftProject"]["NewBlock"] == project_dict["AnsoftProject"]["NewBlock"]
+        assert written_dict["AnsoftProject"]["Desktop"]["Version"] == [2024, 1]
+        # list whose elements keep escaped quotes and quoted commas
+        aedt_file = os.path.join(local_path, "example_models", "T21", "AMI_Example.aedt")
+        project_dict = load_entire_aedt_file(aedt_file)
+        compdefs = project_dict["AnsoftProject"]["Definitions"]["Compdefs"]
+        parameters = compdefs["example_tx_P_example_device_tx_ibis_ami_example_tx_diff"]["Parameters"]
+        assert len(parameters["TextValueProp"]) == 6
+        parameters["TextValueProp"][2] = "edited"
+        assert write_aedt_file(output_file, project_dict, aedt_file)
+        assert repr(load_entire_aedt_file(output_file)) == repr(project_dict)
+
+    def test_16_update_changed_design_blocks(self):
+        aedt_file = self.local_scratch.copyfile(
+            os.path.join(local_path, "example_models", test_subfolder, "Coax_HFSS_t13_231.aedt")
+        )
+        project_dict, block_hashes = update_aedt_file(aedt_file)
+        assert project_dict == AedtFileParser(aedt_file).load_entire()
+        assert block_hashes
+        with open(aedt_file, "rb") as f:
+            content = f.read()
+        with open(aedt_file, "wb") as f:
+            f.write(content.replace(b"\tNextUniqueID=0", b"\tNextUniqueID=1", 1))
+        updated_dict, updated_hashes = update_aedt_file(aedt_file, block_hashes)
+        assert updated_dict == AedtFileParser(aedt_file).load_entire()
+        assert updated_dict["AnsoftProject"]["NextUniqueID"] == 1
+        # the unchanged design blocks are not decoded again
+        assert updated_dict["AnsoftProject"]["HFSSModel"] is project_dict["AnsoftProject"]["HFSSModel"]
+        assert updated_hashes
@@ -38,6 +38,7 @@ from pyaedt.desktop import exception_to_desktop
 from pyaedt.desktop import get_version_env_variable
 from pyaedt.generic.DataHandlers import variation_string_to_dict
 from pyaedt.generic.LoadAEDTFile import load_entire_aedt_file
+from pyaedt.generic.LoadAEDTFile import update_aedt_file
 from pyaedt.generic.constants import AEDT_UNITS
 from pyaedt.generic.constants import unit_system
 from pyaedt.generic.general_methods import check_and_download_file
@@ -196,8 +197,10 @@ class Design(AedtObjects):
     ):
         def load_aedt_thread(path):
             start = time.time()
-            settings._project_properties[path] = load_entire_aedt_file(path)
-            settings._project_time_stamp = os.path.getmtime(project_name)
+            time_stamp = os.path.getmtime(path)
+            project_properties, block_hashes = update_aedt_file(path)
+            settings._project_properties.set(path, project_properties, time_stamp, block_hashes)
+            settings._project_time_stamp[os.path.normpath(path)] = time_stamp
             pyaedt_logger.info("AEDT file load (threaded) time: {}".format(time.time() - start))
 
         t = None
@@ -522,26 +525,31 @@ class Design(AedtObjects):
             Dictionary of the project properties.
         """
         start = time.time()
-        if self.project_timestamp_changed or (
-            os.path.exists(self.project_file)
-            and os.path.normpath(self.project_file) not in settings._project_properties
-        ):
-            settings._project_properties[os.path.normpath(self.project_file)] = load_entire_aedt_file(self.project_file)
+        project_file = os.path.normpath(self.project_file)
+        project_properties = settings._project_properties.get(project_file)
+        if project_properties is None and os.path.exists(project_file):
+            time_stamp = os.path.getmtime(project_file)
+            # after a save, only the design blocks that changed are decoded again
+            project_properties, block_hashes = update_aedt_file(
+                project_file, settings._project_properties.block_hashes(project_file)
+            )
+            settings._project_properties.set(project_file, project_properties, time_stamp, block_hashes)
             self._logger.info("aedt file load time {}".format(time.time() - start))
         elif (
-            os.path.normpath(self.project_file) not in settings._project_properties
+            project_properties is None
             and settings.remote_rpc_session
             and settings.remote_rpc_session.filemanager.pathexists(self.project_file)
         ):
             local_path = os.path.join(settings.remote_rpc_session_temp_folder, os.path.split(self.project_file)[-1])
             file_path = check_and_download_file(local_path, self.project_file)
             try:
-                settings._project_properties[os.path.normpath(self.project_file)] = load_entire_aedt_file(file_path)
+                project_properties = load_entire_aedt_file(file_path)
+                settings._project_properties.set(project_file, project_properties)
             except:
                 pass
             self._logger.info("aedt file load time {}".format(time.time() - start))
-        if os.path.normpath(self.project_file) in settings._project_properties:
-            return settings._project_properties[os.path.normpath(self.project_file)]
+        if project_properties is not None:
+            return project_properties
         return {}
 
     @property
@@ -556,8 +564,9 @@ class Design(AedtObjects):
         """
 
         try:
-            if model_names[self._design_type] in self.project_properties["AnsoftProject"]:
-                designs = self.project_properties["AnsoftProject"][model_names[self._design_type]]
+            project_properties = self.project_properties
+            if model_names[self._design_type] in project_properties["AnsoftProject"]:
+                designs = project_properties["AnsoftProject"][model_names[self._design_type]]
                 if isinstance(designs, list):
                     for design in designs:
                         if design["Name"] == self.design_name:
@@ -733,16 +742,17 @@ class Design(AedtObjects):
     @property
     def project_time_stamp(self):
         """Return Project time stamp."""
-        if os.path.exists(self.project_file):
-            settings._project_time_stamp = os.path.getmtime(self.project_file)
+        project_file = os.path.normpath(self.project_file)
+        if os.path.exists(project_file):
+            settings._project_time_stamp[project_file] = os.path.getmtime(project_file)
         else:
-            settings._project_time_stamp = 0
-        return settings._project_time_stamp
+            settings._project_time_stamp[project_file] = 0
+        return settings._project_time_stamp[project_file]
 
     @property
     def project_timestamp_changed(self):
         """Return a bool if time stamp changed or not."""
-        old_time = settings._project_time_stamp
+        old_time = settings._project_time_stamp.get(os.path.normpath(self.project_file), 0)
         return old_time != self.project_time_stamp
 
     @property
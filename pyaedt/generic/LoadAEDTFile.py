@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import mmap
 import os.path
+import pickle
 import re
+import threading
 
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import settings
@@ -23,7 +27,16 @@ def load_entire_aedt_file(filename):
         dictionary containing the decoded AEDT file
 
     """
-    return _load_entire_aedt_file(os.path.normpath(filename))
+    filename = os.path.normpath(filename)
+    if settings.enable_aedt_file_cache and os.path.isfile(filename):
+        # the header is taken before parsing, so that a file saved during the parse is not cached as up to date
+        header = _disk_cache_header(filename)
+        main_dict = _load_from_disk_cache(filename, header)
+        if main_dict is None:
+            main_dict = AedtFileParser(filename).load_entire()
+            _save_to_disk_cache(filename, main_dict, header)
+        return main_dict
+    return AedtFileParser(filename).load_entire()
 
 
 def load_keyword_in_aedt_file(filename, keyword):
@@ -42,7 +55,80 @@ def load_keyword_in_aedt_file(filename, keyword):
         dictionary containing the decoded AEDT file
 
     """
-    return _load_keyword_in_aedt_file(filename, keyword)
+    return AedtFileParser(filename).load_keyword(keyword)
+
+
+def update_aedt_file(filename, block_hashes=None):
+    """Load the entire AEDT file, decoding again only the design blocks that changed since the previous load.
+
+    The blocks nested directly in the top-level blocks, like the designs of the project, are
+    identified by a hash of their text. The blocks whose hash is found in ``block_hashes``
+    are not decoded again, and the dictionaries of the previous load are reused instead.
+
+    Parameters
+    ----------
+    filename :
+        AEDT filename with path.
+    block_hashes : dict, optional
+        Hashes of the design blocks returned by the previous call on the same file. The default
+        is ``None``, in which case the entire file is decoded.
+
+    Returns
+    -------
+    tuple
+        Dictionary containing the decoded AEDT file, and the hashes of its design blocks
+        to provide to the next call. When the on-disk cache is enabled and ``block_hashes``
+        is not provided, the file is loaded with ``load_entire_aedt_file`` and no hashes are returned.
+
+    """
+    if settings.enable_aedt_file_cache and not block_hashes:
+        return load_entire_aedt_file(filename), None
+    return _AedtIncrementalLoader(os.path.normpath(filename)).load(block_hashes)
+
+
+def write_aedt_file(filename, data, source_file=None):
+    """Write a dictionary in the AEDT file format.
+
+    The dictionary is usually obtained with ``load_entire_aedt_file`` and then edited.
+    When the source file is provided, the lines of the unchanged keys are copied as they are,
+    and the binary sections are copied byte for byte.
+
+    Parameters
+    ----------
+    filename :
+        AEDT filename with path to write.
+    data : dict
+        Dictionary to write.
+    source_file : str, optional
+        AEDT filename with path that the dictionary was loaded from. The default is ``None``.
+
+    Returns
+    -------
+    bool
+        ``True`` when successful.
+
+    """
+    return AedtFileWriter(data, source_file).write(filename)
+
+
+def clear_aedt_file_cache():
+    """Remove all the entries of the on-disk cache of parsed AEDT files.
+
+    Returns
+    -------
+    bool
+        ``True`` when successful, ``False`` when failed.
+    """
+    folder = _disk_cache_folder()
+    if not folder:
+        return True
+    for entry in os.listdir(folder):
+        if entry.endswith(_disk_cache_extension):
+            try:
+                os.remove(os.path.join(folder, entry))
+            except OSError:  # pragma: no cover
+                return False
+    return True
 
 
 # --------------------------------------------------------------------
@@ -50,16 +136,21 @@ def load_keyword_in_aedt_file(filename, keyword):
 
 
 # precompile all Regular expressions
-_remove_quotes = re.compile(r"^'(.*?)'$")
-_split_list_elements = re.compile(",(?=(?:[^']*'[^']*')*[^']*$)")
-_round_bracket_list = re.compile(r"^(?P<SKEY1>[^\s=]+?)\((?P<LIST1>.+)\)|^'(?P<SKEY2>.+?\s.+)'(?<=')\((?P<LIST2>.+)\)")
-_square_bracket_list = re.compile(
-    r"^(?P<SKEY1>\S+?)\[\d+:(?P<LIST1>.+)\]|^'(?P<SKEY2>.+?\s.+)'(?<=')\[\d+:(?P<LIST2>.+)\]"
-)
-_key_parse = re.compile(r"(^'(?P<KEY1>.+?)')(?<=')=(?P<VAL1>.+$)|(?P<KEY2>^.+?)=(?P<VAL2>.+$)")
-_value_parse1 = re.compile(r"\s")
-_value_parse2 = re.compile(r"^'([^']*\s[^']*)(?=')")
+_whitespace_search = re.compile(r"\s")
+_list_index_match = re.compile(r"\d+:")
+_idmap_subkey = re.compile(r"^\w+IDMap\(.*\)$", re.IGNORECASE)
+_idmap_list = re.compile(r"^(?P<SKEY>[^\s=]+?)\((?P<LIST>.*)\)")
 _begin_search = re.compile(r"\$begin '(.+)'")
+_block_search = re.compile(b"^[ \\t]*\\$(begin|end) '([^\\r\\n]+)'\\r?$", re.MULTILINE)
+_block_end_match = re.compile(b"\\$end '([^\\r\\n]+)'\\r?$", re.MULTILINE)
+_binary_search = re.compile(b"^[ \\t]*BIN(\\d+)(?:\\r\\n|\\n|\\r)", re.MULTILINE)
+_binary_end = b"$end '"
+_binary_line = re.compile(r"^BIN(\d+)$")
+_raw_list_element = re.compile(r"^(?:[\w@.-]+|'[^']*')\s*[=(]|[)\]]$|^'|'$")
+_read_chunk_size = 1 << 24
+_begin_bytes = re.compile(b"\\$begin '")
+_end_bytes = re.compile(b"\\$end '")
+_placeholder_key = "PyaedtBlockPlaceholder"
 
 # set recognized keywords
 _recognized_keywords = [
@@ -73,10 +164,14 @@ _recognized_keywords = [
 ]
 _recognized_subkeys = ["simple(", "IDMap(", "WireSeg(", "PC("]
 
-# global variables
-_all_lines = []
-_len_all_lines = 0
-_count = 0
+# on-disk cache of the parsed files, bump the version when the parser output changes
+_disk_cache_version = 2
+_disk_cache_extension = ".aedtcache"
+
+# block indexes of the files already scanned, keyed by normalized path
+_block_indexes = {}
+_block_indexes_lock = threading.Lock()
+_block_indexes_max_size = 32
 
 
 def _parse_value(v):
@@ -95,9 +190,8 @@ def _parse_value(v):
             try:
                 pv = float(v)
             except ValueError:
-                m = _remove_quotes.search(v)
-                if m:
-                    pv = m.group(1)
+                if len(v) > 1 and v[0] == "'" and v[-1] == "'":
+                    pv = v[1:-1]
                 else:
                     pv = v
     return pv
@@ -115,8 +209,16 @@ def _separate_list_elements(v):
     -------
 
     """
-    if "(" in v or "=" in v:
-        l1 = _split_list_elements.split(v)
+    if ("(" in v or "=" in v) and "'" in v:
+        # split on the commas followed by an even number of quotes, that is not inside quotes
+        l1 = []
+        quotes = v.count("'")
+        for element in v.split(","):
+            if l1 and quotes % 2:
+                l1[-1] += "," + element
+            else:
+                l1.append(element)
+            quotes -= element.count("'")
     else:
         l1 = v.split(",")
     l2 = [_parse_value(i.strip()) for i in l1]
@@ -141,15 +243,15 @@ def _decode_recognized_subkeys(sk, d):
 
     """
     if sk.startswith(_recognized_subkeys[0]):  # 'simple(' is at the beginning of the value
-        m = _round_bracket_list.search(sk)
-        if m and m.group("SKEY1") == "simple":  # extra verification. SKEY2 is with spaces, so it's not considered here.
-            elems = _separate_list_elements(m.group("LIST1"))
+        bounds = _list_bounds(sk, "(", ")", False)
+        if bounds and bounds[0] == "simple":  # extra verification. Keys with spaces are not considered here.
+            elems = _separate_list_elements(sk[bounds[1] : bounds[2]])
             if elems[0] == "thermal_expansion_coeffcient":
                 elems[0] = "thermal_expansion_coefficient"  # fix a typo in the AMAT files. AEDT supports both strings!
             d[elems[0]] = str(elems[1])  # convert to string as it is dedicated to material props
             return True
-    elif re.search(r"^\w+IDMap\(.*\)$", sk, re.IGNORECASE):  # check if the format is AAKeyIDMap('10'=56802, '7'=56803)
-        m = re.search(r"^(?P<SKEY>[^\s=]+?)\((?P<LIST>.*)\)", sk)
+    elif _idmap_subkey.search(sk):  # check if the format is AAKeyIDMap('10'=56802, '7'=56803)
+        m = _idmap_list.search(sk)
         if m and "idmap" in m.group("SKEY").lower():  # extra verification.
             k = m.group("SKEY")
             if m.group("LIST"):
@@ -177,110 +279,64 @@ def _decode_recognized_subkeys(sk, d):
     return False
 
 
-def _decode_recognized_key(keyword, line, d):
-    """Special decodings for keys belonging to _recognized_keywords
+def _list_bounds(line, open_bracket, close_bracket, indexed):
+    """Find the key and the list of a line in the ``key(l1, l2)`` or ``key[n: l1, l2]`` format.
+
+    The key either has no spaces, and no equal sign for round brackets, or it is between quotes.
+    The list ends at the last closing bracket of the line.
 
     Parameters
     ----------
-    keyword : str
-        dictionary key recognized
-
     line : str
-        The line following the recognized key
-
-    d : dict
-        Active dictionary.
+        Line.
+    open_bracket : str
+        Opening bracket, ``"("`` or ``"["``.
+    close_bracket : str
+        Closing bracket, ``")"`` or ``"]"``.
+    indexed : bool
+        Whether the list starts with its number of elements, like in ``[n: l1, l2]``.
 
     Returns
     -------
-    bool
-        Returns ``True`` if it confirms and decodes a recognized key, ``False`` otherwise.
-
+    tuple
+        Key, start and end index of the list, ``None`` if the line is not in this format.
     """
-    global _count
-    if keyword == _recognized_keywords[0]:  # 'CurvesInfo'
-        m = re.search(r"\'(\d+)\'\((.*)\)$", line)
-        if m:
-            k = m.group(1)
-            v = m.group(2)
-            v2 = v.replace("\\'", '"')
-            v3 = _separate_list_elements(v2)
-            d[k] = v3
-        else:  # pragma: no cover
-            return False
-    elif keyword == _recognized_keywords[1]:  # 'Sweep Operations'
-        d["add"] = []
-        line = _all_lines[_count + 1]
-        while line.startswith("add("):
-            d["add"].append(line.replace("add", "").translate({ord(i): None for i in " ()'"}).split(","))
-            _count += 1
-            line = _all_lines[_count + 1]
-    elif keyword == _recognized_keywords[2]:  # PropDisplayMap
-        pattern = ".+\((.+) Text\((.+) ExtentRect\((.+)\)\)\)"
-        match = re.search(pattern, line)
-        d["Name"] = []
-        for i in match.group(1).split(", "):
-            d["Name"].append(_parse_value(i))
-        d["Name"].append("Text:=")
-        temp_list = []
-        for i in match.group(2).split(", "):
-            temp_list.append(_parse_value(i))
-        temp_list.append("ExtentRect:=")
-        temp_list.append([_parse_value(i) for i in match.group(3).split(", ")])
-        d["Name"].append(temp_list)
-    elif keyword in _recognized_keywords[3:6]:  # Cells, Active, Rotation
-        li = _count
-        line_m = _all_lines[li]
-        li += 1
-        line_n = _all_lines[li]
-        if line_m[:2] != "m=" or line_n[:2] != "n=":  # pragma: no cover
-            return False
-        m = int(re.search(r"[m|n]=(\d+)", line_m).group(1))
-        d["rows"] = m
-        n = int(re.search(r"[m|n]=(\d+)", line_n).group(1))
-        d["columns"] = n
-        d["matrix"] = []
-        for i in range(m):
-            li += 1
-            r = re.search(r"\$begin 'r(\d+)'", _all_lines[li])
-            if not r or i != int(r.group(1)):  # pragma: no cover
-                return False  # there should be a row definition
-            d["matrix"].append([])
-            for _ in range(n):
-                li += 1
-                c = re.search(r"c\((.+)\)", _all_lines[li])
-                if not c:  # pragma: no cover
-                    return False  # there should be a column definition
-                if keyword == "Cells":
-                    c = int(c.group(1))
-                elif keyword == "Active":
-                    c = c.group(1).lower() == "true"
-                elif keyword == "Rotation":
-                    c = int(c.group(1)) * 90
-                d["matrix"][i].append(c)
-            li += 1
-            r = re.search(r"\$end 'r(\d+)'", _all_lines[li])
-            if not r or i != int(r.group(1)):  # pragma: no cover
-                return False  # there should be a row definition
-        _count = li
-    elif keyword == _recognized_keywords[6]:  # PostProcessingCells
-        li = _count
-        while _all_lines[li].startswith("OneCell"):
-            m = re.search(r"OneCell\((\d+), '(\d+)', '(\d+)'\)", _all_lines[li])
-            if m:
-                try:
-                    d[int(m.group(1))] = [int(m.group(2)), int(m.group(3))]
-                except ValueError:  # pragma: no cover
-                    continue
-            li += 1
-        _count = li - 1
-    else:  # pragma: no cover
-        raise AttributeError("Keyword {} is supposed to be in the recognized_keywords list".format(keyword))
-    return True
+    last = line.rfind(close_bracket)
+    if last < 2:
+        return None
+    m = _whitespace_search.search(line)
+    first_space = m.start() if m else len(line)
+    # key without spaces
+    bracket = line.find(open_bracket, 1, first_space + 1)
+    while bracket != -1:
+        if not indexed:
+            if line.find("=", 0, bracket) == -1 and last >= bracket + 2:
+                return line[:bracket], bracket + 1, last
+            break
+        m = _list_index_match.match(line, bracket + 1)
+        if m and last > m.end():
+            return line[:bracket], m.end(), last
+        bracket = line.find(open_bracket, bracket + 1, first_space + 1)
+    # key with spaces between quotes
+    if line[0] != "'":
+        return None
+    m = _whitespace_search.search(line, 2)
+    if not m:
+        return None
+    key_start = m.start() + 2
+    bracket = line.rfind("'" + open_bracket, key_start, last - 1)
+    while bracket != -1:
+        if not indexed:
+            return line[1:bracket], bracket + 2, last
+        m = _list_index_match.match(line, bracket + 2)
+        if m and last > m.end():
+            return line[1:bracket], m.end(), last
+        bracket = line.rfind("'" + open_bracket, key_start, bracket)
+    return None
 
 
 def _decode_subkey(line, d):
-    """
+    """Decode a line in a single pass and store the key and value in the active dictionary.
 
     Parameters
     ----------
@@ -293,207 +349,1144 @@ def _decode_subkey(line, d):
     -------
 
     """
-    # send recognized sub-keys to _decode_recognized_subkeys (Case insensitive search, detailed search is inside)
-    for rsk in _recognized_subkeys:
-        if rsk.lower() in line.lower():  # here we simply search if one of the _recognized_subkeys is in line
-            if _decode_recognized_subkeys(line, d):  # the exact search is done inside the _decode_recognized_subkeys
-                return  # if there is a match we stop the _decode_key, otherwise we keep going
-
-    # create a list for subkey(l1, l2, l3)
-    m = _round_bracket_list.search(line)
-    if m and m.group("SKEY1"):
-        v = _separate_list_elements(m.group("LIST1"))
-        k = m.group("SKEY1")
-        d[k] = v
-        return  # if there is a match we stop the _decode_key, otherwise we keep going
-    elif m and m.group("SKEY2"):
-        v = _separate_list_elements(m.group("LIST2"))
-        k = m.group("SKEY2")
-        d[k] = v
-        return  # if there is a match we stop the _decode_key, otherwise we keep going
+    round_bracket = line.find("(")
+    if round_bracket != -1:
+        # send recognized sub-keys to _decode_recognized_subkeys (detailed search is inside)
+        if (
+            line.startswith(("simple(", "WireSeg(", "PC("))
+            or line[round_bracket - 5 : round_bracket].lower() == "idmap"
+        ) and _decode_recognized_subkeys(line, d):
+            return
+        # create a list for subkey(l1, l2, l3)
+        bounds = _list_bounds(line, "(", ")", False)
+        if bounds:
+            d[bounds[0]] = _separate_list_elements(line[bounds[1] : bounds[2]])
+            return
 
     # create a list for subkey[n: 1, 2, ...n]
-    m = _square_bracket_list.search(line)
-    if m and m.group("SKEY1"):
-        v = _separate_list_elements(m.group("LIST1"))
-        k = m.group("SKEY1")
-        d[k] = v
-        return  # if there is a match we stop the _decode_key, otherwise we keep going
-    elif m and m.group("SKEY2"):
-        v = _separate_list_elements(m.group("LIST2"))
-        k = m.group("SKEY2")
-        d[k] = v
-        return  # if there is a match we stop the _decode_key, otherwise we keep going
-
-    # search for equal sign
-    m = _key_parse.search(line)
-    if m and m.group("KEY1"):  # key btw ''
-        v = m.group("VAL1")
-        if "\\'" in v:
-            v2 = v.replace("\\'", '"')
-        else:
-            v2 = v
+    if "[" in line:
+        bounds = _list_bounds(line, "[", "]", True)
+        if bounds:
+            d[bounds[0]] = _separate_list_elements(line[bounds[1] : bounds[2]])
+            return
+
+    # search for equal sign, the key is either between quotes or before the first equal sign
+    k = None
+    if line[:1] == "'":
+        equal = line.find("'=", 2)
+        if equal != -1 and equal + 2 < len(line):
+            k, v = line[1:equal], line[equal + 2 :]
+    if k is None:
+        equal = line.find("=", 1)
+        if equal != -1 and equal + 1 < len(line):
+            k, v = line[:equal], line[equal + 1 :]
+    if k is not None:
+        v2 = v.replace("\\'", '"') if "\\'" in v else v
         # if there are no spaces in value   or   values with spaces are between quotes
-        if not _value_parse1.search(v2) or _value_parse2.search(v2):
-            k = m.group("KEY1")
-            d[k] = _parse_value(v)
-        else:  # spaces in value without quotes
-            k = line  # save the line as a whole
-            d[k] = None
-    elif m and m.group("KEY2"):  # key without ''
-        v = m.group("VAL2")
-        if "\\'" in v:
-            v2 = v.replace("\\'", '"')
-        else:
-            v2 = v
-        # if there are no spaces in value   or   values with spaces are between quotes
-        if not _value_parse1.search(v2) or _value_parse2.search(v2):
-            k = m.group("KEY2")
-            d[k] = _parse_value(v)
-        else:  # spaces in value without quotes
-            k = line  # save the line as a whole
-            d[k] = None
+        if _whitespace_search.search(v2):
+            quote = v2.find("'", 1) if v2[0] == "'" else -1
+            if quote == -1 or not _whitespace_search.search(v2, 1, quote):
+                k = line  # spaces in value without quotes, save the line as a whole
+                v = None
+        d[k] = _parse_value(v)
     else:  # no = sign found
-        k = line  # save the line as a whole
-        d[k] = None
+        d[line] = None
 
 
-def _walk_through_structure(keyword, save_dict):
-    """
+def _file_hash(filename):
+    """Compute the SHA-1 hash of the content of a file."""
+    sha = hashlib.sha1()
+    with open(filename, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _disk_cache_header(filename):
+    """Build the header identifying the parsed content of a file in the on-disk cache."""
+    stat = os.stat(filename)
+    return {
+        "version": _disk_cache_version,
+        "path": filename,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "hash": _file_hash(filename) if settings.aedt_file_cache_use_hash else None,
+        "project_preview": bool(settings.aedt_version and settings.aedt_version > "2022.2"),
+    }
+
+
+def _disk_cache_entry(filename):
+    """Get the path of the on-disk cache entry of a file."""
+    key = hashlib.sha1(filename.encode("utf-8")).hexdigest()
+    return os.path.join(settings.aedt_file_cache_path, key + _disk_cache_extension)
+
+
+def _is_owned(path):
+    """Check if a path belongs to the current user."""
+    if not hasattr(os, "getuid"):
+        # on Windows the temp directory is specific to the user
+        return True
+    try:
+        return os.stat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _disk_cache_folder(create=False):
+    """Get the folder of the on-disk cache when it belongs to the current user.
+
+    The cache entries are unpickled, so a folder created by another user, for example in a shared
+    temp directory, is never used.
 
     Parameters
     ----------
-    keyword :
+    create : bool, optional
+        Whether to create the folder, with access restricted to the current user, when it does not exist.
+        The default is ``False``.
+
+    Returns
+    -------
+    str or None
+        Folder of the on-disk cache, ``None`` if it does not exist or belongs to another user.
+    """
+    folder = settings.aedt_file_cache_path
+    if create and not os.path.isdir(folder):
+        try:
+            os.makedirs(folder, 0o700)
+        except OSError:
+            settings.logger.debug("Failed to create the AEDT file cache folder {}.".format(folder))
+    if not os.path.isdir(folder):
+        return None
+    if not _is_owned(folder):
+        settings.logger.debug("The AEDT file cache folder {} belongs to another user.".format(folder))
+        return None
+    return folder
 
-    save_dict :
 
+def _load_from_disk_cache(filename, header):
+    """Load the dictionary of a parsed file from the on-disk cache.
+
+    Parameters
+    ----------
+    filename : str
+        Normalized AEDT filename with path.
+    header : dict
+        Current header of the file, from ``_disk_cache_header``.
 
     Returns
     -------
-
+    dict or None
+        Dictionary containing the decoded AEDT file, ``None`` if the entry is missing or stale.
     """
-    global _count
-    begin_key = "$begin '{}'".format(keyword)
-    end_key = "$end '{}'".format(keyword)
-    found = False
-    saved_value = None
-    while _count < _len_all_lines:
-        line = _all_lines[_count]
-        # begin_key is found
-        if begin_key == line:
-            found = True
-            saved_value = save_dict.get(keyword)  # if the keyword is already present, save it
-            save_dict[keyword] = {}
-            _count += 1
-            continue
-        # end_key is found
-        if end_key == line:
-            break
-        # between begin_key and end_key
-        if found:
-            b = _begin_search.search(line)
-            if b:  # walk down a level
-                nextlvl_begin_key = b.group(1)
-                _walk_through_structure(nextlvl_begin_key, save_dict[keyword])
-            elif keyword in _recognized_keywords:
-                confirmed = _decode_recognized_key(keyword, line, save_dict[keyword])
-                if not confirmed:  # pragma: no cover
-                    # decode the line normally, since recognized key is not successful
-                    _decode_subkey(line, save_dict[keyword])
-            else:  # decode key
-                _decode_subkey(line, save_dict[keyword])
-        _count += 1
-    # recompose value if list
-    if saved_value:
-        # makes the value a list, if it's not already
-        if type(saved_value) is not list:
-            saved_value = [saved_value]
-        saved_value.append(save_dict[keyword])
-        save_dict[keyword] = saved_value
-    return _count
-
-
-def _read_aedt_file(filename):
-    """Read the entire AEDT file discard binary and put ascii line in a list
+    entry = _disk_cache_entry(filename)
+    if not os.path.isfile(filename) or not _disk_cache_folder() or not os.path.isfile(entry):
+        return None
+    if not _is_owned(entry):
+        settings.logger.debug("The AEDT file cache entry {} belongs to another user.".format(entry))
+        return None
+    try:
+        with open(entry, "rb") as fh:
+            # the header is stored first, so a stale entry is detected without loading the data
+            if pickle.load(fh) != header:
+                return None
+            main_dict = pickle.load(fh)
+        # the modification time of the entry is used for the LRU eviction
+        os.utime(entry, None)
+    except Exception:
+        settings.logger.debug("Failed to read the AEDT file cache entry {}.".format(entry))
+        return None
+    return main_dict
+
+
+def _save_to_disk_cache(filename, main_dict, header):
+    """Save the dictionary of a parsed file in the on-disk cache and evict the oldest entries.
 
     Parameters
     ----------
-    filename :
-        AEDT filename with path
+    filename : str
+        Normalized AEDT filename with path.
+    main_dict : dict
+        Dictionary containing the decoded AEDT file.
+    header : dict
+        Header of the file taken before it was parsed, from ``_disk_cache_header``.
 
     Returns
     -------
+    bool
+        ``True`` when successful, ``False`` when failed.
+    """
+    if not os.path.isfile(filename) or not _disk_cache_folder(create=True):
+        return False
+    entry = _disk_cache_entry(filename)
+    temp_entry = "{}.{}.{}.tmp".format(entry, os.getpid(), threading.current_thread().ident)
+    try:
+        with open(temp_entry, "wb") as fh:
+            pickle.dump(header, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(main_dict, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        if os.path.exists(entry):
+            os.remove(entry)
+        os.rename(temp_entry, entry)
+    except Exception:
+        settings.logger.debug("Failed to write the AEDT file cache entry {}.".format(entry))
+        if os.path.exists(temp_entry):
+            os.remove(temp_entry)
+        return False
+    _evict_disk_cache()
+    return True
+
+
+def _evict_disk_cache():
+    """Remove the least recently used entries until the on-disk cache fits in its maximum size."""
+    folder = settings.aedt_file_cache_path
+    entries = []
+    for entry in os.listdir(folder):
+        if entry.endswith(_disk_cache_extension):
+            try:
+                stat = os.stat(os.path.join(folder, entry))
+            except OSError:  # pragma: no cover
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+    total_size = sum(i[1] for i in entries)
+    max_size = settings.aedt_file_cache_size * 1024 * 1024
+    for _, size, entry in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(os.path.join(folder, entry))
+            total_size -= size
+        except OSError:  # pragma: no cover
+            continue
+
+
+def _iter_text_ranges(content, start=0, end=None):
+    """Yield the byte ranges of the text sections of an AEDT file, skipping the binary payloads.
+
+    A binary payload follows a ``BINnnnnnnnnnnnn`` line giving its size in bytes, and is immediately
+    followed by the ``$end`` line of its block.
+
+    Parameters
+    ----------
+    content : bytes or mmap.mmap
+        Raw content of the file.
+    start : int, optional
+        Start byte offset. The default is ``0``.
+    end : int, optional
+        End byte offset. The default is ``None``, in which case the content is read until its end.
+
+    Yields
+    ------
+    tuple
+        Start and end byte offsets of the text section.
+    """
+    if end is None:
+        end = len(content)
+    pos = search_pos = start
+    while search_pos < end:
+        m = _binary_search.search(content, search_pos, end)
+        if not m:
+            break
+        payload_end = m.end() + int(m.group(1))
+        if content[payload_end : payload_end + len(_binary_end)] == _binary_end:
+            yield pos, m.end()
+            pos = search_pos = payload_end
+        else:  # pragma: no cover
+            search_pos = m.end()
+    if pos < end:
+        yield pos, end
+
+
+def _iter_raw_lines(content, start=0, end=None):
+    """Yield the raw lines of the text sections of an AEDT file, reading them in chunks."""
+    for range_start, range_end in _iter_text_ranges(content, start, end):
+        pos = range_start
+        while pos < range_end:
+            chunk_end = min(pos + _read_chunk_size, range_end)
+            if chunk_end < range_end:
+                # split the chunks on a line break
+                line_end = content.rfind(b"\n", pos, chunk_end)
+                if line_end < pos:
+                    line_end = content.find(b"\n", chunk_end, range_end)
+                chunk_end = line_end + 1 if line_end >= 0 else range_end
+            for raw_line in content[pos:chunk_end].splitlines():
+                yield raw_line
+            pos = chunk_end
+
+
+def _iter_aedt_lines(content, start=0, end=None):
+    """Yield the decoded text lines of an AEDT file.
+
+    The lines are stripped of their indentation, and the lines ending with ``\\`` are combined
+    with the following line. The lines that cannot be decoded are discarded.
 
+    Parameters
+    ----------
+    content : bytes or mmap.mmap
+        Raw content of the file.
+    start : int, optional
+        Start byte offset. The default is ``0``.
+    end : int, optional
+        End byte offset. The default is ``None``, in which case the content is read until its end.
+
+    Yields
+    ------
+    str
+        Decoded line.
     """
-    global _all_lines
-    global _len_all_lines
-    global _count
-
-    # read the AEDT file
-    with open_file(filename, "rb") as aedt_fh:
-        raw_lines = aedt_fh.read().splitlines()
-    ascii_lines = []
-    for raw_line in raw_lines:
+    continued = None
+    previous = None
+    for raw_line in _iter_raw_lines(content, start, end):
         try:
-            ascii_lines.append(raw_line.decode("utf-8").lstrip(" \t"))
+            line = raw_line.decode("utf-8").lstrip(" \t")
         except UnicodeDecodeError:
             continue
-    ascii_content = "\n".join(ascii_lines)
-    # combine subsequent lines when the line ends in \
-    _all_lines = ascii_content.replace("\\\n", "").splitlines()
-    _len_all_lines = len(_all_lines)
-    _count = 0
+        # combine subsequent lines when the line ends in \
+        if line.endswith("\\"):
+            continued = (continued or "") + line[:-1]
+            continue
+        if continued is not None:
+            line = continued + line
+            continued = None
+        if previous is not None:
+            for i in (previous + "\n").splitlines():
+                yield i
+        previous = line
+    if continued is not None:
+        previous = (previous + "\n" if previous is not None else "") + continued + "\\"
+    if previous is not None:
+        for i in previous.splitlines():
+            yield i
+
+
+class AedtBlockIndex(object):
+    """Byte-offset index of the top-level and second-level blocks of an AEDT file.
+
+    The file is scanned once for ``$begin '...'`` and ``$end '...'`` lines, without
+    decoding it. Only the first occurrence of each block name is indexed, and only
+    if it is a top-level or a second-level block.
 
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    """
 
-def _load_entire_aedt_file(filename):
-    """Load the entire AEDT file and return the dictionary
+    def __init__(self, filename):
+        self.filename = filename
+        stat = os.stat(filename)
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.blocks = {}
+        self._scan()
+
+    def _scan(self):
+        """Scan the file and store the byte range of the indexed blocks."""
+        if not self.size:
+            return
+        seen = set()
+        stack = []
+        with open(self.filename, "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for kind, name, line_start, line_end in self._iter_block_lines(mm):
+                    if kind == b"begin":
+                        depth = len(stack)
+                        if name not in seen:
+                            seen.add(name)
+                            if depth < 2:
+                                self.blocks[name] = [line_start, self.size]
+                        stack.append((name, depth, line_start))
+                    elif stack and stack[-1][0] == name:
+                        begin_name, depth, start = stack.pop()
+                        if self.blocks.get(begin_name, [None])[0] == start:
+                            self.blocks[begin_name][1] = line_end
+                    elif any(i[0] == name for i in stack):
+                        # an end line is hidden in binary content: the blocks still open are not indexed,
+                        # because the line parser would not stop at their end line either
+                        for begin_name, depth, start in stack:
+                            if self.blocks.get(begin_name, [None])[0] == start:
+                                del self.blocks[begin_name]
+                        while stack.pop()[0] != name:
+                            pass
+            finally:
+                mm.close()
+        for begin_name, depth, start in stack:
+            if self.blocks.get(begin_name, [None])[0] == start:
+                del self.blocks[begin_name]
+
+    @staticmethod
+    def _iter_block_lines(content):
+        """Yield the kind, name and byte range of the ``$begin`` and ``$end`` lines."""
+        for range_start, range_end in _iter_text_ranges(content):
+            if range_start:
+                # the end line of a binary payload does not start on a new line
+                m = _block_end_match.match(content, range_start, range_end)
+                if m:
+                    yield b"end", m.group(1).decode("utf-8", errors="replace"), m.start(), m.end()
+                    range_start = m.end()
+            for m in _block_search.finditer(content, range_start, range_end):
+                yield m.group(1), m.group(2).decode("utf-8", errors="replace"), m.start(), m.end()
+
+    def is_valid(self):
+        """Check if the index still matches the file on disk.
+
+        Returns
+        -------
+        bool
+            ``True`` when the file size and modification time are unchanged, ``False`` otherwise.
+        """
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    def read_block(self, keyword):
+        """Read the raw bytes of an indexed block.
+
+        Parameters
+        ----------
+        keyword : str
+            Block name.
+
+        Returns
+        -------
+        bytes or None
+            Raw content of the block, ``None`` if the block is not indexed.
+        """
+        if keyword not in self.blocks:
+            return None
+        start, end = self.blocks[keyword]
+        with open(self.filename, "rb") as fh:
+            fh.seek(start)
+            return fh.read(end - start)
+
+
+def get_block_index(filename):
+    """Get the block index of an AEDT file, scanning the file only if needed.
 
     Parameters
     ----------
-    filename :
-        AEDT filename with path
+    filename : str
+        AEDT filename with path.
 
     Returns
     -------
-    type
-        dictionary containing the decoded AEDT file
+    :class:`pyaedt.generic.LoadAEDTFile.AedtBlockIndex` or None
+        Block index, ``None`` if the file is not available locally.
+    """
+    filename = os.path.normpath(filename)
+    if not os.path.isfile(filename):
+        return None
+    with _block_indexes_lock:
+        index = _block_indexes.get(filename)
+    if index and index.is_valid():
+        return index
+    index = AedtBlockIndex(filename)
+    with _block_indexes_lock:
+        _block_indexes.pop(filename, None)
+        while len(_block_indexes) >= _block_indexes_max_size:
+            del _block_indexes[next(iter(_block_indexes))]
+        _block_indexes[filename] = index
+    return index
+
+
+class AedtFileParser(object):
+    """Parser for AEDT files.
+
+    Each instance owns its own line buffer and cursor, so several files can be
+    parsed concurrently from different threads or processes.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
 
+    Examples
+    --------
+    >>> from pyaedt.generic.LoadAEDTFile import AedtFileParser
+    >>> project_dict = AedtFileParser("C:\\Temp\\project.aedt").load_entire()
     """
-    global _count
-    _read_aedt_file(filename)
-    main_dict = {}
-    # load the aedt file
-    while _count < _len_all_lines:
-        line = _all_lines[_count]
-        m = _begin_search.search(line)
-        if m:
-            _walk_through_structure(m.group(1), main_dict)
-        _count += 1
-    if settings.aedt_version and settings.aedt_version > "2022.2":
-        project_preview = load_keyword_in_aedt_file(filename, "ProjectPreview")
-        if project_preview and "ProjectPreview" in project_preview:
-            main_dict["ProjectPreview"] = project_preview["ProjectPreview"]
-    return main_dict
 
+    def __init__(self, filename):
+        self.filename = filename
+        self._all_lines = []
+        self._len_all_lines = 0
+        self._count = 0
+        # line range of each decoded block, keyed by the id of its dictionary, only recorded when not None
+        self._block_spans = None
+
+    def read(self):
+        """Read the entire AEDT file, skip the binary content and store the text lines.
+
+        The file is memory-mapped, so only its text lines are held in memory.
+        """
+        # read the AEDT file
+        with open_file(self.filename, "rb") as aedt_fh:
+            if os.fstat(aedt_fh.fileno()).st_size:
+                mm = mmap.mmap(aedt_fh.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    self._all_lines = list(_iter_aedt_lines(mm))
+                finally:
+                    mm.close()
+            else:
+                self._all_lines = []
+        self._len_all_lines = len(self._all_lines)
+        self._count = 0
+
+    def _set_content(self, content):
+        """Skip the binary content and store the text lines.
+
+        Parameters
+        ----------
+        content : bytes
+            Raw content of the file or of one of its blocks.
+        """
+        self._all_lines = list(_iter_aedt_lines(content))
+        self._len_all_lines = len(self._all_lines)
+        self._count = 0
+
+    def load_entire(self):
+        """Load the entire AEDT file and return the dictionary.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the decoded AEDT file.
+        """
+        self.read()
+        return self._load_lines()
+
+    def _load_lines(self):
+        """Decode the stored lines and return the dictionary."""
+        main_dict = {}
+        # load the aedt file
+        while self._count < self._len_all_lines:
+            line = self._all_lines[self._count]
+            m = _begin_search.search(line)
+            if m:
+                self._walk_through_structure(m.group(1), main_dict)
+            self._count += 1
+        if settings.aedt_version and settings.aedt_version > "2022.2":
+            # the lines are already in memory, walk them again instead of reading the file twice
+            project_preview = {}
+            self._count = 0
+            self._walk_through_structure("ProjectPreview", project_preview)
+            if project_preview and "ProjectPreview" in project_preview:
+                main_dict["ProjectPreview"] = project_preview["ProjectPreview"]
+        return main_dict
+
+    def load_keyword(self, keyword):
+        """Load a specific keyword in the AEDT file and return the dictionary.
+
+        When the keyword is a top-level or second-level block, only its byte range
+        is read and decoded, using the block index of the file.
+
+        Parameters
+        ----------
+        keyword : str
+            Keyword to search and load.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the decoded keyword.
+        """
+        index = get_block_index(self.filename)
+        content = index.read_block(keyword) if index else None
+        if content is not None:
+            self._set_content(content)
+        else:
+            self.read()
+        # load the aedt file
+        main_dict = {}
+        self._walk_through_structure(keyword, main_dict)
+        return main_dict
+
+    def load_block(self, keyword, start, end):
+        """Load a block from its byte range in the AEDT file and return the dictionary.
+
+        Parameters
+        ----------
+        keyword : str
+            Block name.
+        start : int
+            Byte offset of the ``$begin`` line of the block.
+        end : int
+            Byte offset of the end of the ``$end`` line of the block.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the decoded block.
+        """
+        with open_file(self.filename, "rb") as aedt_fh:
+            aedt_fh.seek(start)
+            self._set_content(aedt_fh.read(end - start))
+        main_dict = {}
+        self._walk_through_structure(keyword, main_dict)
+        return main_dict
+
+    def _walk_through_structure(self, keyword, save_dict):
+        """
+
+        Parameters
+        ----------
+        keyword :
+
+        save_dict :
+
+
+        Returns
+        -------
+
+        """
+        begin_key = "$begin '{}'".format(keyword)
+        end_key = "$end '{}'".format(keyword)
+        found = False
+        saved_value = None
+        while self._count < self._len_all_lines:
+            line = self._all_lines[self._count]
+            # begin_key is found
+            if begin_key == line:
+                found = True
+                begin_count = self._count
+                saved_value = save_dict.get(keyword)  # if the keyword is already present, save it
+                save_dict[keyword] = {}
+                self._count += 1
+                continue
+            # end_key is found
+            if end_key == line:
+                break
+            # between begin_key and end_key
+            if found:
+                b = _begin_search.search(line)
+                if b:  # walk down a level
+                    nextlvl_begin_key = b.group(1)
+                    self._walk_through_structure(nextlvl_begin_key, save_dict[keyword])
+                elif keyword in _recognized_keywords:
+                    confirmed = self._decode_recognized_key(keyword, line, save_dict[keyword])
+                    if not confirmed:  # pragma: no cover
+                        # decode the line normally, since recognized key is not successful
+                        _decode_subkey(line, save_dict[keyword])
+                else:  # decode key
+                    _decode_subkey(line, save_dict[keyword])
+            self._count += 1
+        if found and self._block_spans is not None:
+            self._block_spans[id(save_dict[keyword])] = (begin_count, self._count)
+        # recompose value if list
+        if saved_value:
+            # makes the value a list, if it's not already
+            if type(saved_value) is not list:
+                saved_value = [saved_value]
+            saved_value.append(save_dict[keyword])
+            save_dict[keyword] = saved_value
+        return self._count
+
+    def _decode_recognized_key(self, keyword, line, d):
+        """Special decodings for keys belonging to _recognized_keywords
+
+        Parameters
+        ----------
+        keyword : str
+            dictionary key recognized
+
+        line : str
+            The line following the recognized key
+
+        d : dict
+            Active dictionary.
+
+        Returns
+        -------
+        bool
+            Returns ``True`` if it confirms and decodes a recognized key, ``False`` otherwise.
+
+        """
+        if keyword == _recognized_keywords[0]:  # 'CurvesInfo'
+            m = re.search(r"\'(\d+)\'\((.*)\)$", line)
+            if m:
+                k = m.group(1)
+                v = m.group(2)
+                v2 = v.replace("\\'", '"')
+                v3 = _separate_list_elements(v2)
+                d[k] = v3
+            else:  # pragma: no cover
+                return False
+        elif keyword == _recognized_keywords[1]:  # 'Sweep Operations'
+            d["add"] = []
+            line = self._all_lines[self._count + 1]
+            while line.startswith("add("):
+                d["add"].append(line.replace("add", "").translate({ord(i): None for i in " ()'"}).split(","))
+                self._count += 1
+                line = self._all_lines[self._count + 1]
+        elif keyword == _recognized_keywords[2]:  # PropDisplayMap
+            pattern = ".+\((.+) Text\((.+) ExtentRect\((.+)\)\)\)"
+            match = re.search(pattern, line)
+            d["Name"] = []
+            for i in match.group(1).split(", "):
+                d["Name"].append(_parse_value(i))
+            d["Name"].append("Text:=")
+            temp_list = []
+            for i in match.group(2).split(", "):
+                temp_list.append(_parse_value(i))
+            temp_list.append("ExtentRect:=")
+            temp_list.append([_parse_value(i) for i in match.group(3).split(", ")])
+            d["Name"].append(temp_list)
+        elif keyword in _recognized_keywords[3:6]:  # Cells, Active, Rotation
+            li = self._count
+            line_m = self._all_lines[li]
+            li += 1
+            line_n = self._all_lines[li]
+            if line_m[:2] != "m=" or line_n[:2] != "n=":  # pragma: no cover
+                return False
+            m = int(re.search(r"[m|n]=(\d+)", line_m).group(1))
+            d["rows"] = m
+            n = int(re.search(r"[m|n]=(\d+)", line_n).group(1))
+            d["columns"] = n
+            d["matrix"] = []
+            for i in range(m):
+                li += 1
+                r = re.search(r"\$begin 'r(\d+)'", self._all_lines[li])
+                if not r or i != int(r.group(1)):  # pragma: no cover
+                    return False  # there should be a row definition
+                d["matrix"].append([])
+                for _ in range(n):
+                    li += 1
+                    c = re.search(r"c\((.+)\)", self._all_lines[li])
+                    if not c:  # pragma: no cover
+                        return False  # there should be a column definition
+                    if keyword == "Cells":
+                        c = int(c.group(1))
+                    elif keyword == "Active":
+                        c = c.group(1).lower() == "true"
+                    elif keyword == "Rotation":
+                        c = int(c.group(1)) * 90
+                    d["matrix"][i].append(c)
+                li += 1
+                r = re.search(r"\$end 'r(\d+)'", self._all_lines[li])
+                if not r or i != int(r.group(1)):  # pragma: no cover
+                    return False  # there should be a row definition
+            self._count = li
+        elif keyword == _recognized_keywords[6]:  # PostProcessingCells
+            li = self._count
+            while self._all_lines[li].startswith("OneCell"):
+                m = re.search(r"OneCell\((\d+), '(\d+)', '(\d+)'\)", self._all_lines[li])
+                if m:
+                    try:
+                        d[int(m.group(1))] = [int(m.group(2)), int(m.group(3))]
+                    except ValueError:  # pragma: no cover
+                        continue
+                li += 1
+            self._count = li - 1
+        else:  # pragma: no cover
+            raise AttributeError("Keyword {} is supposed to be in the recognized_keywords list".format(keyword))
+        return True
 
-def _load_keyword_in_aedt_file(filename, keyword):
-    """Load a specific keyword in the AEDT file and return the dictionary
+
+class _AedtIncrementalLoader(object):
+    """Loader of AEDT files that reuses the design blocks decoded by a previous load.
 
     Parameters
     ----------
-    filename :
-        AEDT filename with path
-    keyword :
-        keyword to search and load
+    filename : str
+        Normalized AEDT filename with path.
+    """
 
-    Returns
-    -------
-    type
-        dictionary containing the decoded AEDT file
+    def __init__(self, filename):
+        self.filename = filename
+        self.decoded_blocks = 0
+        self.reused_blocks = 0
+
+    @staticmethod
+    def _scan_blocks(content):
+        """Get the name and byte range of the blocks nested directly in the top-level blocks.
+
+        Returns
+        -------
+        list or None
+            List of the name of the top-level block, the name of the block and its byte range,
+            ``None`` if the blocks cannot be delimited like the parser does.
+        """
+        blocks = []
+        stack = []
+        skipped = set()
+        begin_lines = end_lines = 0
+        for kind, name, line_start, line_end in AedtBlockIndex._iter_block_lines(content):
+            if kind == b"begin":
+                begin_lines += 1
+                stack.append((name, line_start))
+                continue
+            end_lines += 1
+            if stack and stack[-1][0] == name:
+                begin_name, start = stack.pop()
+                if len(stack) == 1:
+                    blocks.append((stack[0][0], name, start, line_end))
+            elif stack:
+                # an end line is hidden in binary content or a binary size is wrong,
+                # the blocks of this top-level block are not reused
+                skipped.add(stack[0][0])
+                if any(i[0] == name for i in stack):
+                    while stack.pop()[0] != name:
+                        pass
+            else:
+                return None
+        if stack:
+            return None
+        # the parser also finds blocks in the lines that do not start with $begin or $end
+        for start, end in _iter_text_ranges(content):
+            begin_lines -= len(_begin_bytes.findall(content, start, end))
+            end_lines -= len(_end_bytes.findall(content, start, end))
+        if begin_lines or end_lines:
+            return None
+        return [i for i in blocks if i[0] not in skipped]
+
+    @staticmethod
+    def _hash_block(content, start, end):
+        """Hash the text of a block. The binary payloads are not decoded, so they are skipped."""
+        sha = hashlib.sha1()
+        for range_start, range_end in _iter_text_ranges(content, start, end):
+            sha.update(content[range_start:range_end])
+        return sha.hexdigest()
+
+    @staticmethod
+    def _block_slots(main_dict, blocks):
+        """Get the container and the key or index holding the dictionary of each block.
+
+        The blocks are matched with the dictionaries by name and order. The blocks that cannot be
+        matched, for example because an empty block is dropped from a list, are set to ``None``.
+        """
+        slots = [None] * len(blocks)
+        positions = {}
+        for i, (top_name, name, _, _) in enumerate(blocks):
+            positions.setdefault((top_name, name), []).append(i)
+        for (top_name, name), indexes in positions.items():
+            top = main_dict.get(top_name)
+            if not isinstance(top, dict) or name not in top:
+                continue
+            value = top[name]
+            if isinstance(value, dict) and len(indexes) == 1:
+                slots[indexes[0]] = (top, name)
+            elif isinstance(value, list) and len(value) == len(indexes) and all(isinstance(v, dict) for v in value):
+                for j, i in enumerate(indexes):
+                    slots[i] = (value, j)
+        return slots
+
+    def load(self, block_hashes=None):
+        """Load the entire file.
+
+        Parameters
+        ----------
+        block_hashes : dict, optional
+            Hashes of the design blocks returned by the previous load. The default is ``None``.
+
+        Returns
+        -------
+        tuple
+            Dictionary containing the decoded AEDT file and hashes of its design blocks.
+        """
+        with open_file(self.filename, "rb") as aedt_fh:
+            if not os.fstat(aedt_fh.fileno()).st_size:
+                return {}, {}
+            mm = mmap.mmap(aedt_fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                blocks = self._scan_blocks(mm)
+                if blocks is None:
+                    parser = AedtFileParser(self.filename)
+                    parser._set_content(mm)
+                    return parser._load_lines(), {}
+                hashes = [self._hash_block(mm, start, end) for _, _, start, end in blocks]
+                # replace the unchanged blocks with a placeholder, so that they are not decoded
+                available = {}
+                if block_hashes:
+                    available = dict((k, list(v)) for k, v in block_hashes.items())
+                reused = {}
+                chunks = []
+                pos = 0
+                for i, (_, name, start, end) in enumerate(blocks):
+                    if available.get(hashes[i]):
+                        reused[i] = available[hashes[i]].pop(0)
+                        chunks.append(mm[pos:start])
+                        chunks.append(
+                            "$begin '{0}'\n{1}={2}\n$end '{0}'".format(name, _placeholder_key, i).encode("utf-8")
+                        )
+                        pos = end
+                chunks.append(mm[pos:])
+                content = b"".join(chunks) if reused else mm
+                parser = AedtFileParser(self.filename)
+                parser._set_content(content)
+                del chunks, content
+            finally:
+                mm.close()
+        main_dict = parser._load_lines()
+        slots = self._block_slots(main_dict, blocks)
+        for i, reused_block in reused.items():
+            if slots[i] is None or slots[i][0][slots[i][1]] != {_placeholder_key: i}:  # pragma: no cover
+                # the placeholder is not where it is expected, decode the entire file
+                return self.load()
+            slots[i][0][slots[i][1]] = reused_block
+        self.reused_blocks = len(reused)
+        self.decoded_blocks = len(blocks) - len(reused)
+        new_hashes = {}
+        for i, slot in enumerate(slots):
+            # empty blocks are decoded again, as they are dropped when their key is repeated
+            if slot is not None and slot[0][slot[1]]:
+                new_hashes.setdefault(hashes[i], []).append(slot[0][slot[1]])
+        return main_dict, new_hashes
+
+
+class AedtFileWriter(object):
+    """Writer of dictionaries in the AEDT file format.
+
+    Keys are written in the order of the dictionary. Blocks are indented with tabs, like AEDT does.
+    When the source file is provided, the lines of the keys whose value is unchanged are copied from
+    it, which also keeps the entries that the parser does not decode, and the binary sections are
+    copied byte for byte. The other values are formatted from their type.
 
+    Parameters
+    ----------
+    data : dict
+        Dictionary to write, as returned by ``load_entire_aedt_file``.
+    source_file : str, optional
+        AEDT filename with path that the dictionary was loaded from. The default is ``None``.
+
+    Examples
+    --------
+    >>> from pyaedt.generic.LoadAEDTFile import AedtFileWriter, load_entire_aedt_file
+    >>> project_dict = load_entire_aedt_file("C:\\Temp\\project.aedt")
+    >>> project_dict["AnsoftProject"]["Desktop"]["Version"] = [2023, 2]
+    >>> AedtFileWriter(project_dict, "C:\\Temp\\project.aedt").write("C:\\Temp\\project_edited.aedt")
     """
-    _read_aedt_file(filename)
-    # load the aedt file
-    main_dict = {}
-    _walk_through_structure(keyword, main_dict)
-    return main_dict
+
+    def __init__(self, data, source_file=None):
+        self.data = data
+        self.source_file = source_file
+        self._source = {}
+        self._source_lines = []
+        self._block_spans = {}
+        self._payloads = {}
+        self._fh = None
+        self._source_fh = None
+        self._after_payload = False
+
+    def write(self, filename):
+        """Write the dictionary to a file.
+
+        Parameters
+        ----------
+        filename : str
+            AEDT filename with path.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+        """
+        if self.source_file:
+            self._load_source()
+        with open(filename, "wb") as self._fh:
+            if self._payloads:
+                self._source_fh = open(self.source_file, "rb")
+            try:
+                self._write_block_content(self.data, self._source, 0)
+            finally:
+                if self._source_fh:
+                    self._source_fh.close()
+                    self._source_fh = None
+        self._fh = None
+        return True
+
+    def _load_source(self):
+        """Parse the source file and locate its lines and binary payloads."""
+        parser = AedtFileParser(os.path.normpath(self.source_file))
+        parser._block_spans = self._block_spans
+        self._source = parser.load_entire()
+        self._source_lines = parser._all_lines
+        # the binary payloads follow the BIN lines, in the same order as in the file
+        with open_file(self.source_file, "rb") as fh:
+            if not os.fstat(fh.fileno()).st_size:
+                return
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                ranges = list(_iter_text_ranges(mm))
+            finally:
+                mm.close()
+        payloads = [(ranges[i][1], ranges[i + 1][0]) for i in range(len(ranges) - 1)]
+        bin_lines = [i for i, line in enumerate(self._source_lines) if _binary_line.match(line)]
+        if len(bin_lines) == len(payloads):
+            self._payloads = dict(zip(bin_lines, payloads))
+
+    def _write_line(self, line, depth):
+        if self._after_payload:
+            # the end line of a binary payload directly follows its last byte
+            self._fh.write(line.encode("utf-8") + b"\n")
+            self._after_payload = False
+        else:
+            self._fh.write(("\t" * depth + line).encode("utf-8") + b"\n")
+
+    def _write_payload(self, line_index, line, depth):
+        start, end = self._payloads[line_index]
+        if end - start != int(_binary_line.match(line).group(1)):  # pragma: no cover
+            raise ValueError("Binary section size mismatch for {}.".format(line))
+        self._write_line(line, depth)
+        self._source_fh.seek(start)
+        remaining = end - start
+        while remaining:
+            chunk = self._source_fh.read(min(remaining, _read_chunk_size))
+            self._fh.write(chunk)
+            remaining -= len(chunk)
+        self._after_payload = True
+
+    def _source_block_lines(self, source_block):
+        """Get the lines that belong directly to a source block, and the nested blocks lines."""
+        span = self._block_spans.get(id(source_block)) if isinstance(source_block, dict) else None
+        if not span:
+            return []
+        return list(range(span[0] + 1, span[1]))
+
+    def _source_key_lines(self, source_block):
+        """Map the keys of a source block to the indexes of the lines that define them."""
+        key_lines = {}
+        nested = []
+        for i in self._source_block_lines(source_block):
+            line = self._source_lines[i]
+            if nested:
+                if line == "$end '{}'".format(nested[-1]):
+                    nested.pop()
+                elif _begin_search.search(line):
+                    nested.append(_begin_search.search(line).group(1))
+                continue
+            b = _begin_search.search(line)
+            if b:
+                nested.append(b.group(1))
+                continue
+            decoded = {}
+            _decode_subkey(line, decoded)
+            for key in decoded:
+                key_lines.setdefault(key, []).append(i)
+        return key_lines
+
+    def _write_block(self, name, value, source_value, depth):
+        self._write_line("$begin '{}'".format(name), depth)
+        if name in _recognized_keywords and repr(value) != repr(source_value):
+            self._write_recognized_block(name, value, depth + 1)
+        elif name in _recognized_keywords:
+            # unchanged, copy the source lines with their nested blocks
+            nested = 0
+            for i in self._source_block_lines(source_value):
+                line = self._source_lines[i]
+                if line.startswith("$end '"):
+                    nested -= 1
+                self._write_line(line, depth + 1 + nested)
+                if _begin_search.search(line):
+                    nested += 1
+        else:
+            self._write_block_content(value, source_value, depth + 1)
+        self._write_line("$end '{}'".format(name), depth)
+
+    def _write_block_content(self, block, source_block, depth):
+        if not isinstance(source_block, dict):
+            source_block = {}
+        key_lines = self._source_key_lines(source_block) if source_block else {}
+        for key, value in block.items():
+            source_value = source_block.get(key)
+            if isinstance(value, dict):
+                self._write_block(key, value, source_value, depth)
+            elif isinstance(value, list) and value and all(isinstance(i, dict) for i in value):
+                # repeated blocks
+                if isinstance(source_value, dict):
+                    source_value = [source_value]
+                elif not isinstance(source_value, list):
+                    source_value = []
+                for i, item in enumerate(value):
+                    self._write_block(key, item, source_value[i] if i < len(source_value) else None, depth)
+            elif key in key_lines and key in source_block and repr(value) == repr(source_value):
+                for i in key_lines[key]:
+                    if i in self._payloads:
+                        self._write_payload(i, self._source_lines[i], depth)
+                    else:
+                        self._write_line(self._source_lines[i], depth)
+            else:
+                square = False
+                if key in key_lines:
+                    line = self._source_lines[key_lines[key][-1]]
+                    square = not _list_bounds(line, "(", ")", False) and bool(_list_bounds(line, "[", "]", True))
+                for line in self._format_key(key, value, square):
+                    if _binary_line.match(line):
+                        raise ValueError("Binary section {} is not available in the source file.".format(line))
+                    self._write_line(line, depth)
+
+    @staticmethod
+    def _format_value(value, in_list=False):
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        elif isinstance(value, (int, float)):
+            return repr(value)
+        elif value is None:
+            return ""
+        value = str(value)
+        # the list elements are split on the unquoted commas
+        if in_list and "," not in value and "\\'" not in value and _raw_list_element.search(value):
+            return value
+        # the elements merged on quoted commas keep their quotes, wrapping them again would move the quoted commas
+        if in_list and "," in value and "'" in value and _separate_list_elements(value) == [value]:
+            return value
+        return "'{}'".format(value)
+
+    @staticmethod
+    def _format_key(key, value, square=False):
+        """Format a key and its value as AEDT lines."""
+        if _idmap_subkey.search(key + "()") and (value is None or isinstance(value, list)):
+            return ["{}({})".format(key, ",".join(str(i) for i in value or []))]
+        if value is None:
+            return [key]
+        if key in ["WireSeg", "PC"] and isinstance(value, list) and all(isinstance(i, list) for i in value):
+            if key == "PC":
+                return ["PC({})".format(", ".join(str(i) for i in v)) for v in value]
+            return ["WireSeg({})".format(", ".join(AedtFileWriter._format_value(i) for i in v)) for v in value]
+        if _whitespace_search.search(key) or "=" in key or "(" in key or "[" in key:
+            key = "'{}'".format(key)
+        if isinstance(value, list):
+            elements = ", ".join(AedtFileWriter._format_value(i, True) for i in value)
+            if square:
+                return ["{}[{}: {}]".format(key, len(value), elements)]
+            return ["{}({})".format(key, elements)]
+        return ["{}={}".format(key, AedtFileWriter._format_value(value))]
+
+    def _write_recognized_block(self, keyword, d, depth):
+        """Write the content of a block belonging to _recognized_keywords."""
+        if keyword == _recognized_keywords[0]:  # 'CurvesInfo'
+            for k, v in d.items():
+                elements = ", ".join(self._format_value(i.replace('"', "\\'") if isinstance(i, str) else i) for i in v)
+                self._write_line("'{}'({})".format(k, elements), depth)
+        elif keyword == _recognized_keywords[1]:  # 'Sweep Operations'
+            for v in d.get("add", []):
+                self._write_line("add({})".format(", ".join(v)), depth)
+        elif keyword == _recognized_keywords[2]:  # PropDisplayMap
+            # the parser keeps the trailing commas of the last elements before Text and ExtentRect,
+            # but not the name of the key
+            def _format(elements):
+                return ", ".join(
+                    i if isinstance(i, str) and i.endswith(",") else self._format_value(i) for i in elements
+                )
+
+            name = d["Name"]
+            text = name[-1]
+            self._write_line(
+                "Name({} Text({} ExtentRect({})))".format(_format(name[:-2]), _format(text[:-2]), _format(text[-1])),
+                depth,
+            )
+        elif keyword in _recognized_keywords[3:6]:  # Cells, Active, Rotation
+            self._write_line("m={}".format(d["rows"]), depth)
+            self._write_line("n={}".format(d["columns"]), depth)
+            for i, row in enumerate(d["matrix"]):
+                self._write_line("$begin 'r{}'".format(i), depth)
+                for c in row:
+                    if keyword == "Active":
+                        c = "true" if c else "false"
+                    elif keyword == "Rotation":
+                        c = c // 90
+                    self._write_line("c({})".format(c), depth + 1)
+                self._write_line("$end 'r{}'".format(i), depth)
+        elif keyword == _recognized_keywords[6]:  # PostProcessingCells
+            for k, v in d.items():
+                self._write_line("OneCell({}, '{}', '{}')".format(k, v[0], v[1]), depth)
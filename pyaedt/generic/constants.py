@@ -1,6 +1,11 @@
 import math
 import warnings
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 RAD2DEG = 180.0 / math.pi
 DEG2RAD = math.pi / 180
 HOUR2SEC = 3600.0
@@ -15,36 +20,50 @@ MILS2METER = 39370.078740157
 SpeedOfLight = 299792458.0
 
 
+def _log10(x):
+    """Compute the base 10 logarithm of a value or of a numpy array."""
+    if np is not None and isinstance(x, np.ndarray):
+        return np.log10(x)
+    return math.log10(x)
+
+
+def _pow10(x):
+    """Compute 10 to the power of a value or of a numpy array."""
+    if np is not None and isinstance(x, np.ndarray):
+        return np.power(10.0, x)
+    return math.pow(10, x)
+
+
 def db20(x, inverse=True):
     """Convert db20 to decimal and vice versa."""
     if inverse:
-        return 20 * math.log10(x)
+        return 20 * _log10(x)
     else:
-        return math.pow(10, x / 20.0)
+        return _pow10(x / 20.0)
 
 
 def db10(x, inverse=True):
     """Convert db10 to decimal and vice versa."""
     if inverse:
-        return 10 * math.log10(x)
+        return 10 * _log10(x)
     else:
-        return math.pow(10, x / 10.0)
+        return _pow10(x / 10.0)
 
 
 def dbw(x, inverse=True):
     """Convert W to decimal and vice versa."""
     if inverse:
-        return 10 * math.log10(x)
+        return 10 * _log10(x)
     else:
-        return math.pow(10, x / 10.0)
+        return _pow10(x / 10.0)
 
 
 def dbm(x, inverse=True):
     """Convert W to decimal and vice versa."""
     if inverse:
-        return 10 * math.log10(x) + 30
+        return 10 * _log10(x) + 30
     else:
-        return math.pow(10, x / 10.0) / 1000
+        return _pow10(x / 10.0) / 1000
 
 
 def fah2kel(val, inverse=True):
@@ -142,13 +161,84 @@ def _resolve_unit_system(unit_system_1, unit_system_2, operation):
         return ""
 
 
+_unit_converters = {}
+
+
+def unit_converter_function(unit_system="Length", input_units="meter", output_units="mm"):
+    """Get a function that converts values between two units of a unit system.
+
+    The conversion is resolved once into a scale factor or into a composition of the
+    conversion functions of ``AEDT_UNITS``, and the result is cached. The returned function
+    accepts a float or a numpy array and converts the whole array in a single numpy expression.
+
+    Parameters
+    ----------
+    unit_system : str
+        Unit system. Default is `"Length"`.
+    input_units : str
+        Input units. Default is `"meter"`.
+    output_units : str
+        Output units. Default is `"mm"`.
+
+    Returns
+    -------
+    function
+        Conversion function, or ``None`` if the unit system or the units are unknown.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> to_ghz = unit_converter_function("Freq", "Hz", "GHz")
+    >>> to_ghz(np.array([1e9, 2e9]))
+    array([1., 2.])
+    """
+    key = (unit_system, input_units, output_units)
+    if key in _unit_converters:
+        return _unit_converters[key]
+    if (
+        unit_system not in AEDT_UNITS
+        or input_units not in AEDT_UNITS[unit_system]
+        or output_units not in AEDT_UNITS[unit_system]
+    ):
+        return None
+    input_factor = AEDT_UNITS[unit_system][input_units]
+    output_factor = AEDT_UNITS[unit_system][output_units]
+    if unit_system == "Temperature":
+
+        def converter(value):
+            return output_factor(input_factor(value, False), output_units != "kel")
+
+    elif callable(input_factor) and callable(output_factor):
+
+        def converter(value):
+            return output_factor(input_factor(value, False), True)
+
+    elif callable(output_factor):
+
+        def converter(value):
+            return output_factor(value * input_factor, True)
+
+    elif callable(input_factor):
+
+        def converter(value):
+            return input_factor(value, False) / output_factor
+
+    else:
+
+        def converter(value):
+            return value * input_factor / output_factor
+
+    _unit_converters[key] = converter
+    return converter
+
+
 def unit_converter(values, unit_system="Length", input_units="meter", output_units="mm"):
     """Convert unit in specified unit system.
 
     Parameters
     ----------
-    values : float, list
-        Values to convert.
+    values : float, list, numpy.ndarray
+        Values to convert. A numpy array is converted in a single numpy expression.
     unit_system : str
         Unit system. Default is `"Length"`.
     input_units : str
@@ -158,7 +248,7 @@ def unit_converter(values, unit_system="Length", input_units="meter", output_uni
 
     Returns
     -------
-    float, list
+    float, list, numpy.ndarray
         Converted value.
     """
     if unit_system in AEDT_UNITS:
@@ -169,36 +259,10 @@ def unit_converter(values, unit_system="Length", input_units="meter", output_uni
             warnings.warn("Unknown units: '{}'".format(output_units))
             return values
         else:
-            input_is_list = isinstance(values, list)
-            if not input_is_list:
-                values = [values]
-            converted_values = []
-            for value in values:
-                if unit_system == "Temperature":
-                    value = AEDT_UNITS[unit_system][input_units](value, False)
-                    value = AEDT_UNITS[unit_system][output_units](value, output_units != "kel")
-                elif not callable(AEDT_UNITS[unit_system][input_units]) and not callable(
-                    AEDT_UNITS[unit_system][output_units]
-                ):
-                    value = value * AEDT_UNITS[unit_system][input_units] / AEDT_UNITS[unit_system][output_units]
-                elif not callable(AEDT_UNITS[unit_system][input_units]) and callable(
-                    AEDT_UNITS[unit_system][output_units]
-                ):
-                    value = value * AEDT_UNITS[unit_system][input_units]
-                    value = AEDT_UNITS[unit_system][output_units](value, True)
-                elif callable(AEDT_UNITS[unit_system][input_units]) and not callable(
-                    AEDT_UNITS[unit_system][output_units]
-                ):
-                    value = AEDT_UNITS[unit_system][input_units](value, False) / AEDT_UNITS[unit_system][output_units]
-                else:
-                    value = AEDT_UNITS[unit_system][input_units](value, False)
-                    value = AEDT_UNITS[unit_system][output_units](value, True)
-
-                converted_values.append(value)
-            if input_is_list:
-                return converted_values
-            else:
-                return converted_values[0]
+            converter = unit_converter_function(unit_system, input_units, output_units)
+            if isinstance(values, list):
+                return [converter(value) for value in values]
+            return converter(values)
     warnings.warn("No system unit found")
     return values
 
@@ -1,10 +1,222 @@
+from collections import OrderedDict
+import getpass
 import logging
 import os
+import sys
+import tempfile
+import threading
 import time
 
 is_linux = os.name == "posix"
 
 
+def _approximate_size(obj):
+    """Approximate the memory size in bytes of a nested structure of dictionaries and lists."""
+    size = 0
+    seen = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return size
+
+
+def _user_cache_path():
+    """Get the default folder of the on-disk cache, which is specific to the current user."""
+    try:
+        user = getpass.getuser()
+    except Exception:  # pragma: no cover
+        user = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), "pyaedt_file_cache_{}".format(user))
+
+
+class ProjectPropertiesCache(object):
+    """Memory-bounded cache of the parsed project files.
+
+    Each entry stores the modification time of its project file. An entry whose file changed
+    on disk is considered stale and is not returned anymore, but the hashes of its design blocks
+    are kept until it is replaced, so that only the changed blocks are decoded again. When the
+    maximum number of entries or the memory budget is exceeded, the least recently used entries
+    are evicted.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of projects kept in the cache. The default is ``16``.
+    max_memory : float, optional
+        Approximate memory budget in MB. The default is ``None``, in which case the
+        memory is not checked.
+    """
+
+    def __init__(self, max_entries=16, max_memory=None):
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(project_file):
+        return os.path.normpath(project_file)
+
+    @staticmethod
+    def _time_stamp(project_file):
+        if os.path.exists(project_file):
+            return os.path.getmtime(project_file)
+        return None
+
+    def get(self, project_file, default=None):
+        """Get the properties of a project if they are still up to date.
+
+        Parameters
+        ----------
+        project_file : str
+            Full path to the project file.
+        default : optional
+            Value returned when the project is not cached or its entry is stale.
+
+        Returns
+        -------
+        dict
+            Dictionary of the project properties.
+        """
+        key = self._key(project_file)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                time_stamp = self._time_stamp(key)
+                # projects that are not available locally cannot be checked and are kept
+                if time_stamp is None or time_stamp == entry[1]:
+                    self._entries[key] = self._entries.pop(key)
+                    self.hits += 1
+                    return entry[0]
+            self.misses += 1
+            return default
+
+    def set(self, project_file, properties, time_stamp=None, block_hashes=None):
+        """Add the properties of a project to the cache.
+
+        Parameters
+        ----------
+        project_file : str
+            Full path to the project file.
+        properties : dict
+            Dictionary of the project properties.
+        time_stamp : float, optional
+            Modification time of the project file when it was parsed. The default is ``None``,
+            in which case the current modification time is used.
+        block_hashes : dict, optional
+            Hashes of the design blocks returned by ``update_aedt_file``. The default is ``None``.
+        """
+        key = self._key(project_file)
+        if time_stamp is None:
+            time_stamp = self._time_stamp(key)
+        size = _approximate_size(properties) if self.max_memory else 0
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (properties, time_stamp, size, block_hashes)
+            self._evict()
+
+    def time_stamp(self, project_file):
+        """Get the modification time of the project file when its properties were cached.
+
+        Parameters
+        ----------
+        project_file : str
+            Full path to the project file.
+
+        Returns
+        -------
+        float
+            Modification time, ``None`` if the project is not cached.
+        """
+        entry = self._entries.get(self._key(project_file))
+        return entry[1] if entry else None
+
+    def block_hashes(self, project_file):
+        """Get the hashes of the design blocks of a project, even if its entry is stale.
+
+        Parameters
+        ----------
+        project_file : str
+            Full path to the project file.
+
+        Returns
+        -------
+        dict
+            Hashes of the design blocks, ``None`` if the project is not cached.
+        """
+        entry = self._entries.get(self._key(project_file))
+        return entry[3] if entry else None
+
+    def _evict(self):
+        while self._entries and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_memory and self.memory > self.max_memory * 1024 * 1024 and len(self._entries) > 1)
+        ):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def memory(self):
+        """Approximate memory in bytes used by the cached projects.
+
+        This value is computed only when a memory budget is set.
+        """
+        return sum(i[2] for i in list(self._entries.values()))
+
+    @property
+    def stats(self):
+        """Cache statistics.
+
+        Returns
+        -------
+        dict
+            Number of entries, hits, misses and evictions, and approximate memory in bytes.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory": self.memory,
+        }
+
+    def clear(self):
+        """Remove all the entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __contains__(self, project_file):
+        return self._key(project_file) in self._entries
+
+    def __getitem__(self, project_file):
+        return self._entries[self._key(project_file)][0]
+
+    def __setitem__(self, project_file, properties):
+        self.set(project_file, properties)
+
+    def __delitem__(self, project_file):
+        with self._lock:
+            del self._entries[self._key(project_file)]
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class Settings(object):
     """Manages all PyAEDT environment variables and global settings."""
 
@@ -31,11 +243,17 @@ class Settings(object):
         self.remote_rpc_session = None
         self.remote_rpc_session_temp_folder = ""
         self.remote_rpc_service_manager_port = 17878
-        self._project_properties = {}
-        self._project_time_stamp = 0
+        self._project_properties = ProjectPropertiesCache()
+        self._project_time_stamp = {}
+        self._enable_aedt_file_cache = False
+        self._aedt_file_cache_path = _user_cache_path()
+        self._aedt_file_cache_size = 1024
+        self._aedt_file_cache_use_hash = False
+        self._enable_ffd_file_cache = False
         self._disable_bounding_box_sat = False
         self._force_error_on_missing_project = False
         self._enable_pandas_output = False
+        self._enable_lazy_solution_data = False
         self.time_tick = time.time()
         self._global_log_file_name = "pyaedt_{}.log".format(os.path.split(os.path.expanduser("~"))[-1])
         self._enable_global_log_file = True
@@ -249,6 +467,91 @@ class Settings(object):
     def enable_pandas_output(self, val):
         self._enable_pandas_output = val
 
+    @property
+    def enable_lazy_solution_data(self):
+        """Flag for whether solution data is retrieved only when accessed. This attribute
+        applies to Solution data output. The default is ``False``. If ``True``, the values of each
+        expression are retrieved from AEDT the first time that the expression is accessed."""
+        return self._enable_lazy_solution_data
+
+    @enable_lazy_solution_data.setter
+    def enable_lazy_solution_data(self, val):
+        self._enable_lazy_solution_data = val
+
+    @property
+    def project_properties_cache_size(self):
+        """Maximum number of parsed projects kept in memory. When the number is exceeded,
+        the least recently used projects are removed. The default is ``16``."""
+        return self._project_properties.max_entries
+
+    @project_properties_cache_size.setter
+    def project_properties_cache_size(self, val):
+        self._project_properties.max_entries = int(val)
+
+    @property
+    def project_properties_cache_memory(self):
+        """Approximate memory budget in MB of the parsed projects kept in memory. When the budget is
+        exceeded, the least recently used projects are removed. The default is ``None``, in which
+        case only ``project_properties_cache_size`` is checked."""
+        return self._project_properties.max_memory
+
+    @project_properties_cache_memory.setter
+    def project_properties_cache_memory(self, val):
+        self._project_properties.max_memory = val
+
+    @property
+    def enable_aedt_file_cache(self):
+        """Flag for enabling and disabling the on-disk cache of parsed AEDT files.
+        When ``True``, the dictionaries returned by ``load_entire_aedt_file`` are saved in the
+        ``aedt_file_cache_path`` folder and reused until the file changes. The default is ``False``."""
+        return self._enable_aedt_file_cache
+
+    @enable_aedt_file_cache.setter
+    def enable_aedt_file_cache(self, val):
+        self._enable_aedt_file_cache = val
+
+    @property
+    def aedt_file_cache_path(self):
+        """Folder of the on-disk cache of parsed AEDT files.
+        The default is the ``pyaedt_file_cache_<user>`` folder in the temp directory. The folder is created
+        with access restricted to the current user, and it is not used if it belongs to another user."""
+        return self._aedt_file_cache_path
+
+    @aedt_file_cache_path.setter
+    def aedt_file_cache_path(self, val):
+        self._aedt_file_cache_path = val
+
+    @property
+    def aedt_file_cache_size(self):
+        """Maximum size in MB of the on-disk cache of parsed AEDT files. When the size is exceeded,
+        the least recently used entries are removed. The default is ``1024``."""
+        return self._aedt_file_cache_size
+
+    @aedt_file_cache_size.setter
+    def aedt_file_cache_size(self, val):
+        self._aedt_file_cache_size = val
+
+    @property
+    def aedt_file_cache_use_hash(self):
+        """Flag for whether to check the content hash of the AEDT file, in addition to its size and
+        modification time, before reusing an on-disk cache entry. The default is ``False``."""
+        return self._aedt_file_cache_use_hash
+
+    @aedt_file_cache_use_hash.setter
+    def aedt_file_cache_use_hash(self, val):
+        self._aedt_file_cache_use_hash = val
+
+    @property
+    def enable_ffd_file_cache(self):
+        """Flag for enabling and disabling the binary cache of element pattern files.
+        When ``True``, the element patterns read by ``FfdSolutionData`` are saved in an ``.npz`` file
+        next to the ``.ffd`` files and reused until one of these files changes. The default is ``False``."""
+        return self._enable_ffd_file_cache
+
+    @enable_ffd_file_cache.setter
+    def enable_ffd_file_cache(self, val):
+        self._enable_ffd_file_cache = val
+
     @property
     def enable_debug_methods_argument_logger(self):
         """Flag for whether to write out the method's arguments in the debug logger.
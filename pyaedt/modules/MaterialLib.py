@@ -6,6 +6,7 @@ from __future__ import absolute_import  # noreorder
 
 import copy
 import fnmatch
+import hashlib
 import json
 import math
 import os
@@ -15,6 +16,9 @@ import sys
 from pyaedt import is_ironpython
 from pyaedt import settings
 from pyaedt.generic.DataHandlers import _arg2dict
+from pyaedt.generic.LoadAEDTFile import AedtFileParser
+from pyaedt.generic.LoadAEDTFile import _disk_cache_folder
+from pyaedt.generic.LoadAEDTFile import _is_owned
 from pyaedt.generic.general_methods import _create_json_file
 from pyaedt.generic.general_methods import generate_unique_name
 from pyaedt.generic.general_methods import open_file
@@ -24,6 +28,209 @@ from pyaedt.modules.Material import Material
 from pyaedt.modules.Material import OrderedDict
 from pyaedt.modules.Material import SurfaceMaterial
 
+_amat_begin_search = re.compile(b"^\\$begin '([^\\r\\n]+)'", re.MULTILINE)
+_amat_catalog_version = 1
+_amat_catalogs = {}
+
+
+class AmatCatalog(object):
+    """Catalog of the materials defined in the AMAT files of a material library.
+
+    The catalog stores the name and byte range of each material, and the modification times
+    of the library folders and AMAT files. It is saved in the ``settings.aedt_file_cache_path``
+    folder and reused while the folders and files are unchanged, so that checking it only
+    requires to stat them. The material definitions are read from their byte range on request.
+
+    Parameters
+    ----------
+    library : str
+        Folder of the material library.
+
+    Examples
+    --------
+    >>> from pyaedt.modules.MaterialLib import AmatCatalog
+    >>> catalog = AmatCatalog("C:\\Program Files\\AnsysEM\\v231\\Win64\\syslib")
+    >>> catalog.load()
+    >>> catalog.read_material("copper")
+    """
+
+    def __init__(self, library):
+        self.library = os.path.normpath(library)
+        self.directories = {}
+        self.files = []
+        self._materials = None
+
+    @property
+    def catalog_file(self):
+        """Path of the file where the catalog is saved."""
+        key = hashlib.sha1(self.library.encode("utf-8")).hexdigest()
+        return os.path.join(settings.aedt_file_cache_path, "amat_catalog_{}.json".format(key))
+
+    @property
+    def names(self):
+        """Names of the materials, in the order of the AMAT files."""
+        return [
+            name
+            for _, _, _, materials in self.files
+            for name, _, _ in materials
+            if name not in ["$index$", "$base_index$"]
+        ]
+
+    @property
+    def materials(self):
+        """Dictionary of the AMAT file and byte range of each material.
+
+        When a material is defined in several files, the first definition is kept."""
+        if self._materials is None:
+            self._materials = {}
+            for amat, _, _, materials in self.files:
+                for name, start, end in materials:
+                    self._materials.setdefault(name, (amat, start, end))
+        return self._materials
+
+    def is_valid(self):
+        """Check if the library folders and the AMAT files are unchanged.
+
+        Returns
+        -------
+        bool
+            ``True`` when the catalog is up to date, ``False`` otherwise.
+        """
+        if not self.directories:
+            return False
+        try:
+            for directory, mtime in self.directories.items():
+                if os.stat(directory).st_mtime != mtime:
+                    return False
+            for amat, mtime, size, _ in self.files:
+                stat = os.stat(amat)
+                if stat.st_mtime != mtime or stat.st_size != size:
+                    return False
+        except OSError:
+            return False
+        return True
+
+    def load(self):
+        """Load the catalog from its file, or scan the library if the catalog is outdated.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+        """
+        if self.is_valid():
+            return True
+        # the catalog is only read from the cache folder of the current user
+        if _disk_cache_folder() and _is_owned(self.catalog_file):
+            try:
+                with open_file(self.catalog_file, "r") as f:
+                    catalog = json.load(f)
+                if catalog["version"] == _amat_catalog_version and catalog["library"] == self.library:
+                    self.directories = catalog["directories"]
+                    self.files = catalog["files"]
+                    self._materials = None
+                    if self.is_valid():
+                        return True
+            except Exception:
+                pass
+        self.scan()
+        if self.directories:
+            self.save()
+        return True
+
+    @staticmethod
+    def _scan_file(amat):
+        """Get the name and byte range of the materials defined in an AMAT file."""
+        with open_file(amat, "rb") as f:
+            content = f.read()
+        materials = []
+        for m in _amat_begin_search.finditer(content):
+            name = m.group(1).decode("utf-8", errors="replace")
+            end = content.find(b"\n$end '" + m.group(1) + b"'", m.end())
+            end = len(content) if end < 0 else end + len(m.group(1)) + 8
+            materials.append([name, m.start(), end])
+        return materials
+
+    def scan(self):
+        """Scan the library folders and the AMAT files."""
+        self.directories = {}
+        self.files = []
+        self._materials = None
+        if not os.path.isdir(self.library):
+            return
+        for dirpath, _, filenames in os.walk(self.library):
+            self.directories[dirpath] = os.stat(dirpath).st_mtime
+            for filename in filenames:
+                if fnmatch.fnmatch(filename, "*.amat"):
+                    amat = os.path.join(dirpath, filename)
+                    stat = os.stat(amat)
+                    self.files.append([amat, stat.st_mtime, stat.st_size, self._scan_file(amat)])
+
+    def save(self):
+        """Save the catalog to its file.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        catalog = {
+            "version": _amat_catalog_version,
+            "library": self.library,
+            "directories": self.directories,
+            "files": self.files,
+        }
+        if not _disk_cache_folder(create=True):
+            return False
+        try:
+            return _create_json_file(catalog, self.catalog_file)
+        except Exception:
+            settings.logger.debug("Failed to save the material catalog {}.".format(self.catalog_file))
+            return False
+
+    def read_material(self, name):
+        """Read the definition of a material from its AMAT file.
+
+        Parameters
+        ----------
+        name : str
+            Name of the material.
+
+        Returns
+        -------
+        dict
+            Dictionary of the material properties, ``None`` if the material is not in the catalog.
+        """
+        if name not in self.materials:
+            return None
+        amat, start, end = self.materials[name]
+        material = AedtFileParser(amat).load_block(name, start, end).get(name)
+        # the properties are in the MaterialDef block of the material
+        if isinstance(material, dict) and isinstance(material.get("MaterialDef"), dict):
+            return material["MaterialDef"].get(name, material)
+        return material
+
+
+def get_amat_catalog(library):
+    """Get the catalog of a material library, scanning it only if it changed.
+
+    Parameters
+    ----------
+    library : str
+        Folder of the material library.
+
+    Returns
+    -------
+    :class:`pyaedt.modules.MaterialLib.AmatCatalog`
+        Catalog of the material library.
+    """
+    library = os.path.normpath(library)
+    catalog = _amat_catalogs.get(library)
+    if catalog is None:
+        catalog = _amat_catalogs[library] = AmatCatalog(library)
+    catalog.load()
+    return catalog
+
 
 class Materials(object):
     """Contains the AEDT materials database and all methods for creating and editing materials.
@@ -142,54 +349,38 @@ class Materials(object):
         """List material names with lower case."""
         return self._mat_names_aedt_lower
 
+    @property
+    def _amat_catalogs(self):
+        return [get_amat_catalog(i) for i in [self._app.syslib, self._app.personallib, self._app.userlib] if i]
+
     @pyaedt_function_handler()
     def _read_materials(self):
-        def get_mat_list(file_name):
-            mats = []
-            _begin_search = re.compile(r"^\$begin '(.+)'")
-            with open_file(file_name, "r") as aedt_fh:
-                raw_lines = aedt_fh.read().splitlines()
-                for line in raw_lines:
-                    b = _begin_search.search(line)
-                    if b:  # walk down a level
-                        mats.append(b.group(1))
-            return mats
-
-        amat_sys = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.syslib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_personal = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.personallib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_user = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.userlib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_libs = amat_sys + amat_personal + amat_user
         mats = []
-        for amat in amat_libs:
-            # m = load_entire_aedt_file(amat)
-            # mats.extend(list(m.keys()))
-            mats.extend(get_mat_list(amat))
-        try:
-            mats.remove("$index$")
-        except ValueError:
-            pass
-        try:
-            mats.remove("$base_index$")
-        except ValueError:
-            pass
+        for catalog in self._amat_catalogs:
+            mats.extend(catalog.names)
         mats.extend(self.odefinition_manager.GetProjectMaterialNames())
         return mats
 
+    @pyaedt_function_handler()
+    def _read_library_material(self, matname):
+        """Read the properties of a library material from its AMAT file.
+
+        Parameters
+        ----------
+        matname : str
+            Name of the material.
+
+        Returns
+        -------
+        dict
+            Dictionary of the material properties, ``None`` if the material is not found.
+        """
+        for catalog in self._amat_catalogs:
+            props = catalog.read_material(matname)
+            if props is not None:
+                return props
+        return None
+
     @pyaedt_function_handler()
     def _get_aedt_case_name(self, material_name):
         if material_name.lower() in self.material_keys:
@@ -667,10 +858,17 @@ class Materials(object):
         ):
             matname = self._get_aedt_case_name(matname)
         props = {}
-        _arg2dict(list(self.omaterial_manager.GetData(matname)), props)
-        values_view = props.values()
-        value_iterator = iter(values_view)
-        first_value = next(value_iterator)
+        data = self.omaterial_manager.GetData(matname)
+        if data:
+            _arg2dict(list(data), props)
+            values_view = props.values()
+            value_iterator = iter(values_view)
+            first_value = next(value_iterator)
+        else:
+            # the material is not available in AEDT, read it from the library files
+            first_value = self._read_library_material(matname)
+            if first_value is None:
+                return False
         newmat = Material(self, matname, first_value, material_update=False)
         newmat._material_update = True
         self.material_keys[matname.lower()] = newmat
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+import hashlib
 import itertools
 import json
 import logging
@@ -20,7 +21,6 @@ from pyaedt.generic.general_methods import check_and_download_folder
 from pyaedt.generic.general_methods import conversion_function
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import write_csv
-from pyaedt.generic.plot import get_structured_mesh
 from pyaedt.generic.plot import is_notebook
 from pyaedt.generic.plot import plot_2d_chart
 from pyaedt.generic.plot import plot_3d_chart
@@ -53,6 +53,7 @@ class SolutionData(object):
         self._original_data = aedtdata
         self.number_of_variations = len(aedtdata)
         self._enable_pandas_output = True if settings.enable_pandas_output and pd else False
+        self._lazy = settings.enable_lazy_solution_data
         self._expressions = None
         self._intrinsics = None
         self._nominal_variation = None
@@ -95,7 +96,7 @@ class SolutionData(object):
     def enable_pandas_output(self, val):
         if val != self._enable_pandas_output and pd:
             self._enable_pandas_output = val
-            self.init_solutions_data()
+            self._solutions_views = {}
 
     @pyaedt_function_handler()
     def set_active_variation(self, var_id=0):
@@ -144,11 +145,7 @@ class SolutionData(object):
         if variation_name in self.intrinsics:
             return self.intrinsics[variation_name]
         else:
-            vars_vals = []
-            for el in self.variations:
-                if variation_name in el and el[variation_name] not in vars_vals:
-                    vars_vals.append(el[variation_name])
-            return vars_vals
+            return list(self._variables_index.get(variation_name, {}).keys())
 
     @property
     def intrinsics(self):
@@ -239,100 +236,500 @@ class SolutionData(object):
 
     @pyaedt_function_handler()
     def init_solutions_data(self):
-        """Initialize the database and store info in variables."""
-        self._solutions_real = self._init_solution_data_real()
-        self._solutions_imag = self._init_solution_data_imag()
-        self._solutions_mag = self._init_solution_data_mag()
-        self._solutions_phase = self._init_solution_data_phase()
+        """Initialize the database and store info in variables.
 
-    @pyaedt_function_handler()
-    def _init_solution_data_mag(self):
-        _solutions_mag = {}
+        When ``settings.enable_lazy_solution_data`` is ``True``, the values of each expression
+        are retrieved only when the expression is first accessed.
+        """
         self.units_data = {}
-
         for expr in self.expressions:
-            _solutions_mag[expr] = {}
             self.units_data[expr] = self.nominal_variation.GetDataUnits(expr)
-            if self.enable_pandas_output:
-                _solutions_mag[expr] = np.sqrt(
-                    self._solutions_real[expr]
-                    .mul(self._solutions_real[expr])
-                    .add(self._solutions_imag[expr].mul(self._solutions_imag[expr]))
-                )
+        self._init_sweep_axes()
+        self._solutions = {}
+        self._solutions_derived = {}
+        self._solutions_views = {}
+        self._load_time = 0.0
+        self._derived_time = 0.0
+        if not self._lazy:
+            for expression in self.expressions:
+                self._get_solution(expression)
+
+    @pyaedt_function_handler()
+    def _init_sweep_axes(self):
+        """Build the axis-coordinate table of the solution.
+
+        For every variation, the unique values of each intrinsic sweep are stored in the
+        order in which AEDT returns them, together with a value-to-index map. The
+        variations are indexed by the tuple of their design variable values.
+        """
+        self._axes_names = list(self.intrinsics.keys())
+        self._axes_values = []
+        self._axes_index = []
+        self._variations_index = {}
+        self._variables_index = OrderedDict()
+        for i, (data, comb) in enumerate(zip(self._original_data, self.variations)):
+            axes = [list(OrderedDict.fromkeys(data.GetSweepValues(el, False))) for el in self._axes_names]
+            self._axes_values.append(axes)
+            self._axes_index.append([dict((v, j) for j, v in enumerate(axis)) for axis in axes])
+            self._variations_index[tuple(comb[v] for v in comb)] = i
+            for name, value in comb.items():
+                self._variables_index.setdefault(name, OrderedDict()).setdefault(value, []).append(i)
+        self._uniform_axes = all(axes == self._axes_values[0] for axes in self._axes_values)
+
+    @pyaedt_function_handler()
+    def _load_solution(self, expression):
+        """Retrieve the solution of an expression as complex values.
+
+        With numpy, the expression is stored as one contiguous complex array of shape
+        ``(variations, *sweep_lengths)``. When the variations have different sweep
+        lengths, a list of arrays (one per variation) is stored instead. Without numpy,
+        each variation is stored as a flat list of complex values.
+
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+
+        Returns
+        -------
+        list or :class:`numpy.ndarray`
+        """
+        values = []
+        for data, axes in zip(self._original_data, self._axes_values):
+            shape = tuple(len(axis) for axis in axes)
+            size = 1
+            for length in shape:
+                size *= length
+            real = data.GetRealDataValues(expression, False)
+            if not (np and isinstance(real, np.ndarray)):
+                real = list(real)
+            if data.IsDataComplex(expression):
+                imag = data.GetImagDataValues(expression, False)
+                if not (np and isinstance(imag, np.ndarray)):
+                    imag = list(imag)
             else:
-                for i in self._solutions_real[expr]:
-                    _solutions_mag[expr][i] = abs(complex(self._solutions_real[expr][i], self._solutions_imag[expr][i]))
-        if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(_solutions_mag)
+                imag = None
+            if np:
+                solution = np.full(size, np.nan, dtype=complex)
+                solution.real[: min(len(real), size)] = real[:size]
+                if imag is not None:
+                    solution.imag[: min(len(imag), size)] = imag[:size]
+                else:
+                    solution.imag[: min(len(real), size)] = 0.0
+                values.append(solution.reshape(shape))
+            else:
+                if imag is not None:
+                    solution = [complex(r, i) for r, i in zip(real[:size], imag[:size])]
+                else:
+                    solution = [complex(r, 0.0) for r in real[:size]]
+                solution.extend([complex(float("nan"), float("nan"))] * (size - len(solution)))
+                values.append(solution)
+        if np and values and all(v.shape == values[0].shape for v in values):
+            values = np.stack(values)
+        return values
+
+    @pyaedt_function_handler()
+    def _get_solution(self, expression):
+        """Get the complex values of an expression, retrieving them on first access.
+
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+
+        Returns
+        -------
+        list or :class:`numpy.ndarray`
+        """
+        if expression not in self._solutions:
+            start = time.time()
+            self._solutions[expression] = self._load_solution(expression)
+            self._load_time += time.time() - start
+        return self._solutions[expression]
+
+    @pyaedt_function_handler()
+    def _get_derived(self, expression, quantity):
+        """Get a quantity derived from the complex values of an expression.
+
+        The quantity is computed for all the points of the expression on first access and cached.
+
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+        quantity : str
+            Derived quantity. Options are ``"mag"``, ``"phase"``, ``"db10"``, and ``"db20"``.
+
+        Returns
+        -------
+        list or :class:`numpy.ndarray`
+        """
+        derived = self._solutions_derived.setdefault(expression, OrderedDict())
+        if quantity in derived:
+            return derived[quantity]
+        solution = self._get_solution(expression)
+        start = time.time()
+        if quantity in ["db10", "db20"]:
+            magnitude = self._get_derived(expression, "mag")
+            factor = 10 if quantity == "db10" else 20
+            if np:
+                with np.errstate(divide="ignore"):
+                    values = [factor * np.log10(v) for v in magnitude]
+            else:
+                values = [[factor * math.log10(i) if i > 0 else float("-inf") for i in v] for v in magnitude]
+        elif np:
+            values = [np.abs(v) if quantity == "mag" else np.angle(v) for v in solution]
+        elif quantity == "mag":
+            values = [[abs(i) for i in v] for v in solution]
         else:
-            return _solutions_mag
+            values = [[math.atan2(i.imag, i.real) for i in v] for v in solution]
+        if np and isinstance(solution, np.ndarray):
+            values = np.stack(values)
+        derived[quantity] = values
+        self._derived_time += time.time() - start
+        return values
+
+    @property
+    def stats(self):
+        """Memory and time spent on the solution data.
+
+        Returns
+        -------
+        dict
+            Dictionary with these keys:
+
+            - ``"expressions"``: Number of available expressions.
+            - ``"loaded_expressions"``: Names of the expressions whose values were retrieved.
+            - ``"derived"``: Derived quantities computed for each expression.
+            - ``"memory"``: Memory in bytes of the stored values and derived quantities.
+            - ``"load_time"``: Time in seconds spent retrieving the values.
+            - ``"derived_time"``: Time in seconds spent computing the derived quantities.
+        """
+
+        def _size(values):
+            if np and isinstance(values, np.ndarray):
+                return values.nbytes
+            if isinstance(values, list):
+                return sys.getsizeof(values) + sum(_size(v) for v in values)
+            return sys.getsizeof(values)
+
+        memory = sum(_size(v) for v in self._solutions.values())
+        for derived in self._solutions_derived.values():
+            memory += sum(_size(v) for v in derived.values())
+        return {
+            "expressions": len(self.expressions),
+            "loaded_expressions": list(self._solutions.keys()),
+            "derived": dict((k, list(v.keys())) for k, v in self._solutions_derived.items()),
+            "memory": memory,
+            "load_time": self._load_time,
+            "derived_time": self._derived_time,
+        }
 
     @pyaedt_function_handler()
-    def _init_solution_data_real(self):
-        """ """
-        sols_data = {}
+    def _solution_index(self, variation_tuple):
+        """Get the position of a full variation tuple in the stored solution.
 
-        for expression in self.expressions:
-            solution_Data = {}
+        Parameters
+        ----------
+        variation_tuple : list
+            Values of the design variables followed by the values of the intrinsics,
+            in the order of the sweep names.
 
-            for data, comb in zip(self._original_data, self.variations):
-                solution = list(data.GetRealDataValues(expression, False))
-                values = []
-                for el in list(self.intrinsics.keys()):
-                    values.append(list(OrderedDict.fromkeys(data.GetSweepValues(el, False))))
+        Returns
+        -------
+        tuple
+            Variation index and flat index in the variation array, or ``None`` if the
+            combination is not available.
+        """
+        n_variables = len(variation_tuple) - len(self._axes_names)
+        var_id = self._variations_index.get(tuple(variation_tuple[:n_variables]), None)
+        if var_id is None:
+            return None
+        flat_index = 0
+        for value, axis, index in zip(
+            variation_tuple[n_variables:], self._axes_values[var_id], self._axes_index[var_id]
+        ):
+            try:
+                position = index.get(value, None)
+            except TypeError:
+                position = None
+            if position is None:
+                return None
+            flat_index = flat_index * len(axis) + position
+        return var_id, flat_index
 
-                i = 0
-                c = [comb[v] for v in list(comb.keys())]
-                for t in itertools.product(*values):
-                    solution_Data[tuple(c + list(t))] = solution[i]
-                    i += 1
-            sols_data[expression] = solution_Data
-        if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(sols_data)
+    @pyaedt_function_handler()
+    def find_variations(self, **variables):
+        """Get the indices of the variations matching values of the design variables.
+
+        Parameters
+        ----------
+        **variables
+            Values of the design variables to match. A list of values matches any of them.
+            The design variables that are not given match all values.
+
+        Returns
+        -------
+        list of int
+            Indices of the matching variations in ``variations``.
+
+        Examples
+        --------
+        >>> solution_data.find_variations(a="1mm", b=["2mm", "3mm"])
+        """
+        if len(variables) == len(self._variables_index) and all(
+            not isinstance(v, (list, tuple)) for v in variables.values()
+        ):
+            key = []
+            for name in self._variables_index:
+                if name not in variables:
+                    break
+                key.append(variables[name])
+            else:
+                var_id = self._variations_index.get(tuple(key), None)
+                return [] if var_id is None else [var_id]
+        matches = None
+        for name, value in variables.items():
+            if name not in self._variables_index:
+                return []
+            values = value if isinstance(value, (list, tuple)) else [value]
+            ids = set()
+            for v in values:
+                ids.update(self._variables_index[name].get(v, []))
+            matches = ids if matches is None else matches & ids
+        if matches is None:
+            return list(range(len(self.variations)))
+        return sorted(matches)
+
+    @pyaedt_function_handler()
+    def select(self, expression=None, **variables):
+        """Get the values of an expression along the primary sweep for all matching variations.
+
+        The primary sweep must be an intrinsic sweep. The intrinsics that are not given
+        take the value in ``active_intrinsic``.
+
+        Parameters
+        ----------
+        expression : str, optional
+            Name of the expression. The default is ``None``, in which case the
+            active expression is used.
+        **variables
+            Values of the design variables to match, as in :func:`find_variations`, and values
+            of the intrinsics other than the primary sweep.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or list
+            Complex values with one row for each variation returned by :func:`find_variations`
+            and one column for each value of ``primary_sweep_values``. Missing points are ``nan``.
+            Without numpy, a list of lists is returned with ``None`` for the missing points.
+
+        Examples
+        --------
+        >>> solution_data.primary_sweep = "Freq"
+        >>> values = solution_data.select("S(1,1)", a=["1mm", "2mm"])
+        """
+        if not expression:
+            expression = self.active_expression
+        elif expression not in self.expressions:
+            return False
+        if self.primary_sweep not in self._axes_names:
+            return False
+        intrinsics = OrderedDict()
+        for name in self._axes_names:
+            intrinsics[name] = variables.pop(name, self.active_intrinsic.get(name, None))
+        var_ids = self.find_variations(**variables)
+        axis = self._axes_names.index(self.primary_sweep)
+        sweep = self.variation_values(self.primary_sweep)
+        solution = self._get_solution(expression)
+        if np and self._uniform_axes and isinstance(solution, np.ndarray) and var_ids:
+            axes_index = self._axes_index[var_ids[0]]
+            index = [np.array(var_ids)]
+            for i, name in enumerate(self._axes_names):
+                if i == axis:
+                    positions = [axes_index[i].get(v, None) for v in sweep]
+                    if None in positions:
+                        break
+                    index.append(slice(None) if positions == list(range(len(positions))) else positions)
+                else:
+                    position = axes_index[i].get(intrinsics[name], None)
+                    if position is None:
+                        break
+                    index.append(position)
+            else:
+                values = solution[tuple(index[:1]) + (slice(None),) * len(self._axes_names)]
+                return values[(slice(None),) + tuple(index[1:])]
+        rows = []
+        for var_id in var_ids:
+            comb = self.variations[var_id]
+            temp = [comb[v] for v in comb] + list(intrinsics.values())
+            row = []
+            for el in sweep:
+                temp[len(comb) + axis] = el
+                location = self._solution_index(temp)
+                if location is None:
+                    row.append(complex(float("nan"), float("nan")) if np else None)
+                elif np:
+                    row.append(solution[location[0]].reshape(-1)[location[1]].item())
+                else:
+                    row.append(solution[location[0]][location[1]])
+            rows.append(row)
+        if np:
+            return np.array(rows, dtype=complex).reshape(len(rows), len(sweep))
+        return rows
+
+    @pyaedt_function_handler()
+    def _get_data(self, expression, quantity=None):
+        """Get the data of an expression along the primary sweep.
+
+        The active variation and the active intrinsics are used for all the other sweeps.
+
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+        quantity : str, optional
+            Derived quantity to get. The default is ``None``, in which case the complex
+            values are returned. Options are ``"mag"``, ``"phase"``, ``"db10"``, and ``"db20"``.
+
+        Returns
+        -------
+        list or :class:`numpy.ndarray`
+            Values. With numpy, an array is returned when all points are available.
+            Otherwise, a list is returned with ``None`` for the missing points.
+        """
+        temp = self._variation_tuple()
+        position = list(self._sweeps_names).index(self.primary_sweep)
+        if quantity:
+            solution = self._get_derived(expression, quantity)
         else:
-            return sols_data
+            solution = self._get_solution(expression)
+        n_variables = len(temp) - len(self._axes_names)
+        sweep = self.variation_values(self.primary_sweep)
+        if np and position >= n_variables:
+            location = self._solution_index(temp)
+            if location is not None:
+                var_id = location[0]
+                axis = position - n_variables
+                index = self._axes_index[var_id][axis]
+                try:
+                    positions = [index.get(el, None) for el in sweep]
+                except TypeError:
+                    positions = [None]
+                if None not in positions:
+                    shape = tuple(len(i) for i in self._axes_values[var_id])
+                    slice_index = list(np.unravel_index(location[1], shape)) if shape else []
+                    slice_index[axis] = positions
+                    return solution[var_id][tuple(slice_index)]
+        sol = []
+        for el in sweep:
+            temp[position] = el
+            location = self._solution_index(temp)
+            if location is None:
+                sol.append(None)
+            elif np:
+                sol.append(solution[location[0]].reshape(-1)[location[1]].item())
+            else:
+                sol.append(solution[location[0]][location[1]])
+        return sol
 
     @pyaedt_function_handler()
-    def _init_solution_data_imag(self):
-        """ """
-        sols_data = {}
+    def _get_data_part(self, expression, part):
+        """Get the real part, imaginary part, or a derived quantity of an expression along the primary sweep.
+
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+        part : str
+            Part to extract. Options are ``"real"``, ``"imag"``, ``"mag"``, ``"phase"``,
+            ``"db10"``, and ``"db20"``.
+
+        Returns
+        -------
+        list
+        """
+        if part not in ["real", "imag"]:
+            data = self._get_data(expression, part)
+            return data.tolist() if np and isinstance(data, np.ndarray) else data
+        data = self._get_data(expression)
+        if np and isinstance(data, np.ndarray):
+            return data.real.tolist() if part == "real" else data.imag.tolist()
+        if part == "real":
+            return [None if i is None else i.real for i in data]
+        return [None if i is None else i.imag for i in data]
+
+    @pyaedt_function_handler()
+    def _iter_solution(self, expression):
+        """Iterate over all the stored points of an expression.
+
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+
+        Returns
+        -------
+        generator
+            Tuples of the full variation key and the complex value.
+        """
+        solution = self._get_solution(expression)
+        for var_id, comb in enumerate(self.variations):
+            c = [comb[v] for v in list(comb.keys())]
+            values = solution[var_id].reshape(-1).tolist() if np else solution[var_id]
+            for t, value in zip(itertools.product(*self._axes_values[var_id]), values):
+                yield tuple(c + list(t)), value
 
+    @pyaedt_function_handler()
+    def _solutions_view(self, part):
+        """Build the full tuple-keyed view of the solution for one part.
+
+        The view is built only on request and cached until the solution is reinitialized.
+
+        Parameters
+        ----------
+        part : str
+            Part to extract. Options are ``"real"``, ``"imag"``, ``"mag"``, and ``"phase"``.
+
+        Returns
+        -------
+        dict or :class:`pandas.DataFrame`
+        """
+        if part in self._solutions_views:
+            return self._solutions_views[part]
+        sols_data = {}
         for expression in self.expressions:
             solution_Data = {}
-            for data, comb in zip(self._original_data, self.variations):
-                if data.IsDataComplex(expression):
-                    solution = list(data.GetImagDataValues(expression, False))
+            for key, value in self._iter_solution(expression):
+                if part == "real":
+                    solution_Data[key] = value.real
+                elif part == "imag":
+                    solution_Data[key] = value.imag
+                elif part == "mag":
+                    solution_Data[key] = abs(value)
                 else:
-                    l = len(list(data.GetRealDataValues(expression, False)))
-                    solution = [0] * l
-                values = []
-                for el in list(self.intrinsics.keys()):
-                    values.append(list(OrderedDict.fromkeys(data.GetSweepValues(el, False))))
-                i = 0
-                c = [comb[v] for v in list(comb.keys())]
-                for t in itertools.product(*values):
-                    solution_Data[tuple(c + list(t))] = solution[i]
-                    i += 1
+                    solution_Data[key] = math.atan2(value.imag, value.real)
             sols_data[expression] = solution_Data
         if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(sols_data)
-        else:
-            return sols_data
+            sols_data = pd.DataFrame.from_dict(sols_data)
+        self._solutions_views[part] = sols_data
+        return sols_data
 
-    @pyaedt_function_handler()
-    def _init_solution_data_phase(self):
-        data_phase = {}
-        for expr in self.expressions:
-            data_phase[expr] = {}
-            if self.enable_pandas_output:
-                data_phase[expr] = np.arctan2(self._solutions_imag[expr], self._solutions_real[expr])
-            else:
-                for i in self._solutions_real[expr]:
-                    data_phase[expr][i] = math.atan2(self._solutions_imag[expr][i], self._solutions_real[expr][i])
-        if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(data_phase)
-        else:
-            return data_phase
+    @property
+    def _solutions_real(self):
+        return self._solutions_view("real")
+
+    @property
+    def _solutions_imag(self):
+        return self._solutions_view("imag")
+
+    @property
+    def _solutions_mag(self):
+        return self._solutions_view("mag")
+
+    @property
+    def _solutions_phase(self):
+        return self._solutions_view("phase")
 
     @property
     def full_matrix_real_imag(self):
@@ -431,17 +828,7 @@ class SolutionData(object):
             expression = self.active_expression
         elif expression not in self.expressions:
             return False
-        temp = self._variation_tuple()
-        solution_Data = self._solutions_mag[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-        sw = self.variation_values(self.primary_sweep)
-        for el in sw:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
+        sol = self._get_data_part(expression, "mag")
         if convert_to_SI and self._quantity(self.units_data[expression]):
             sol = self._convert_list_to_SI(
                 sol, self._quantity(self.units_data[expression]), self.units_data[expression]
@@ -457,7 +844,7 @@ class SolutionData(object):
 
         Parameters
         ----------
-        datalist : list
+        datalist : list, numpy.ndarray
            List of data to convert.
         dataunits :
 
@@ -472,7 +859,13 @@ class SolutionData(object):
         """
         sol = datalist
         if dataunits in AEDT_UNITS and units in AEDT_UNITS[dataunits]:
-            sol = [i * AEDT_UNITS[dataunits][units] for i in datalist]
+            factor = AEDT_UNITS[dataunits][units]
+            if np and isinstance(datalist, np.ndarray):
+                sol = datalist * factor
+            elif np and None not in datalist:
+                sol = (np.asarray(datalist) * factor).tolist()
+            else:
+                sol = [i * factor for i in datalist]
         return sol
 
     @pyaedt_function_handler()
@@ -496,9 +889,14 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
+        if convert_to_SI and self._quantity(self.units_data[expression]):
+            if self.enable_pandas_output:
+                return 10 * np.log10(self.data_magnitude(expression, convert_to_SI))
+            return [db10(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        sol = self._get_data_part(expression, "db10")
         if self.enable_pandas_output:
-            return 10 * np.log10(self.data_magnitude(expression, convert_to_SI))
-        return [db10(i) for i in self.data_magnitude(expression, convert_to_SI)]
+            return pd.Series(sol)
+        return sol
 
     @pyaedt_function_handler()
     def data_db20(self, expression=None, convert_to_SI=False):
@@ -521,9 +919,14 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
+        if convert_to_SI and self._quantity(self.units_data[expression]):
+            if self.enable_pandas_output:
+                return 20 * np.log10(self.data_magnitude(expression, convert_to_SI))
+            return [db20(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        sol = self._get_data_part(expression, "db20")
         if self.enable_pandas_output:
-            return 20 * np.log10(self.data_magnitude(expression, convert_to_SI))
-        return [db20(i) for i in self.data_magnitude(expression, convert_to_SI)]
+            return pd.Series(sol)
+        return sol
 
     @pyaedt_function_handler()
     def data_phase(self, expression=None, radians=True):
@@ -549,9 +952,12 @@ class SolutionData(object):
         coefficient = 1
         if not radians:
             coefficient = 180 / math.pi
+        sol = self._get_data_part(expression, "phase")
+        if not radians:
+            sol = [None if i is None else coefficient * i for i in sol]
         if self.enable_pandas_output:
-            return coefficient * np.arctan2(self.data_imag(expression), self.data_real(expression))
-        return [coefficient * math.atan2(k, i) for i, k in zip(self.data_real(expression), self.data_imag(expression))]
+            return pd.Series(sol)
+        return sol
 
     @property
     def primary_sweep_values(self):
@@ -579,14 +985,12 @@ class SolutionData(object):
         """
         expression = self.active_expression
         temp = self._variation_tuple()
-
-        solution_Data = list(self._solutions_real[expression].keys())
         sol = []
         position = list(self._sweeps_names).index(self.primary_sweep)
 
-        for el in self.primary_sweep_values:
+        for el in self.variation_values(self.primary_sweep):
             temp[position] = el
-            if tuple(temp) in solution_Data:
+            if self._solution_index(temp) is not None:
                 sol_dict = OrderedDict({})
                 i = 0
                 for sn in self._sweeps_names:
@@ -620,19 +1024,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        temp = self._variation_tuple()
-
-        solution_Data = self._solutions_real[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-
-        for el in self.primary_sweep_values:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
-
+        sol = self._get_data_part(expression, "real")
         if convert_to_SI and self._quantity(self.units_data[expression]):
             sol = self._convert_list_to_SI(
                 sol, self._quantity(self.units_data[expression]), self.units_data[expression]
@@ -662,17 +1054,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        temp = self._variation_tuple()
-
-        solution_Data = self._solutions_imag[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-        for el in self.primary_sweep_values:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
+        sol = self._get_data_part(expression, "imag")
         if convert_to_SI and self._quantity(self.units_data[expression]):
             sol = self._convert_list_to_SI(
                 sol, self._quantity(self.units_data[expression]), self.units_data[expression]
@@ -698,11 +1080,13 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        if self.enable_pandas_output:
-            return True if self._solutions_imag[expression].abs().sum() > 0.0 else False
-        for v in list(self._solutions_imag[expression].values()):
-            if float(v) != 0.0:
-                return False
+        solution = self._get_solution(expression)
+        if np:
+            return not any(np.any(np.imag(v) != 0.0) for v in solution)
+        for v in solution:
+            for value in v:
+                if value.imag != 0.0:
+                    return False
         return True
 
     @pyaedt_function_handler()
@@ -728,22 +1112,503 @@ class SolutionData(object):
             else:
                 header.append(el)
 
-        list_full = [header]
-        for e, v in self._solutions_real[self.active_expression].items():
-            list_full.append(list(e))
+        rows = OrderedDict()
+        for e, v in self._iter_solution(self.active_expression):
+            rows[e] = list(e)
         for el in self.expressions:
-            i = 1
-            for e, v in self._solutions_real[el].items():
-                list_full[i].extend([v])
-                i += 1
-            i = 1
-            if not self.is_real_only(el):
-                for e, v in self._solutions_imag[el].items():
-                    list_full[i].extend([v])
-                    i += 1
+            real_only = self.is_real_only(el)
+            values = OrderedDict(self._iter_solution(el))
+            for e, row in rows.items():
+                row.append(values[e].real)
+                if not real_only:
+                    row.append(values[e].imag)
+        list_full = [header] + list(rows.values())
 
         return write_csv(output, list_full, delimiter=delimiter)
 
+    @pyaedt_function_handler()
+    def _table_metadata(self):
+        """Get the description of the columns written by the table exporters."""
+        n_variables = len(self._sweeps_names) - len(self._axes_names)
+        columns = list(self._sweeps_names)
+        expressions = OrderedDict()
+        for expression in self.expressions:
+            is_complex = bool(self._original_data[0].IsDataComplex(expression))
+            if is_complex:
+                expressions[expression] = [expression + " (Real)", expression + " (Imag)"]
+            else:
+                expressions[expression] = [expression]
+            columns.extend(expressions[expression])
+        return {
+            "version": 1,
+            "variables": self._sweeps_names[:n_variables],
+            "intrinsics": list(self._axes_names),
+            "expressions": expressions,
+            "columns": columns,
+            "units_sweeps": dict(self.units_sweeps),
+            "units_data": dict(self.units_data),
+            "primary_sweep": self.primary_sweep,
+            "active_expression": self.active_expression,
+        }
+
+    @pyaedt_function_handler()
+    def _iter_table_chunks(self, chunk_size=100000):
+        """Iterate over the solution as table columns, one chunk of rows at a time.
+
+        Each row contains the values of the design variables, the values of the intrinsics, and
+        the values of all the expressions. Rows of consecutive variations are grouped in the same
+        chunk until ``chunk_size`` rows are reached.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Maximum number of rows in a chunk. The default is ``100000``.
+
+        Returns
+        -------
+        generator
+            Ordered dictionaries with the column names as keys and :class:`numpy.ndarray` as values.
+        """
+        metadata = self._table_metadata()
+        buffer = []
+        buffer_size = 0
+        yielded = False
+        for var_id, comb in enumerate(self.variations):
+            shape = tuple(len(axis) for axis in self._axes_values[var_id])
+            size = int(np.prod(shape)) if shape else 1
+            grid = np.meshgrid(*[np.asarray(axis) for axis in self._axes_values[var_id]], indexing="ij")
+            columns = OrderedDict()
+            for name in metadata["variables"]:
+                columns[name] = np.array([comb.get(name, None)] * size)
+            for name, coordinates in zip(metadata["intrinsics"], grid):
+                columns[name] = coordinates.reshape(-1)
+            for expression, names in metadata["expressions"].items():
+                values = self._get_solution(expression)[var_id].reshape(-1)
+                columns[names[0]] = values.real
+                if len(names) > 1:
+                    columns[names[1]] = values.imag
+            for start in range(0, size, chunk_size):
+                piece = OrderedDict((k, v[start : start + chunk_size]) for k, v in columns.items())
+                buffer.append(piece)
+                buffer_size += len(piece[metadata["columns"][0]])
+                if buffer_size >= chunk_size:
+                    yield OrderedDict((k, np.concatenate([b[k] for b in buffer])) for k in metadata["columns"])
+                    yielded = True
+                    buffer = []
+                    buffer_size = 0
+        if buffer or not yielded:
+            yield OrderedDict(
+                (k, np.concatenate([b[k] for b in buffer]) if buffer else np.array([], dtype=float))
+                for k in metadata["columns"]
+            )
+
+    @pyaedt_function_handler()
+    def export_data_to_parquet(self, output, chunk_size=100000):
+        """Save the Solution Data to a Parquet file.
+
+        Each expression is written as a column, or as two columns for the real and imaginary
+        parts of complex expressions. The design variables and the intrinsics are written as
+        index columns. Rows are written in row groups of ``chunk_size`` rows.
+        This method requires the ``pyarrow`` package.
+
+        Parameters
+        ----------
+        output : str
+            Full path to the Parquet file.
+        chunk_size : int, optional
+            Maximum number of rows written at once. The default is ``100000``.
+
+        Returns
+        -------
+        bool
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logging.getLogger(__name__).error("Pyarrow is needed. Install it.")
+            return False
+        metadata = {b"pyaedt_solution_data": json.dumps(self._table_metadata()).encode("utf-8")}
+        writer = None
+        try:
+            for chunk in self._iter_table_chunks(chunk_size):
+                table = pa.Table.from_arrays([pa.array(v) for v in chunk.values()], names=list(chunk.keys()))
+                if writer is None:
+                    schema = table.schema.with_metadata(metadata)
+                    writer = pq.ParquetWriter(output, schema)
+                writer.write_table(table.cast(schema))
+        finally:
+            if writer is not None:
+                writer.close()
+        return True
+
+    @pyaedt_function_handler()
+    def export_data_to_arrow(self, output, chunk_size=100000):
+        """Save the Solution Data to an Arrow IPC file.
+
+        Columns are the same as in :func:`export_data_to_parquet`. Rows are written in
+        record batches of ``chunk_size`` rows. This method requires the ``pyarrow`` package.
+
+        Parameters
+        ----------
+        output : str
+            Full path to the Arrow file.
+        chunk_size : int, optional
+            Maximum number of rows written at once. The default is ``100000``.
+
+        Returns
+        -------
+        bool
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            logging.getLogger(__name__).error("Pyarrow is needed. Install it.")
+            return False
+        metadata = {b"pyaedt_solution_data": json.dumps(self._table_metadata()).encode("utf-8")}
+        writer = None
+        try:
+            for chunk in self._iter_table_chunks(chunk_size):
+                batch = pa.RecordBatch.from_arrays([pa.array(v) for v in chunk.values()], names=list(chunk.keys()))
+                if writer is None:
+                    schema = batch.schema.with_metadata(metadata)
+                    writer = pa.ipc.new_file(output, schema)
+                writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+        finally:
+            if writer is not None:
+                writer.close()
+        return True
+
+    @pyaedt_function_handler()
+    def export_data_to_hdf5(self, output, chunk_size=100000):
+        """Save the Solution Data to an HDF5 file.
+
+        Each column of :func:`export_data_to_parquet` is written as a resizable dataset that
+        is extended by ``chunk_size`` rows at a time. This method requires the ``h5py`` package.
+
+        Parameters
+        ----------
+        output : str
+            Full path to the HDF5 file.
+        chunk_size : int, optional
+            Maximum number of rows written at once. The default is ``100000``.
+
+        Returns
+        -------
+        bool
+        """
+        try:
+            import h5py
+        except ImportError:
+            logging.getLogger(__name__).error("H5py is needed. Install it.")
+            return False
+        metadata = self._table_metadata()
+        with h5py.File(output, "w") as f:
+            f.attrs["pyaedt_solution_data"] = json.dumps(metadata)
+            datasets = []
+            for chunk in self._iter_table_chunks(chunk_size):
+                for i, values in enumerate(chunk.values()):
+                    if values.dtype.kind in "US":
+                        values = values.astype(object)
+                    if len(datasets) <= i:
+                        dtype = h5py.string_dtype() if values.dtype == object else values.dtype
+                        datasets.append(
+                            f.create_dataset(
+                                "column_{}".format(i),
+                                shape=(0,),
+                                maxshape=(None,),
+                                dtype=dtype,
+                                chunks=(max(1, min(chunk_size, 65536)),),
+                            )
+                        )
+                    dataset = datasets[i]
+                    start = dataset.shape[0]
+                    dataset.resize((start + len(values),))
+                    dataset[start:] = values
+        return True
+
+    @classmethod
+    def _from_table_chunks(cls, metadata, chunks):
+        """Rebuild the Solution Data from the table columns written by the exporters.
+
+        Parameters
+        ----------
+        metadata : dict
+            Description of the columns returned by ``_table_metadata``.
+        chunks : generator
+            Dictionaries with the column names as keys and :class:`numpy.ndarray` as values.
+
+        Returns
+        -------
+        :class:`pyaedt.modules.solutions.SolutionData`
+        """
+        variables = metadata["variables"]
+        intrinsics = metadata["intrinsics"]
+        variations = []
+        current = {"key": None, "parts": None}
+
+        def flush():
+            if current["key"] is None:
+                return
+            columns = dict((k, np.concatenate(v)) for k, v in current["parts"].items())
+            sweeps = OrderedDict((name, list(OrderedDict.fromkeys(columns[name].tolist()))) for name in intrinsics)
+            real = OrderedDict()
+            imag = OrderedDict()
+            for expression, names in metadata["expressions"].items():
+                real[expression] = columns[names[0]].astype(float)
+                if len(names) > 1:
+                    imag[expression] = columns[names[1]].astype(float)
+            variations.append(
+                SolutionDataVariation(
+                    OrderedDict(zip(variables, current["key"])),
+                    sweeps,
+                    real,
+                    imag,
+                    metadata.get("units_sweeps", {}),
+                    metadata.get("units_data", {}),
+                )
+            )
+
+        for chunk in chunks:
+            size = len(chunk[metadata["columns"][0]])
+            if not size:
+                continue
+            boundaries = np.zeros(size, dtype=bool)
+            for name in variables:
+                boundaries[1:] |= chunk[name][1:] != chunk[name][:-1]
+            starts = [0] + np.flatnonzero(boundaries).tolist() + [size]
+            for start, stop in zip(starts[:-1], starts[1:]):
+                if start == stop:
+                    continue
+                key = tuple(chunk[name][start : start + 1].tolist()[0] for name in variables)
+                if key != current["key"]:
+                    flush()
+                    current["key"] = key
+                    current["parts"] = OrderedDict((k, []) for k in chunk)
+                for k, v in chunk.items():
+                    current["parts"][k].append(v[start:stop])
+        flush()
+        solution_data = cls(variations)
+        solution_data.primary_sweep = metadata.get("primary_sweep", solution_data.primary_sweep)
+        if metadata.get("active_expression", None) in solution_data.expressions:
+            solution_data.active_expression = metadata["active_expression"]
+        return solution_data
+
+    @classmethod
+    def from_parquet(cls, input_file, chunk_size=100000):
+        """Rebuild the Solution Data from a Parquet file written by :func:`export_data_to_parquet`.
+
+        AEDT is not needed. This method requires the ``pyarrow`` package.
+
+        Parameters
+        ----------
+        input_file : str
+            Full path to the Parquet file.
+        chunk_size : int, optional
+            Maximum number of rows read at once. The default is ``100000``.
+
+        Returns
+        -------
+        :class:`pyaedt.modules.solutions.SolutionData`
+        """
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(input_file)
+        metadata = json.loads(parquet_file.schema_arrow.metadata[b"pyaedt_solution_data"].decode("utf-8"))
+        chunks = (
+            OrderedDict(
+                (name, column.to_numpy(zero_copy_only=False)) for name, column in zip(batch.schema.names, batch.columns)
+            )
+            for batch in parquet_file.iter_batches(batch_size=chunk_size)
+        )
+        return cls._from_table_chunks(metadata, chunks)
+
+    @classmethod
+    def from_arrow(cls, input_file):
+        """Rebuild the Solution Data from an Arrow IPC file written by :func:`export_data_to_arrow`.
+
+        AEDT is not needed. The file is memory-mapped and read one record batch at a time.
+        This method requires the ``pyarrow`` package.
+
+        Parameters
+        ----------
+        input_file : str
+            Full path to the Arrow file.
+
+        Returns
+        -------
+        :class:`pyaedt.modules.solutions.SolutionData`
+        """
+        import pyarrow as pa
+
+        with pa.memory_map(input_file, "r") as source:
+            reader = pa.ipc.open_file(source)
+            metadata = json.loads(reader.schema.metadata[b"pyaedt_solution_data"].decode("utf-8"))
+            chunks = (
+                OrderedDict(
+                    (name, column.to_numpy(zero_copy_only=False))
+                    for name, column in zip(reader.schema.names, reader.get_batch(i).columns)
+                )
+                for i in range(reader.num_record_batches)
+            )
+            return cls._from_table_chunks(metadata, chunks)
+
+    @classmethod
+    def from_hdf5(cls, input_file, chunk_size=100000):
+        """Rebuild the Solution Data from an HDF5 file written by :func:`export_data_to_hdf5`.
+
+        AEDT is not needed. This method requires the ``h5py`` package.
+
+        Parameters
+        ----------
+        input_file : str
+            Full path to the HDF5 file.
+        chunk_size : int, optional
+            Maximum number of rows read at once. The default is ``100000``.
+
+        Returns
+        -------
+        :class:`pyaedt.modules.solutions.SolutionData`
+        """
+        import h5py
+
+        with h5py.File(input_file, "r") as f:
+            metadata = json.loads(f.attrs["pyaedt_solution_data"])
+            datasets = []
+            for i in range(len(metadata["columns"])):
+                dataset = f["column_{}".format(i)]
+                datasets.append(dataset.asstr() if h5py.check_string_dtype(dataset.dtype) else dataset)
+            size = f["column_0"].shape[0]
+
+            def chunks():
+                for start in range(0, size, chunk_size):
+                    yield OrderedDict(
+                        (name, np.asarray(dataset[start : start + chunk_size]))
+                        for name, dataset in zip(metadata["columns"], datasets)
+                    )
+
+            return cls._from_table_chunks(metadata, chunks())
+
+    @pyaedt_function_handler()
+    def export_snapshot(self, output, compressed=False):
+        """Save a snapshot of the Solution Data to a numpy ``.npz`` file.
+
+        The snapshot contains the expressions, the intrinsics, the design variables, the
+        units, the active variation, and the raw values. Real expressions are saved as float
+        arrays and complex expressions as complex arrays. The snapshot can be loaded
+        without AEDT with :func:`from_snapshot`.
+
+        Parameters
+        ----------
+        output : str
+            Full path to the ``.npz`` file.
+        compressed : bool, optional
+            Whether to compress the file. The default is ``False``.
+
+        Returns
+        -------
+        bool
+        """
+        if not np:
+            logging.getLogger(__name__).error("Numpy is needed. Install it.")
+            return False
+        arrays = OrderedDict()
+        expressions = []
+        for i, expression in enumerate(self.expressions):
+            is_complex = bool(self._original_data[0].IsDataComplex(expression))
+            expressions.append([expression, is_complex])
+            solution = self._get_solution(expression)
+            if isinstance(solution, np.ndarray):
+                arrays["expression_{}".format(i)] = solution if is_complex else solution.real
+            else:
+                for var_id, values in enumerate(solution):
+                    arrays["expression_{}_{}".format(i, var_id)] = values if is_complex else values.real
+        for k, name in enumerate(self._axes_names):
+            if self._uniform_axes:
+                arrays["axis_{}".format(k)] = np.asarray(self._axes_values[0][k])
+            else:
+                for var_id, axes in enumerate(self._axes_values):
+                    arrays["axis_{}_{}".format(k, var_id)] = np.asarray(axes[k])
+        nominal = self._original_data.index(self.nominal_variation)
+        active = self.find_variations(**self.active_variation)
+        metadata = {
+            "version": 1,
+            "expressions": expressions,
+            "intrinsics": list(self._axes_names),
+            "uniform_axes": self._uniform_axes,
+            "stacked": [isinstance(self._solutions[e], np.ndarray) for e in self.expressions],
+            "variations": [list(comb.items()) for comb in self.variations],
+            "units_sweeps": dict(self.units_sweeps),
+            "units_data": dict(self.units_data),
+            "nominal_variation": nominal,
+            "active_variation": active[0] if active else nominal,
+            "active_intrinsic": list(self.active_intrinsic.items()),
+            "active_expression": self.active_expression,
+            "primary_sweep": self.primary_sweep,
+        }
+        arrays["metadata"] = np.array(json.dumps(metadata))
+        with open(output, "wb") as f:
+            if compressed:
+                np.savez_compressed(f, **arrays)
+            else:
+                np.savez(f, **arrays)
+        return True
+
+    @classmethod
+    def from_snapshot(cls, input_file):
+        """Rebuild the Solution Data from a snapshot written by :func:`export_snapshot`.
+
+        AEDT is not needed. All the methods of the Solution Data are available on the
+        returned object.
+
+        Parameters
+        ----------
+        input_file : str
+            Full path to the ``.npz`` file.
+
+        Returns
+        -------
+        :class:`pyaedt.modules.solutions.SolutionData`
+        """
+        with np.load(input_file, allow_pickle=False) as f:
+            snapshot = dict((name, f[name]) for name in f.files)
+        metadata = json.loads(str(snapshot["metadata"]))
+        variations = []
+        for var_id, variables in enumerate(metadata["variations"]):
+            sweeps = OrderedDict()
+            for k, name in enumerate(metadata["intrinsics"]):
+                if metadata["uniform_axes"]:
+                    sweeps[name] = snapshot["axis_{}".format(k)].tolist()
+                else:
+                    sweeps[name] = snapshot["axis_{}_{}".format(k, var_id)].tolist()
+            real = OrderedDict()
+            imag = OrderedDict()
+            for i, (expression, is_complex) in enumerate(metadata["expressions"]):
+                if metadata["stacked"][i]:
+                    values = snapshot["expression_{}".format(i)][var_id].reshape(-1)
+                else:
+                    values = snapshot["expression_{}_{}".format(i, var_id)].reshape(-1)
+                real[expression] = values.real
+                if is_complex:
+                    imag[expression] = values.imag
+            variations.append(
+                SolutionDataVariation(
+                    OrderedDict(variables),
+                    sweeps,
+                    real,
+                    imag,
+                    metadata["units_sweeps"],
+                    metadata["units_data"],
+                )
+            )
+        solution_data = cls(variations)
+        solution_data.set_active_variation(metadata["nominal_variation"])
+        solution_data.active_variation = solution_data.variations[metadata["active_variation"]]
+        solution_data.active_intrinsic = OrderedDict(metadata["active_intrinsic"])
+        solution_data.active_expression = metadata["active_expression"]
+        solution_data.primary_sweep = metadata["primary_sweep"]
+        return solution_data
+
     @pyaedt_function_handler()
     def plot(
         self,
@@ -934,63 +1799,132 @@ class SolutionData(object):
         """
         if is_ironpython:
             return False
-        u = self.variation_values(u_axis)
-        v = self.variation_values(v_axis)
+        var_id = self._variations_index[tuple(self.active_variation[v] for v in self.active_variation)]
+        axes = [self._axes_names.index(name) for name in ["Freq", v_axis, u_axis]]
+        components = []
+        for component in ["X", "Y", "Z"]:
+            values = self._get_solution(curve_header + component)[var_id]
+            components.append(np.transpose(values, axes + [i for i in range(values.ndim) if i not in axes]))
+        E_comp = np.stack(components)
+        E_time_comp = self._ifft_arrays(E_comp, 1, window="hanning" if window else None, shift=True)
+        E_time = np.abs(np.sqrt(np.sum(np.square(E_time_comp), axis=0)))
+        self._ifft = E_time.reshape(E_time.shape[:3])
 
-        freq = self.variation_values("Freq")
-        if self.enable_pandas_output:
-            E_realx = np.reshape(self._solutions_real[curve_header + "X"].copy().values, (len(freq), len(v), len(u)))
-            E_imagx = np.reshape(self._solutions_imag[curve_header + "X"].copy().values, (len(freq), len(v), len(u)))
-            E_realy = np.reshape(self._solutions_real[curve_header + "Y"].copy().values, (len(freq), len(v), len(u)))
-            E_imagy = np.reshape(self._solutions_imag[curve_header + "Y"].copy().values, (len(freq), len(v), len(u)))
-            E_realz = np.reshape(self._solutions_real[curve_header + "Z"].copy().values, (len(freq), len(v), len(u)))
-            E_imagz = np.reshape(self._solutions_imag[curve_header + "Z"].copy().values, (len(freq), len(v), len(u)))
-        else:
-            vals_real_Ex = [j for j in self._solutions_real[curve_header + "X"].values()]
-            vals_imag_Ex = [j for j in self._solutions_imag[curve_header + "X"].values()]
-            vals_real_Ey = [j for j in self._solutions_real[curve_header + "Y"].values()]
-            vals_imag_Ey = [j for j in self._solutions_imag[curve_header + "Y"].values()]
-            vals_real_Ez = [j for j in self._solutions_real[curve_header + "Z"].values()]
-            vals_imag_Ez = [j for j in self._solutions_imag[curve_header + "Z"].values()]
-
-            E_realx = np.reshape(vals_real_Ex, (len(freq), len(v), len(u)))
-            E_imagx = np.reshape(vals_imag_Ex, (len(freq), len(v), len(u)))
-            E_realy = np.reshape(vals_real_Ey, (len(freq), len(v), len(u)))
-            E_imagy = np.reshape(vals_imag_Ey, (len(freq), len(v), len(u)))
-            E_realz = np.reshape(vals_real_Ez, (len(freq), len(v), len(u)))
-            E_imagz = np.reshape(vals_imag_Ez, (len(freq), len(v), len(u)))
-
-        Temp_E_compx = E_realx + 1j * E_imagx  # Here is the complex FD data matrix, ready for transforming
-        Temp_E_compy = E_realy + 1j * E_imagy
-        Temp_E_compz = E_realz + 1j * E_imagz
-
-        E_compx = np.zeros((len(freq), len(v), len(u)), dtype="complex_")
-        E_compy = np.zeros((len(freq), len(v), len(u)), dtype="complex_")
-        E_compz = np.zeros((len(freq), len(v), len(u)), dtype="complex_")
+        return self._ifft
+
+    @staticmethod
+    def _ifft_arrays(data, axis, window=None, n_points=None, real=False, shift=False):
+        """Apply windowing, zero-padding and an IFFT along one axis of an array.
+
+        Parameters
+        ----------
+        data : :class:`numpy.ndarray`
+            Complex frequency-domain data.
+        axis : int
+            Axis of the frequencies.
+        window : str, optional
+            Name of the numpy window function, such as ``"hanning"``. The default is ``None``.
+        n_points : int, optional
+            Number of time points. The default is ``None``, in which case the number of
+            frequencies is used for a complex IFFT and ``2 * (frequencies - 1)`` for a real IFFT.
+        real : bool, optional
+            Whether to use a real IFFT of a one-sided spectrum. The default is ``False``.
+        shift : bool, optional
+            Whether to shift the zero frequency to the first position before the transform.
+            The default is ``False``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        n_freq = data.shape[axis]
         if window:
-            timewin = np.hanning(len(freq))
+            shape = [1] * data.ndim
+            shape[axis] = n_freq
+            data = data * getattr(np, window)(n_freq).reshape(shape)
+        if shift:
+            data = np.fft.fftshift(data, axis)
+        if real:
+            return np.fft.irfft(data, n_points if n_points else 2 * (n_freq - 1), axis)
+        return np.fft.ifft(data, n_points if n_points else n_freq, axis)
 
-            for row in range(0, len(v)):
-                for col in range(0, len(u)):
-                    E_compx[:, row, col] = np.multiply(Temp_E_compx[:, row, col], timewin)
-                    E_compy[:, row, col] = np.multiply(Temp_E_compy[:, row, col], timewin)
-                    E_compz[:, row, col] = np.multiply(Temp_E_compz[:, row, col], timewin)
-        else:
-            E_compx = Temp_E_compx
-            E_compy = Temp_E_compy
-            E_compz = Temp_E_compz
-
-        E_time_x = np.fft.ifft(np.fft.fftshift(E_compx, 0), len(freq), 0, None)
-        E_time_y = np.fft.ifft(np.fft.fftshift(E_compy, 0), len(freq), 0, None)
-        E_time_z = np.fft.ifft(np.fft.fftshift(E_compz, 0), len(freq), 0, None)
-        E_time = np.zeros((np.size(freq), np.size(v), np.size(u)))
-        for i in range(0, len(freq)):
-            E_time[i, :, :] = np.abs(
-                np.sqrt(np.square(E_time_x[i, :, :]) + np.square(E_time_y[i, :, :]) + np.square(E_time_z[i, :, :]))
-            )
-        self._ifft = E_time
+    @pyaedt_function_handler()
+    def time_domain_transform(self, expressions=None, sweep="Freq", window=None, n_points=None, real=False):
+        """Transform expressions from the frequency domain to the time domain.
 
-        return self._ifft
+        All the selected expressions and variations are windowed, zero-padded, and
+        transformed with one IFFT call on a single array.
+
+        Parameters
+        ----------
+        expressions : str or list, optional
+            Expressions to transform. The default is ``None``, in which case all
+            expressions are transformed.
+        sweep : str, optional
+            Name of the frequency sweep. The default is ``"Freq"``.
+        window : str, optional
+            Window to apply to the spectrum. Options are ``"hanning"``, ``"hamming"``,
+            ``"blackman"``, and ``"bartlett"``. The default is ``None``, in which case no
+            window is applied.
+        n_points : int, optional
+            Number of time points. Values larger than the default zero-pad the spectrum.
+            The default is ``None``, in which case the number of frequencies is used for a
+            complex IFFT and ``2 * (frequencies - 1)`` for a real IFFT.
+        real : bool, optional
+            Whether the spectrum is one-sided and a real IFFT is used. The default is ``False``.
+
+        Returns
+        -------
+        :class:`pyaedt.modules.solutions.SolutionData`
+            Time-domain Solution Data, where the frequency sweep is replaced by a ``"Time"``
+            sweep in seconds.
+
+        Examples
+        --------
+        >>> time_data = solution_data.time_domain_transform(["S(1,1)", "S(2,1)"], window="hanning", n_points=4096)
+        >>> time_data.primary_sweep = "Time"
+        >>> time_data.data_real("S(2,1)")
+        """
+        if is_ironpython or not np:
+            return False
+        if not expressions:
+            expressions = self.expressions
+        elif isinstance(expressions, str):
+            expressions = [expressions]
+        if sweep not in self._axes_names or not self._uniform_axes:
+            return False
+        if window and window not in ["hanning", "hamming", "blackman", "bartlett"]:
+            return False
+        solutions = [self._get_solution(expression) for expression in expressions]
+        if any(isinstance(solution, list) for solution in solutions):
+            return False
+        axis = self._axes_names.index(sweep) + 2
+        time_data = self._ifft_arrays(np.stack(solutions), axis, window=window, n_points=n_points, real=real)
+        freq = np.asarray(self._axes_values[0][axis - 2], dtype=float)
+        freq = freq * AEDT_UNITS["Freq"].get(self.units_sweeps.get(sweep, None), 1.0)
+        df = (freq[-1] - freq[0]) / (len(freq) - 1) if len(freq) > 1 else freq[0]
+        n_time = time_data.shape[axis]
+        time = (np.arange(n_time) / (n_time * df)).tolist()
+
+        sweeps = OrderedDict()
+        for name, values in zip(self._axes_names, self._axes_values[0]):
+            sweeps["Time" if name == sweep else name] = time if name == sweep else values
+        sweep_units = dict(self.units_sweeps)
+        sweep_units.pop(sweep, None)
+        sweep_units["Time"] = "s"
+        variations = []
+        for var_id, comb in enumerate(self.variations):
+            real_values = OrderedDict()
+            imag_values = OrderedDict()
+            for i, expression in enumerate(expressions):
+                values = time_data[i, var_id].reshape(-1)
+                real_values[expression] = values.real
+                if not real:
+                    imag_values[expression] = values.imag
+            variations.append(
+                SolutionDataVariation(comb, sweeps, real_values, imag_values, sweep_units, self.units_data)
+            )
+        return SolutionData(variations)
 
     @pyaedt_function_handler()
     def ifft_to_file(
@@ -1002,6 +1936,7 @@ class SolutionData(object):
         num_frames=None,
         csv_dir=None,
         name_str="res_",
+        binary=False,
     ):
         """Save IFFT Matrix to a list of csv files (one per time step).
 
@@ -1021,11 +1956,16 @@ class SolutionData(object):
             Output path
         name_str : str, optional
             csv file header.
+        binary : bool, optional
+            Whether to stream all the frames to a single ``.npy`` file of shape
+            ``(frames, points, 4)`` instead of writing one csv file per frame.
+            The default is ``False``.
 
         Returns
         -------
         str
-            Path to file containing the list of csv files.
+            Path to file containing the list of csv files, or path to the ``.npy`` file
+            when ``binary=True``.
         """
         if not coord_system_center:
             coord_system_center = [0, 0, 0]
@@ -1040,7 +1980,10 @@ class SolutionData(object):
             frames = num_frames
         else:
             frames = t_matrix.shape[0]
-        csv_list = []
+        x_coord, y_coord = np.meshgrid(np.asarray(x_c_list) + adj_x, np.asarray(y_c_list) + adj_y)
+        x_coord = x_coord.reshape(-1)
+        y_coord = y_coord.reshape(-1)
+        z_coord = np.full(x_coord.shape, adj_z, dtype=float)
         if os.path.exists(csv_dir):
             files = [os.path.join(csv_dir, f) for f in os.listdir(csv_dir) if name_str in f and ".csv" in f]
             for file in files:
@@ -1048,20 +1991,30 @@ class SolutionData(object):
         else:
             os.mkdir(csv_dir)
 
+        if binary:
+            output = os.path.join(csv_dir, name_str + "frames.npy")
+            frames_array = np.lib.format.open_memmap(output, mode="w+", dtype=float, shape=(frames, len(x_coord), 4))
+            for frame in range(frames):
+                frames_array[frame, :, 0] = x_coord
+                frames_array[frame, :, 1] = y_coord
+                frames_array[frame, :, 2] = z_coord
+                if db_val:
+                    frames_array[frame, :, 3] = 10.0 * np.log10(np.abs(t_matrix[frame].reshape(-1)))
+                else:
+                    frames_array[frame, :, 3] = t_matrix[frame].reshape(-1)
+            frames_array.flush()
+            del frames_array
+            return output
+
+        csv_list = []
         for frame in range(frames):
             output = os.path.join(csv_dir, name_str + str(frame) + ".csv")
+            if db_val:
+                val = 10.0 * np.log10(np.abs(t_matrix[frame].reshape(-1)))
+            else:
+                val = t_matrix[frame].reshape(-1)
             list_full = [["x", "y", "z", "val"]]
-            for i, y in enumerate(y_c_list):
-                for j, x in enumerate(x_c_list):
-                    y_coord = y + adj_y
-                    x_coord = x + adj_x
-                    z_coord = adj_z
-                    if db_val:
-                        val = 10.0 * np.log10(np.abs(t_matrix[frame, i, j]))
-                    else:
-                        val = t_matrix[frame, i, j]
-                    row_lst = [x_coord, y_coord, z_coord, val]
-                    list_full.append(row_lst)
+            list_full.extend([[x, y, adj_z, v] for x, y, v in zip(x_coord.tolist(), y_coord.tolist(), val.tolist())])
             write_csv(output, list_full, delimiter=",")
             csv_list.append(output)
 
@@ -1074,6 +2027,69 @@ class SolutionData(object):
         return txt_file_name
 
 
+class SolutionDataVariation(object):
+    """Contains the solution of one variation outside of AEDT.
+
+    This class has the same interface as the objects returned by the
+    ``GetSolutionDataPerVariation`` method, which allows a
+    :class:`pyaedt.modules.solutions.SolutionData` object to be built from saved data.
+
+    Parameters
+    ----------
+    variables : dict
+        Names and values of the design variables.
+    sweeps : dict
+        Names and unique values of the intrinsic sweeps, with the slowest varying sweep first.
+    real : dict
+        Real values of each expression, flattened over the intrinsic sweeps.
+    imag : dict, optional
+        Imaginary values of the complex expressions. The default is ``None``,
+        in which case all expressions are real.
+    sweep_units : dict, optional
+        Units of the intrinsic sweeps. The default is ``None``.
+    data_units : dict, optional
+        Units of the expressions. The default is ``None``.
+    """
+
+    def __init__(self, variables, sweeps, real, imag=None, sweep_units=None, data_units=None):
+        self._variables = variables
+        self._sweeps = sweeps
+        self._real = real
+        self._imag = imag if imag else {}
+        self._sweep_units = sweep_units if sweep_units else {}
+        self._data_units = data_units if data_units else {}
+
+    def GetDesignVariableNames(self):
+        return list(self._variables.keys())
+
+    def GetDesignVariableValue(self, name):
+        return self._variables[name]
+
+    def GetSweepNames(self):
+        return list(reversed(list(self._sweeps.keys())))
+
+    def GetSweepValues(self, name, full=False):
+        return self._sweeps[name]
+
+    def GetSweepUnits(self, name):
+        return self._sweep_units.get(name, None)
+
+    def GetDataExpressions(self):
+        return list(self._real.keys())
+
+    def GetRealDataValues(self, expression, full=False):
+        return self._real[expression]
+
+    def GetImagDataValues(self, expression, full=False):
+        return self._imag[expression]
+
+    def IsDataComplex(self, expression):
+        return expression in self._imag
+
+    def GetDataUnits(self, expression):
+        return self._data_units.get(expression, "")
+
+
 class FfdSolutionData(object):
     """Contains information from the far field solution data.
 
@@ -1087,6 +2103,13 @@ class FfdSolutionData(object):
     frequencies : list, str, int, or float
         List of frequencies.
         If the input is not a list, it is assumed to be a single frequency.
+    reduced_precision : bool, optional
+        Whether to store the element patterns in single precision to halve their memory.
+        Beams are then combined in chunks of ports and accumulated in double precision, and
+        ``combine_farfield`` reports the bound of the error against full precision in ``"rETotal_ErrorBound"``.
+        The default is ``False``.
+    port_chunk_size : int, optional
+        Number of ports combined at the same time when ``reduced_precision=True``. The default is ``64``.
 
     Examples
     --------
@@ -1109,10 +2132,16 @@ class FfdSolutionData(object):
         self,
         eep_files,
         frequencies,
+        reduced_precision=False,
+        port_chunk_size=64,
     ):
         self.logger = logging.getLogger(__name__)
 
-        self._raw_data = {}
+        self._reduced_precision = reduced_precision
+        self._port_chunk_size = max(int(port_chunk_size), 1)
+        self._element_patterns = {}
+        self._element_patterns_frequency = None
+        self._error_bounds = {}
         self.farfield_data = {}
         self._eep_file_info_list = []
         self.port_position = {}
@@ -1154,6 +2183,7 @@ class FfdSolutionData(object):
         self._cell_position = []
         self._lattice_vector = []
         self.mesh = None
+        self._mesh_directions = None
 
         for eep in eep_files:
             metadata_file = os.path.join(os.path.dirname(eep), "eep.json")
@@ -1209,6 +2239,11 @@ class FfdSolutionData(object):
         else:  # pragma: no cover
             self.logger.error("Frequency not available.")
 
+    @property
+    def reduced_precision(self):
+        """Whether the element patterns are stored in single precision."""
+        return self._reduced_precision
+
     @property
     def frequency_value(self):
         """Frequency value in Hz."""
@@ -1281,22 +2316,25 @@ class FfdSolutionData(object):
             self.farfield_data = self.combine_farfield()
 
     @pyaedt_function_handler()
-    def _assign_weight(self, a, b):
+    def _assign_weight(self, a, b, taper=None):
         """Assign weight to array.
 
         Parameters
         ----------
-        a : int
+        a : int or :class:`numpy.ndarray`
             Index of array, column.
-        b : int
+        b : int or :class:`numpy.ndarray`
             Index of array, row.
+        taper : str, optional
+            Taper type. The default is ``None``, in which case the active taper is used.
 
         Returns
         -------
-        float
+        float or :class:`numpy.ndarray`
             Weight applied to specific index of the array.
         """
-        taper = self.taper
+        if not taper:
+            taper = self.taper
 
         if taper.lower() in ("flat", "uniform") or not self._is_array[self._freq_index]:
             return 1
@@ -1326,32 +2364,32 @@ class FfdSolutionData(object):
                 w1 = 1
             else:
                 w1 = (1 - edgeTaper) * (
-                    math.cos(math.pi * length_in_direction1 / max_length_in_dir1)
+                    np.cos(np.pi * length_in_direction1 / max_length_in_dir1)
                 ) ** cosinePow + edgeTaper
             if max_length_in_dir2 < threshold:
                 w2 = 1
             else:
                 w2 = (1 - edgeTaper) * (
-                    math.cos(math.pi * length_in_direction2 / max_length_in_dir2)
+                    np.cos(np.pi * length_in_direction2 / max_length_in_dir2)
                 ) ** cosinePow + edgeTaper
         elif taper.lower() == "triangular":  # Triangular
             if max_length_in_dir1 < threshold:
                 w1 = 1
             else:
-                w1 = (1 - edgeTaper) * (1 - (math.fabs(length_in_direction1) / (max_length_in_dir1 / 2))) + edgeTaper
+                w1 = (1 - edgeTaper) * (1 - (np.abs(length_in_direction1) / (max_length_in_dir1 / 2))) + edgeTaper
             if max_length_in_dir2 < threshold:
                 w2 = 1
             else:
-                w2 = (1 - edgeTaper) * (1 - (math.fabs(length_in_direction2) / (max_length_in_dir2 / 2))) + edgeTaper
+                w2 = (1 - edgeTaper) * (1 - (np.abs(length_in_direction2) / (max_length_in_dir2 / 2))) + edgeTaper
         elif taper.lower() == "hamming":  # Hamming Window
             if max_length_in_dir1 < threshold:
                 w1 = 1
             else:
-                w1 = 0.54 - 0.46 * math.cos(2 * math.pi * (length_in_direction1 / max_length_in_dir1 - 0.5))
+                w1 = 0.54 - 0.46 * np.cos(2 * np.pi * (length_in_direction1 / max_length_in_dir1 - 0.5))
             if max_length_in_dir2 < threshold:
                 w2 = 1
             else:
-                w2 = 0.54 - 0.46 * math.cos(2 * math.pi * (length_in_direction2 / max_length_in_dir2 - 0.5))
+                w2 = 0.54 - 0.46 * np.cos(2 * np.pi * (length_in_direction2 / max_length_in_dir2 - 0.5))
         else:
             return 0
 
@@ -1361,27 +2399,28 @@ class FfdSolutionData(object):
         """Shift element phase for a specific Theta and Phi scan angle in degrees.
 
         This method calculates phase shifts between array elements in A and B directions given the lattice vector.
+        Indices and scan angles can be numpy arrays, in which case they are broadcast against each other.
 
         Parameters
         ----------
-        a : int
+        a : int or :class:`numpy.ndarray`
             Index of array, column.
-        b : int
+        b : int or :class:`numpy.ndarray`
             Index of array, row.
-        theta : float, optional
+        theta : float or :class:`numpy.ndarray`, optional
             Theta scan angle in degrees. The default is ``0.0``.
-        phi : float, optional
+        phi : float or :class:`numpy.ndarray`, optional
             Phi scan angle in degrees. The default is ``0.0``.
 
         Returns
         -------
-        float
+        float or :class:`numpy.ndarray`
             Phase shift in degrees.
         """
         c = 299792458
         k = (2 * math.pi * self.frequency_value) / c
-        a = int(a)
-        b = int(b)
+        a = np.asarray(a).astype(int)
+        b = np.asarray(b).astype(int)
         theta = np.deg2rad(theta)
         phi = np.deg2rad(phi)
 
@@ -1397,6 +2436,168 @@ class FfdSolutionData(object):
 
         return np.rad2deg(phase_shift)
 
+    @pyaedt_function_handler()
+    def _port_weights(self, phi_scan=0, theta_scan=0, taper=None):
+        """Compute the complex excitation of each port for one or more scan angles.
+
+        Parameters
+        ----------
+        phi_scan : float or list, optional
+            Phi scan angles in degrees. The default is ``0.0``.
+        theta_scan : float or list, optional
+            Theta scan angles in degrees. The default is ``0.0``.
+        taper : str, optional
+            Taper type. The default is ``None``, in which case the active taper is used.
+
+        Returns
+        -------
+        tuple
+            Complex weights with shape ``(beams, ports)`` and the power weight of each port.
+            Ports are sorted as in ``all_port_names``.
+        """
+        phi_scan, theta_scan = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(phi_scan, dtype=float)), np.atleast_1d(np.asarray(theta_scan, dtype=float))
+        )
+        index = np.array([self.port_index[port_name] for port_name in self.all_port_names]) - 1
+        a = index[:, 0]
+        b = index[:, 1]
+        if self._is_array[self._freq_index]:
+            phase_shift = self._phase_shift_steering(a[None, :], b[None, :], theta_scan[:, None], phi_scan[:, None])
+            magnitude = self._assign_weight(a=a, b=b, taper=taper)
+        else:
+            phase_shift = np.zeros((len(phi_scan), len(a)))
+            magnitude = 1
+        w_mag = magnitude * np.asarray(self.mag_offset, dtype=float)
+        w_ang = np.deg2rad(np.asarray(self.phase_offset, dtype=float) + phase_shift)
+        return np.sqrt(w_mag) * np.exp(1j * w_ang), w_mag
+
+    @pyaedt_function_handler()
+    def _wave_vectors(self, k):
+        """Compute the wave vector components at every point of the far field grid.
+
+        Parameters
+        ----------
+        k : float
+            Wave number.
+
+        Returns
+        -------
+        tuple
+            Flattened ``kx``, ``ky`` and ``kz`` arrays.
+        """
+        ph, th = np.meshgrid(np.deg2rad(self._element_patterns["Phi"]), np.deg2rad(self._element_patterns["Theta"]))
+        return (
+            (k * np.sin(th) * np.cos(ph)).ravel(),
+            (k * np.sin(th) * np.sin(ph)).ravel(),
+            (k * np.cos(th)).ravel(),
+        )
+
+    @pyaedt_function_handler()
+    def _get_element_patterns(self):
+        """Get the element patterns of all ports shifted to the port positions.
+
+        The position phase of each port is applied in place the first time the patterns are used
+        at the active frequency.
+
+        Returns
+        -------
+        dict
+            Element patterns. ``"rETheta"`` and ``"rEPhi"`` are complex matrices with shape
+            ``(ports, points)``.
+        """
+        frequency = self.frequency_value
+        if self._element_patterns_frequency != frequency:
+            previous_frequency = self._element_patterns_frequency or 0.0
+            kx, ky, kz = self._wave_vectors(2 * np.pi * (frequency - previous_frequency) / 299792458)
+            for port_id, port_name in enumerate(self.all_port_names):
+                xyz_pos = self.port_position[port_name]
+                position_phase = np.exp(1j * (xyz_pos[0] * kx + xyz_pos[1] * ky + xyz_pos[2] * kz))
+                self._element_patterns["rETheta"][port_id] *= position_phase
+                self._element_patterns["rEPhi"][port_id] *= position_phase
+            self._element_patterns_frequency = frequency
+        return self._element_patterns
+
+    @pyaedt_function_handler()
+    def _combine_element_patterns(self, weights, error_bound=False):
+        """Combine the element patterns for one or more sets of port weights.
+
+        Parameters
+        ----------
+        weights : :class:`numpy.ndarray`
+            Complex weights with shape ``(beams, ports)``.
+        error_bound : bool, optional
+            Whether to also compute the bound of the error caused by the single precision storage of the
+            element patterns. The default is ``False``.
+
+        Returns
+        -------
+        tuple
+            Combined ``rETheta`` and ``rEPhi`` fields with shape ``(beams, points)``. When ``error_bound=True``,
+            the bound of the error of ``rETotal`` with shape ``(beams, points)`` is also returned.
+        """
+        element_patterns = self._get_element_patterns()
+        kx, ky, kz = self._wave_vectors(2 * np.pi * self.frequency_value / 299792458)
+        origin = self.origin
+        origin_shift = np.exp(-1j * (origin[0] * kx + origin[1] * ky + origin[2] * kz))
+        n_ports, n_points = element_patterns["rETheta"].shape
+        if not self._reduced_precision:
+            rETheta = np.dot(weights, element_patterns["rETheta"]) * origin_shift
+            rEPhi = np.dot(weights, element_patterns["rEPhi"]) * origin_shift
+            if error_bound:
+                return rETheta, rEPhi, np.zeros(rETheta.shape)
+            return rETheta, rEPhi
+
+        # Each chunk of ports is combined in single precision and accumulated in double precision
+        rETheta = np.zeros((len(weights), n_points), dtype=complex)
+        rEPhi = np.zeros((len(weights), n_points), dtype=complex)
+        weights_single = weights.astype(np.complex64)
+        for start in range(0, n_ports, self._port_chunk_size):
+            stop = min(start + self._port_chunk_size, n_ports)
+            chunk_weights = weights_single[:, start:stop]
+            rETheta += np.dot(chunk_weights, element_patterns["rETheta"][start:stop])
+            rEPhi += np.dot(chunk_weights, element_patterns["rEPhi"][start:stop])
+        rETheta *= origin_shift
+        rEPhi *= origin_shift
+        if not error_bound:
+            return rETheta, rEPhi
+        return rETheta, rEPhi, np.array([self._precision_error_bound(np.abs(i)) for i in weights])
+
+    @pyaedt_function_handler()
+    def _precision_error_bound(self, abs_weights):
+        """Compute the bound of the error of ``rETotal`` caused by the single precision storage.
+
+        The bound only depends on the magnitude of the port weights, not on the scan angle,
+        so it is computed once for each set of magnitudes.
+
+        Parameters
+        ----------
+        abs_weights : :class:`numpy.ndarray`
+            Magnitude of the weight of each port.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Bound of the error at each point.
+        """
+        key = (self._element_patterns_frequency, abs_weights.astype(np.float32).tobytes())
+        if key not in self._error_bounds:
+            element_patterns = self._element_patterns
+            n_ports, n_points = element_patterns["rETheta"].shape
+            abs_theta = np.zeros(n_points)
+            abs_phi = np.zeros(n_points)
+            for start in range(0, n_ports, self._port_chunk_size):
+                stop = min(start + self._port_chunk_size, n_ports)
+                abs_theta += np.dot(abs_weights[start:stop], np.abs(element_patterns["rETheta"][start:stop]))
+                abs_phi += np.dot(abs_weights[start:stop], np.abs(element_patterns["rEPhi"][start:stop]))
+            # Rounding of the stored patterns and of their position phase, of the weights, and of the chunk sums
+            unit_roundoff = np.finfo(np.float32).eps / 2
+            chunk_size = min(self._port_chunk_size, n_ports)
+            chunk_roundoff = chunk_size * unit_roundoff / (1 - chunk_size * unit_roundoff)
+            factor = (1 + unit_roundoff) ** 3 * (1 + chunk_roundoff) - 1
+            # Only the bound of the last magnitudes is kept, so the memory used does not grow
+            self._error_bounds = {key: factor * np.sqrt(abs_theta**2 + abs_phi**2)}
+        return self._error_bounds[key]
+
     @pyaedt_function_handler()
     def combine_farfield(self, phi_scan=0, theta_scan=0):
         """Compute the far field pattern calculated for a specific phi and theta scan angle requested.
@@ -1413,73 +2614,17 @@ class FfdSolutionData(object):
         dict
             Far field data dictionary.
         """
-        w_dict = {}
-        w_dict_ang = {}
-        w_dict_mag = {}
-        port_positions = {}
-        port_cont = 0
-        initial_port = self.all_port_names[0]
-
-        # Obtain weights for each port
-        for port_name in self.all_port_names:
-            index_str = self.port_index[port_name]
-            a = index_str[0] - 1
-            b = index_str[1] - 1
-            if self._is_array[self._freq_index]:
-                phase_shift = self._phase_shift_steering(a, b, theta_scan, phi_scan)
-                magnitude = self._assign_weight(a=a, b=b)
-            else:
-                phase_shift = 0
-                magnitude = 1
-            w_mag = magnitude * self.mag_offset[port_cont]
-            w_ang = np.deg2rad(self.phase_offset[port_cont] + phase_shift)
-            w_dict[port_name] = np.sqrt(w_mag) * np.exp(1j * w_ang)
-            w_dict_ang[port_name] = w_ang
-            w_dict_mag[port_name] = w_mag
-            port_positions[port_name] = self.port_position[port_name]
-            port_cont += 1
-
-        # Combine farfield of each port
-        length_of_ff_data = len(self._raw_data[initial_port]["rETheta"])
-        theta_range = self._raw_data[initial_port]["Theta"]
-        phi_range = self._raw_data[initial_port]["Phi"]
+        weights, w_mag = self._port_weights(phi_scan, theta_scan)
+        incident_power = np.sum(w_mag)
+        fields = self._combine_element_patterns(weights, error_bound=self._reduced_precision)
+        rETheta_fields_sum, rEphi_fields_sum = fields[:2]
+
+        theta_range = self._element_patterns["Theta"]
+        phi_range = self._element_patterns["Phi"]
         Ntheta = len(theta_range)
         Nphi = len(phi_range)
-        incident_power = 0
-        ph, th = np.meshgrid(self._raw_data[initial_port]["Phi"], self._raw_data[initial_port]["Theta"])
-        ph = np.deg2rad(ph)
-        th = np.deg2rad(th)
-        c = 299792458
-        k = 2 * np.pi * self.frequency_value / c
-        kx_grid = k * np.sin(th) * np.cos(ph)
-        ky_grid = k * np.sin(th) * np.sin(ph)
-        kz_grid = k * np.cos(th)
-        kx_flat = kx_grid.ravel()
-        ky_flat = ky_grid.ravel()
-        kz_flat = kz_grid.ravel()
-        rEphi_fields_sum = np.zeros(length_of_ff_data, dtype=complex)
-        rETheta_fields_sum = np.zeros(length_of_ff_data, dtype=complex)
-
-        # Farfield superposition
-        for _, port in enumerate(self.all_port_names):
-            if port not in w_dict:
-                w_dict[port] = np.sqrt(0) * np.exp(1j * 0)
-            incident_power += w_dict_mag[port]
-            xyz_pos = port_positions[port]
-            array_factor = (
-                np.exp(1j * (xyz_pos[0] * kx_flat + xyz_pos[1] * ky_flat + xyz_pos[2] * kz_flat)) * w_dict[port]
-            )
-            rEphi_fields_sum += array_factor * self._raw_data[port]["rEPhi"]
-            rETheta_fields_sum += array_factor * self._raw_data[port]["rETheta"]
-
-        # Farfield origin sift
-        origin = self.origin
-        array_factor = np.exp(-1j * (origin[0] * kx_flat + origin[1] * ky_flat + origin[2] * kz_flat))
-        rETheta_fields_sum = array_factor * rETheta_fields_sum
-        rEphi_fields_sum = array_factor * rEphi_fields_sum
-
-        rEtheta_fields_sum = np.reshape(rETheta_fields_sum, (Ntheta, Nphi))
-        rEphi_fields_sum = np.reshape(rEphi_fields_sum, (Ntheta, Nphi))
+        rEtheta_fields_sum = np.reshape(rETheta_fields_sum[0], (Ntheta, Nphi))
+        rEphi_fields_sum = np.reshape(rEphi_fields_sum[0], (Ntheta, Nphi))
 
         farfield_data = OrderedDict()
         farfield_data["rEPhi"] = rEphi_fields_sum
@@ -1500,9 +2645,223 @@ class FfdSolutionData(object):
         farfield_data["RealizedGain_Theta"] = real_gain
         real_gain = 2 * np.pi * np.abs(np.power(farfield_data["rEPhi"], 2)) / incident_power / 377
         farfield_data["RealizedGain_Phi"] = real_gain
-        farfield_data["Element_Location"] = port_positions
+        farfield_data["Element_Location"] = {
+            port_name: self.port_position[port_name] for port_name in self.all_port_names
+        }
+        if self._reduced_precision:
+            farfield_data["rETotal_ErrorBound"] = np.reshape(fields[2][0], (Ntheta, Nphi))
         return farfield_data
 
+    @pyaedt_function_handler()
+    def scan_farfield(
+        self,
+        phi_scan,
+        theta_scan,
+        tapers=None,
+        farfield_quantity="RealizedGain",
+        chunk_size=16,
+        store_farfield=True,
+    ):
+        """Compute the far field of every beam of a scan volume.
+
+        Beams are defined by the grid of the phi and theta scan angles and, optionally, by several tapers.
+        The beams are computed in chunks of ``chunk_size`` with one matrix product per chunk, so the memory
+        used does not depend on the number of beams when ``store_farfield=False``.
+
+        Parameters
+        ----------
+        phi_scan : float or list
+            Phi scan angles in degrees.
+        theta_scan : float or list
+            Theta scan angles in degrees.
+        tapers : str or list, optional
+            Taper types. Beams are computed for each taper. The default is ``None``,
+            in which case the active taper is used.
+        farfield_quantity : str, optional
+            Far field quantity to store. The default is ``"RealizedGain"``.
+            Available quantities are: ``"RealizedGain"``, ``"RealizedGain_Phi"``, ``"RealizedGain_Theta"``,
+            and ``"rETotal"``.
+        chunk_size : int, optional
+            Number of beams computed at the same time. The default is ``16``.
+        store_farfield : bool, optional
+            Whether to store the far field quantity of each beam. The default is ``True``.
+            If ``False``, only the beam metrics are returned.
+
+        Returns
+        -------
+        dict
+            Scan data dictionary. Beams are sorted by taper, theta scan angle, and phi scan angle.
+            The dictionary contains:
+
+            - ``"Theta"`` and ``"Phi"``: far field grid.
+            - ``"Taper"``, ``"ThetaScan"``, and ``"PhiScan"``: taper and scan angles of each beam.
+            - ``farfield_quantity``: array with shape ``(beams, nTheta, nPhi)``, when ``store_farfield=True``.
+            - ``"PeakRealizedGain_dB"``: peak realized gain of each beam.
+            - ``"PeakTheta"`` and ``"PeakPhi"``: direction of the peak of each beam in degrees.
+            - ``"ScanLoss_dB"``: peak realized gain relative to the broadside beam with the same taper.
+            - ``"SidelobeLevel_dB"``: highest side lobe relative to the peak of each beam.
+
+        Examples
+        --------
+        >>> import pyaedt
+        >>> from pyaedt.modules.solutions import FfdSolutionData
+        >>> farfield_data = FfdSolutionData(frequencies=frequencies, eep_files=eep_files)
+        >>> scan = farfield_data.scan_farfield(phi_scan=[0, 90], theta_scan=range(0, 60, 5), tapers=["flat", "cosine"])
+        >>> scan["ScanLoss_dB"]
+        """
+        quantities = ["RealizedGain", "RealizedGain_Phi", "RealizedGain_Theta", "rETotal"]
+        if farfield_quantity not in quantities:
+            self.logger.error("Far field quantity is not available.")
+            return False
+        if not tapers:
+            tapers = [self.taper]
+        elif isinstance(tapers, str):
+            tapers = [tapers]
+        for taper in tapers:
+            if taper.lower() not in ("flat", "uniform", "cosine", "triangular", "hamming"):
+                self.logger.error("This taper is not implemented")
+                return False
+
+        theta_grid, phi_grid = np.meshgrid(
+            np.atleast_1d(np.asarray(theta_scan, dtype=float)),
+            np.atleast_1d(np.asarray(phi_scan, dtype=float)),
+            indexing="ij",
+        )
+        theta_grid = theta_grid.ravel()
+        phi_grid = phi_grid.ravel()
+        n_scan = len(theta_grid)
+        n_beams = n_scan * len(tapers)
+        chunk_size = max(int(chunk_size), 1)
+
+        theta_range = self._element_patterns["Theta"]
+        phi_range = self._element_patterns["Phi"]
+        Ntheta = len(theta_range)
+        Nphi = len(phi_range)
+        ph, th = np.meshgrid(np.deg2rad(phi_range), np.deg2rad(theta_range))
+        th = th.ravel()
+        ph = ph.ravel()
+        directions = np.stack([np.sin(th) * np.cos(ph), np.sin(th) * np.sin(ph), np.cos(th)], axis=1)
+        # The side lobe level is computed from the highest gain in rings around the peak direction
+        grid_step = max([abs(i[1] - i[0]) for i in (theta_range, phi_range) if len(i) > 1] + [1.0])
+        ring_width = 2 * np.deg2rad(grid_step)
+        n_rings = int(np.ceil(np.pi / ring_width)) + 1
+
+        scan_data = OrderedDict()
+        scan_data["Theta"] = theta_range
+        scan_data["Phi"] = phi_range
+        scan_data["Taper"] = np.repeat(np.array(tapers), n_scan)
+        scan_data["ThetaScan"] = np.tile(theta_grid, len(tapers))
+        scan_data["PhiScan"] = np.tile(phi_grid, len(tapers))
+        if store_farfield:
+            scan_data[farfield_quantity] = np.zeros((n_beams, Ntheta, Nphi))
+        peak_gain = np.zeros(n_beams)
+        peak_index = np.zeros(n_beams, dtype=int)
+        sidelobe = np.zeros(n_beams)
+        scan_loss = np.zeros(n_beams)
+
+        for taper_id, taper in enumerate(tapers):
+            _, w_mag = self._port_weights(taper=taper)
+            incident_power = np.sum(w_mag)
+            # Broadside beam is the reference of the scan loss
+            broadside_weights, _ = self._port_weights(0, 0, taper=taper)
+            broadside = self._beam_quantity(broadside_weights, incident_power, "RealizedGain")
+            broadside_peak = np.max(broadside)
+            for start in range(0, n_scan, chunk_size):
+                stop = min(start + chunk_size, n_scan)
+                weights, _ = self._port_weights(phi_grid[start:stop], theta_grid[start:stop], taper=taper)
+                beam_ids = slice(taper_id * n_scan + start, taper_id * n_scan + stop)
+                gain = self._beam_quantity(weights, incident_power, "RealizedGain")
+                if store_farfield:
+                    if farfield_quantity == "RealizedGain":
+                        values = gain
+                    else:
+                        values = self._beam_quantity(weights, incident_power, farfield_quantity)
+                    scan_data[farfield_quantity][beam_ids] = np.reshape(values, (-1, Ntheta, Nphi))
+                chunk_peak_index = np.argmax(gain, axis=1)
+                chunk_peak = gain[np.arange(len(gain)), chunk_peak_index]
+                peak_index[beam_ids] = chunk_peak_index
+                peak_gain[beam_ids] = chunk_peak
+                scan_loss[beam_ids] = chunk_peak / broadside_peak
+                sidelobe[beam_ids] = self._sidelobe_level(gain, directions, chunk_peak_index, ring_width, n_rings)
+
+        with np.errstate(divide="ignore"):
+            scan_data["PeakRealizedGain_dB"] = 10 * np.log10(peak_gain)
+            scan_data["PeakTheta"] = np.rad2deg(th[peak_index])
+            scan_data["PeakPhi"] = np.rad2deg(ph[peak_index])
+            scan_data["ScanLoss_dB"] = 10 * np.log10(scan_loss)
+            scan_data["SidelobeLevel_dB"] = 10 * np.log10(sidelobe)
+        return scan_data
+
+    @pyaedt_function_handler()
+    def _beam_quantity(self, weights, incident_power, farfield_quantity="RealizedGain"):
+        """Compute a far field quantity for one or more sets of port weights.
+
+        Parameters
+        ----------
+        weights : :class:`numpy.ndarray`
+            Complex weights with shape ``(beams, ports)``.
+        incident_power : float
+            Incident power.
+        farfield_quantity : str, optional
+            Far field quantity. The default is ``"RealizedGain"``.
+            Available quantities are: ``"RealizedGain"``, ``"RealizedGain_Phi"``, ``"RealizedGain_Theta"``,
+            and ``"rETotal"``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Far field quantity with shape ``(beams, points)``.
+        """
+        rETheta, rEPhi = self._combine_element_patterns(weights)
+        if farfield_quantity == "RealizedGain_Theta":
+            power = np.abs(rETheta) ** 2
+        elif farfield_quantity == "RealizedGain_Phi":
+            power = np.abs(rEPhi) ** 2
+        else:
+            power = np.abs(rETheta) ** 2 + np.abs(rEPhi) ** 2
+        if farfield_quantity == "rETotal":
+            return np.sqrt(power)
+        return 2 * np.pi * power / incident_power / 377
+
+    @staticmethod
+    @pyaedt_function_handler()
+    def _sidelobe_level(gain, directions, peak_index, ring_width, n_rings):
+        """Compute the side lobe level of one or more beams.
+
+        The highest gain is computed in rings of increasing angular distance from the peak direction.
+        The main lobe ends at the first ring where this envelope increases again.
+
+        Parameters
+        ----------
+        gain : :class:`numpy.ndarray`
+            Gain with shape ``(beams, points)``.
+        directions : :class:`numpy.ndarray`
+            Unit vector of each point with shape ``(points, 3)``.
+        peak_index : :class:`numpy.ndarray`
+            Index of the peak point of each beam.
+        ring_width : float
+            Angular width of the rings in radians.
+        n_rings : int
+            Number of rings.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Highest side lobe gain relative to the peak gain, or ``0.0`` when the beam has no side lobes.
+        """
+        cos_angle = np.clip(np.dot(directions[peak_index], directions.T), -1.0, 1.0)
+        ring = np.minimum((np.arccos(cos_angle) / ring_width).astype(int), n_rings - 1)
+        beam = np.repeat(np.arange(len(gain))[:, None], gain.shape[1], axis=1)
+        envelope = np.full((len(gain), n_rings), -1.0)
+        np.maximum.at(envelope, (beam, ring), gain)
+        sidelobe = np.zeros(len(gain))
+        for beam_id, beam_envelope in enumerate(envelope):
+            beam_envelope = beam_envelope[beam_envelope >= 0]
+            rising = np.nonzero(np.diff(beam_envelope) > 0)[0]
+            if len(rising):
+                sidelobe[beam_id] = np.max(beam_envelope[rising[0] :]) / beam_envelope[0]
+        return sidelobe
+
     # fmt: off
     @pyaedt_function_handler()
     def plot_farfield_contour(
@@ -2104,38 +3463,175 @@ class FfdSolutionData(object):
         bool
             ``True`` when successful, ``False`` when failed.
         """
-        all_ports = self.all_port_names
-        valid_ffd = True
-
-        if os.path.exists(eep_file_info[all_ports[0]][0]):
-            with open(eep_file_info[all_ports[0]][0], "r") as reader:
-                theta = [int(i) for i in reader.readline().split()]
-                phi = [int(i) for i in reader.readline().split()]
-            reader.close()
-            for port in eep_file_info.keys():
-                temp_dict = {}
-                if ":" in port:
-                    port = port.split(":")[0]
-                theta_range = np.linspace(*theta)
-                phi_range = np.linspace(*phi)
-                if os.path.exists(eep_file_info[port][0]):
-                    eep_txt = np.loadtxt(eep_file_info[port][0], skiprows=4)
-                    Etheta = np.vectorize(complex)(eep_txt[:, 0], eep_txt[:, 1])
-                    Ephi = np.vectorize(complex)(eep_txt[:, 2], eep_txt[:, 3])
-                    temp_dict["Theta"] = theta_range
-                    temp_dict["Phi"] = phi_range
-                    temp_dict["rETheta"] = Etheta
-                    temp_dict["rEPhi"] = Ephi
-                    self._raw_data[port] = temp_dict
-                else:
-                    valid_ffd = False
-        else:
+        ffd_files = [eep_file_info[port][0] for port in self.all_port_names]
+
+        if not os.path.exists(ffd_files[0]):
             self.logger.error("Wrong far fields were imported.")
             return False
-
-        if not valid_ffd:
+        if not all(os.path.exists(ffd_file) for ffd_file in ffd_files):
             return False
 
+        dtype = np.complex64 if self._reduced_precision else complex
+        element_patterns = None
+        if settings.enable_ffd_file_cache:
+            element_patterns = self._load_ffd_cache(ffd_files, dtype)
+        if element_patterns is None:
+            element_patterns = self._read_ffd_files(ffd_files, dtype)
+            if settings.enable_ffd_file_cache:
+                self._save_ffd_cache(ffd_files, element_patterns)
+        self._element_patterns = element_patterns
+        self._element_patterns_frequency = None
+        self._error_bounds = {}
+        return True
+
+    @staticmethod
+    @pyaedt_function_handler()
+    def _read_ffd_file(ffd_file):
+        """Read an element pattern file.
+
+        Parameters
+        ----------
+        ffd_file : str
+            Path to the FFD file.
+
+        Returns
+        -------
+        tuple
+            Theta range, phi range, and complex array with shape ``(points, 2)``
+            containing the ``rETheta`` and ``rEPhi`` columns.
+        """
+        with open(ffd_file, "r") as reader:
+            theta = reader.readline().split()
+            phi = reader.readline().split()
+            reader.readline()
+            reader.readline()
+            theta_range = np.linspace(float(theta[0]), float(theta[1]), int(theta[2]))
+            phi_range = np.linspace(float(phi[0]), float(phi[1]), int(phi[2]))
+            data = np.loadtxt(reader, dtype=float, max_rows=len(theta_range) * len(phi_range), ndmin=2)
+        # Real and imaginary parts are adjacent, so the rows are viewed as complex numbers without a copy
+        return theta_range, phi_range, np.ascontiguousarray(data).view(complex)
+
+    @pyaedt_function_handler()
+    def _read_ffd_files(self, ffd_files, dtype=complex):
+        """Read the element pattern files of all ports.
+
+        Parameters
+        ----------
+        ffd_files : list
+            Paths to the FFD files, sorted as in ``all_port_names``.
+        dtype : type, optional
+            Complex type of the element patterns. The default is ``complex``.
+
+        Returns
+        -------
+        dict
+            Element patterns. ``"rETheta"`` and ``"rEPhi"`` are complex matrices with shape
+            ``(ports, points)``.
+        """
+        theta_range, phi_range, data = self._read_ffd_file(ffd_files[0])
+        element_patterns = {
+            "Theta": theta_range,
+            "Phi": phi_range,
+            "rETheta": np.empty((len(ffd_files), len(data)), dtype=dtype),
+            "rEPhi": np.empty((len(ffd_files), len(data)), dtype=dtype),
+        }
+        for port_id, ffd_file in enumerate(ffd_files):
+            if port_id:
+                data = self._read_ffd_file(ffd_file)[2]
+            element_patterns["rETheta"][port_id] = data[:, 0]
+            element_patterns["rEPhi"][port_id] = data[:, 1]
+        return element_patterns
+
+    @staticmethod
+    @pyaedt_function_handler()
+    def _ffd_cache_header(ffd_files, dtype=complex):
+        """Build the header identifying a set of element pattern files in the binary cache.
+
+        Parameters
+        ----------
+        ffd_files : list
+            Paths to the FFD files.
+        dtype : type, optional
+            Complex type of the element patterns. The default is ``complex``.
+
+        Returns
+        -------
+        tuple
+            Path of the cache file and header dictionary.
+        """
+        names = [os.path.basename(ffd_file) for ffd_file in ffd_files]
+        dtype = np.dtype(dtype).str
+        key = hashlib.sha1("\n".join(names + [dtype]).encode("utf-8")).hexdigest()[:16]
+        cache_file = os.path.join(os.path.dirname(ffd_files[0]), "pyaedt_ffd_{}.npz".format(key))
+        stats = [os.stat(ffd_file) for ffd_file in ffd_files]
+        header = {
+            "version": np.array(1),
+            "files": np.array(names),
+            "sizes": np.array([stat.st_size for stat in stats]),
+            "mtimes": np.array([stat.st_mtime for stat in stats]),
+            "dtype": np.array(dtype),
+        }
+        return cache_file, header
+
+    @pyaedt_function_handler()
+    def _load_ffd_cache(self, ffd_files, dtype=complex):
+        """Load the element patterns of a set of FFD files from the binary cache.
+
+        Parameters
+        ----------
+        ffd_files : list
+            Paths to the FFD files, sorted as in ``all_port_names``.
+        dtype : type, optional
+            Complex type of the element patterns. The default is ``complex``.
+
+        Returns
+        -------
+        dict or None
+            Element patterns, ``None`` if the cache file is missing or stale.
+        """
+        cache_file, header = self._ffd_cache_header(ffd_files, dtype)
+        if not os.path.isfile(cache_file):
+            return None
+        try:
+            with np.load(cache_file, allow_pickle=False) as cache:
+                # Arrays of an npz file are read on access, so a stale cache is detected from the header alone
+                for key, value in header.items():
+                    if cache[key].shape != value.shape or not np.array_equal(cache[key], value):
+                        return None
+                return {key: cache[key] for key in ["Theta", "Phi", "rETheta", "rEPhi"]}
+        except Exception:
+            self.logger.debug("Failed to read the far field cache {}.".format(cache_file))
+            return None
+
+    @pyaedt_function_handler()
+    def _save_ffd_cache(self, ffd_files, element_patterns):
+        """Save the element patterns of a set of FFD files in the binary cache.
+
+        Parameters
+        ----------
+        ffd_files : list
+            Paths to the FFD files, sorted as in ``all_port_names``.
+        element_patterns : dict
+            Element patterns.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        cache_file, header = self._ffd_cache_header(ffd_files, element_patterns["rETheta"].dtype)
+        temp_file = "{}.{}.tmp".format(cache_file, os.getpid())
+        try:
+            with open(temp_file, "wb") as fh:
+                np.savez(fh, **dict(header, **element_patterns))
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+            os.rename(temp_file, cache_file)
+        except Exception:
+            self.logger.debug("Failed to write the far field cache {}.".format(cache_file))
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            return False
         return True
 
     @pyaedt_function_handler()
@@ -2180,11 +3676,72 @@ class FfdSolutionData(object):
             self.logger.error("Format of the quantity is wrong.")
             return False
 
-        theta = np.deg2rad(np.array(self.farfield_data["Theta"]))
-        phi = np.deg2rad(np.array(self.farfield_data["Phi"]))
-        mesh = get_structured_mesh(theta=theta, phi=phi, ff_data=ff_data)
+        mesh = pv.StructuredGrid()
+        mesh.points = np.zeros((ff_data.size, 3))
+        mesh.dimensions = [len(self.farfield_data["Theta"]), len(self.farfield_data["Phi"]), 1]
+        self._update_far_field_mesh(mesh, ff_data)
         return mesh
 
+    @pyaedt_function_handler()
+    def _get_mesh_directions(self):
+        """Get the unit vectors of the far field grid points, sorted as the points of the far field mesh.
+
+        The vectors only depend on the theta and phi grid, so they are computed once for each grid.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Unit vectors with shape ``(points, 3)``.
+        """
+        theta = self.farfield_data["Theta"]
+        phi = self.farfield_data["Phi"]
+        cached = self._mesh_directions
+        if cached is None or cached[0] is not theta or cached[1] is not phi:
+            phi_grid, theta_grid = np.meshgrid(np.deg2rad(phi), np.deg2rad(theta))
+            # PyVista structured grids sort the points with the theta index changing fastest
+            directions = np.column_stack(
+                [
+                    (np.sin(theta_grid) * np.cos(phi_grid)).ravel(order="F"),
+                    (np.sin(theta_grid) * np.sin(phi_grid)).ravel(order="F"),
+                    np.cos(theta_grid).ravel(order="F"),
+                ]
+            )
+            self._mesh_directions = (theta, phi, directions)
+        return self._mesh_directions[2]
+
+    @pyaedt_function_handler()
+    def _update_far_field_mesh(self, mesh, ff_data):
+        """Update the points and the far field values of a far field mesh in place.
+
+        The topology of the mesh does not change, so a mesh already added to a plotter is updated
+        without being rebuilt.
+
+        Parameters
+        ----------
+        mesh : :class:`pyvista.StructuredGrid`
+            Far field mesh.
+        ff_data : :class:`numpy.ndarray`
+            Far field values with shape ``(nTheta, nPhi)``.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        directions = self._get_mesh_directions()
+        if mesh.n_points != len(directions) or ff_data.size != len(directions):  # pragma: no cover
+            self.logger.error("Far field mesh does not match the far field grid.")
+            return False
+        values = np.ravel(ff_data, order="F")
+        min_value = values.min()
+        radius = values - min_value if min_value < 0 else values
+        mesh.points[:] = directions * radius[:, None]
+        if "FarFieldData" in mesh.point_data:
+            mesh.point_data["FarFieldData"][:] = values
+        else:
+            mesh.point_data["FarFieldData"] = values
+        return True
+
     @pyaedt_function_handler()
     def _read_eep_files(self, eep_path):
         """Read the EEP file and populate all attributes with information about each port in the file.
@@ -2586,6 +4143,7 @@ class UpdateBeamForm:
         self.output = ff.mesh
         self._phi = 0
         self._theta = 0
+        self._beam = None
         # default parameters
         self.ff = ff
         self.farfield_quantity = farfield_quantity
@@ -2594,11 +4152,23 @@ class UpdateBeamForm:
     @pyaedt_function_handler()
     def _update_both(self):
         """Update far field."""
+        # Sliders send events while they are dragged, even when the value does not change.
+        # The port weights cover the scan angles, the taper, and the phase and magnitude offsets.
+        beam = (
+            self.ff._port_weights(self._phi, self._theta)[0].tobytes(),
+            tuple(self.ff.origin),
+            self.ff.frequency,
+            self.farfield_quantity,
+            self.quantity_format,
+        )
+        if self._beam == beam:
+            return
+        self._beam = beam
         self.ff.farfield_data = self.ff.combine_farfield(phi_scan=self._phi, theta_scan=self._theta)
 
-        self.ff.mesh = self.ff.get_far_field_mesh(self.farfield_quantity, self.quantity_format)
-
-        self.output.overwrite(self.ff.mesh)
+        ff_data = conversion_function(self.ff.farfield_data[self.farfield_quantity], self.quantity_format)
+        self.ff._update_far_field_mesh(self.output, ff_data)
+        self.ff.mesh = self.output
         return
 
     @pyaedt_function_handler()
@@ -1,3 +1,4 @@
+from array import array
 import struct
 import warnings
 
@@ -15,6 +16,13 @@ except ImportError:
     )
 
 
+def _eval_header(header):
+    """Interpret the text header of an HDM file, without its ``#header end`` line."""
+    header = header.decode().splitlines()[1:]
+    header = [line for line in header if not line.startswith("#")]
+    return eval(" ".join(header))
+
+
 class Parser:
     """
     Parser class that loads an HDM-format export file from HFSS SBR+, interprets
@@ -35,9 +43,7 @@ class Parser:
         with open(filename, "rb") as file:
             binarycontent = file.read(-1)
         header, binarycontent = binarycontent.split(b"#header end\n")
-        header = header.decode().splitlines()[1:]
-        header = [line for line in header if not line.startswith("#")]
-        self.header = eval(" ".join(header))
+        self.header = _eval_header(header)
         self._read_header()
         self.binarycontent = binarycontent
 
@@ -226,3 +232,479 @@ class Parser:
 
     def __repr__(self):
         return repr(self.parser_types)
+
+
+_NUMPY_FORMATS = {
+    "int": {1: "u1", 2: "<i2", 4: "<i4"},
+    "flag": {1: "u1", 2: "<i2", 4: "<i4"},
+    "enum": {1: "u1", 2: "<i2", 4: "<i4"},
+    "float": {4: "<f4", 8: "<f8"},
+    "complex": {8: "<c8", 16: "<c16"},
+}
+
+
+def _field_names(entry):
+    """Return the field names of a layout entry as a tuple."""
+    fields = entry["field_names"]
+    if isinstance(fields, str):
+        return (fields,)
+    return tuple(fields)
+
+
+def _gather(data, offsets, dtype):
+    """
+    Read one item of type ``dtype`` at each byte offset of ``data``.
+    Evenly spaced items are returned as a strided view of ``data``, without any copy.
+    Other items are copied into a compact array with a single fancy-indexing operation.
+    """
+    wrapper = np.dtype([("value", dtype)])
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.size == 0:
+        return np.zeros(0, wrapper)["value"]
+    stride = int(offsets[1] - offsets[0]) if offsets.size > 1 else wrapper.itemsize
+    if stride >= wrapper.itemsize and np.all(np.diff(offsets) == stride):
+        return np.ndarray(offsets.shape, wrapper, buffer=data, offset=int(offsets[0]), strides=(stride,))["value"]
+    windows = np.lib.stride_tricks.as_strided(
+        data, shape=(data.size - wrapper.itemsize + 1, wrapper.itemsize), strides=(1, 1), writeable=False
+    )
+    return windows[offsets].view(wrapper)[:, 0]["value"]
+
+
+class HdmRecords:
+    """
+    Records of one object type of an HDM file, as located by :class:`RecordParser`.
+    Fixed-size fields are read from the memory-mapped file on first access. Fields of evenly
+    spaced records are views of the file, other fields are gathered with one vectorized copy
+    of the requested field only. Optional fields that are missing in a record are zero.
+    Variable-length vectors are flattened, ``offsets[field][i]:offsets[field][i + 1]`` being the
+    slice of record ``i``. Nested objects are records of ``child_types[field]``, reachable
+    through the indices in ``children[field]``: one index per record for a single object, where
+    ``-1`` marks a missing optional object, or a flattened list sliced by ``offsets[field]``.
+    Usage:
+    bounces = RecordParser('filename').parse()["Bounce"]
+    hit_points = bounces["hit_pt"]
+    next_bounces = bounces.children["refl_bounce"]
+    """
+
+    def __init__(self, name, data, size):
+        self.name = name
+        self.size = size
+        self.children = {}
+        self.child_types = {}
+        self.offsets = {}
+        self._data = data
+        self._segments = []
+        self._segment_dtypes = []
+        self._fixed = {}
+        self._values = {}
+        self._cache = {}
+
+    @property
+    def fields(self):
+        """Names of the fields that can be read as arrays."""
+        return list(self._fixed) + list(self._values)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, field):
+        return field in self._fixed or field in self._values
+
+    def __getitem__(self, field):
+        """Read a field of all the records as a numpy array."""
+        if field not in self._cache:
+            if field in self._fixed:
+                self._cache[field] = self._read_fixed(field)
+            elif field in self._values:
+                self._cache[field] = self._read_values(field)
+            else:
+                raise KeyError(field)
+        return self._cache[field]
+
+    def present(self, field):
+        """Return a boolean mask of the records that hold a field, for optional fields."""
+        if field in self._fixed:
+            return self._segments[self._fixed[field][0]] >= 0
+        if field in self._values:
+            return self._values[field][0] >= 0
+        if field in self.offsets:
+            return np.diff(self.offsets[field]) > 0
+        return self.children[field] >= 0
+
+    def records(self, fields=None):
+        """
+        Read fixed-size fields of all the records as a numpy structured array.
+        When all the fields come from the same evenly spaced block of each record,
+        the structured array is a view of the file.
+        """
+        if fields is None:
+            fields = list(self._fixed)
+        segments = set(self._fixed[field][0] for field in fields)
+        if len(segments) == 1:
+            segment = segments.pop()
+            offsets = self._segments[segment]
+            if np.all(offsets >= 0):
+                res = _gather(self._data, offsets, self._segment_dtypes[segment])
+                if list(res.dtype.names) != list(fields):
+                    res = res[list(fields)]
+                return res
+        res = np.zeros(self.size, [(field, self._fixed[field][2]) for field in fields])
+        for field in fields:
+            res[field] = self[field]
+        return res
+
+    def _read_fixed(self, field):
+        segment, offset, dtype = self._fixed[field]
+        offsets = self._segments[segment]
+        present = offsets >= 0
+        if np.all(present):
+            return _gather(self._data, offsets + offset, dtype)
+        res = np.zeros(self.size, [("value", dtype)])["value"]
+        res[present] = _gather(self._data, offsets[present] + offset, dtype)
+        return res
+
+    def _read_values(self, field):
+        offsets, counts, dtype = self._values[field]
+        starts = self.offsets[field][:-1]
+        items = np.repeat(offsets - starts * dtype.itemsize, counts)
+        items += np.arange(items.size, dtype=np.int64) * dtype.itemsize
+        return _gather(self._data, items, dtype)
+
+    def __repr__(self):
+        return "<HdmRecords {} ({} records)>".format(self.name, self.size)
+
+
+class _RecordsBuilder:
+    """Collect the byte offsets and child indices of the records of one object type while scanning."""
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.size = 0
+        self.columns = []
+        for step in steps:
+            if step[0] == "fixed" or step[0] == "object":
+                self.columns.append((array("q"),))
+            elif step[0] == "values":
+                self.columns.append((array("q"), array("q")))
+            else:
+                self.columns.append((array("q"), array("q"), array("q")))
+        self._per_record = [column for columns in self.columns for column in columns[:2]]
+
+    def new_record(self):
+        """Add a record with all its fields missing and return its index."""
+        for column in self._per_record:
+            column.append(-1)
+        self.size += 1
+        return self.size - 1
+
+    def mark(self):
+        """Return the current number of records and of listed children, to roll back a partial scan."""
+        return self.size, [len(columns[2]) for columns in self.columns if len(columns) == 3]
+
+    def rollback(self, mark):
+        """Remove the records and listed children added since ``mark``."""
+        self.size, lengths = mark
+        for column in self._per_record:
+            del column[self.size :]
+        for columns, length in zip([columns for columns in self.columns if len(columns) == 3], lengths):
+            del columns[2][length:]
+
+    def shift(self, offset):
+        """Subtract ``offset`` from the byte offsets of the records, after the data they refer to has moved."""
+        for step, columns in zip(self.steps, self.columns):
+            if step[0] == "fixed" or step[0] == "values":
+                offsets = np.frombuffer(columns[0], dtype=np.int64) if len(columns[0]) else np.zeros(0, np.int64)
+                offsets[offsets >= 0] -= offset
+
+    def build(self, name, data):
+        """Convert the collected offsets to an :class:`HdmRecords` object."""
+        records = HdmRecords(name, data, self.size)
+        for step, columns in zip(self.steps, self.columns):
+            columns = [
+                np.frombuffer(column, dtype=np.int64) if len(column) else np.zeros(0, np.int64) for column in columns
+            ]
+            if step[0] == "fixed":
+                dtype = step[1]
+                for field in dtype.names:
+                    records._fixed[field] = (len(records._segments), dtype.fields[field][1], dtype.fields[field][0])
+                records._segments.append(columns[0])
+                records._segment_dtypes.append(dtype)
+            elif step[0] == "object":
+                records.children[step[1]] = columns[0]
+                records.child_types[step[1]] = step[2]
+            else:
+                counts = np.maximum(columns[1], 0)
+                offsets = np.zeros(self.size + 1, dtype=np.int64)
+                np.cumsum(counts, out=offsets[1:])
+                records.offsets[step[1]] = offsets
+                if step[0] == "values":
+                    records._values[step[1]] = (columns[0], counts, step[2])
+                    continue
+                children = columns[2]
+                starts = np.where(counts > 0, columns[0], offsets[:-1])
+                if not np.array_equal(starts, offsets[:-1]):
+                    children = children[np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])]
+                records.children[step[1]] = children
+                records.child_types[step[1]] = step[2]
+        return records
+
+
+class RecordParser(Parser):
+    """
+    Parser class that maps an HDM-format export file from HFSS SBR+ to numpy record arrays.
+    The header is interpreted as in :class:`Parser` and its object types are compiled to
+    numpy structured dtypes. The binary content is memory-mapped and scanned once by
+    parse, which only locates the objects. Their fields are read on demand as numpy arrays
+    through one :class:`HdmRecords` object per object type, so no Python object is created
+    per ray or per bounce.
+    Usage:
+    parser = RecordParser('filename')
+    records = parser.parse()
+    rays = records["RayTrack"]
+    bounces = records["Bounce"]
+    hit_points = bounces["hit_pt"][rays.children["first_bounce"]]
+    """
+
+    def __init__(self, filename):
+        """Initialize parser object with the interpreted header and a memory map of the binary data."""
+        self.parser_types = {}
+        self.parser_flags = {}
+        self.parser_enums = {}
+        self.objects = {}
+        self.filename = filename
+        self.dtypes = {}
+        self.records = {}
+        self._layouts = {}
+        header = []
+        with open(filename, "rb") as file:
+            line = file.readline()
+            while line and line != b"#header end\n":
+                header.append(line)
+                line = file.readline()
+            self.idx = file.tell()
+        self.header = _eval_header(b"".join(header))
+        self._read_header()
+        for key, val in self.header["types"].items():
+            if val["type"] == "object":
+                self._layouts[key] = self._compile_layout(key)
+        self.binarycontent = np.memmap(filename, dtype=np.uint8, mode="r").view(np.ndarray)
+
+    def parse(self):
+        """Locate all the objects of the binary content and return the records of each object type."""
+        builders = dict((name, _RecordsBuilder(steps)) for name, steps in self._layouts.items())
+        self._scan(self.message["type"], self.idx, builders, self.binarycontent)
+        self.records = dict((name, builder.build(name, self.binarycontent)) for name, builder in builders.items())
+        return self.records
+
+    def parse_message(self):
+        """Locate all the objects of the binary content and return the records of the message type."""
+        return self.parse()[self.message["type"]]
+
+    def iter_batches(self, batch_size=10000, block_size=4194304):
+        """
+        Read the objects listed by the message, such as the rays of a bundle, in batches of ``batch_size`` objects.
+        The file is read sequentially by blocks of ``block_size`` bytes and only the current batch is held in
+        memory, whatever the file size. Each batch is a dictionary of :class:`HdmRecords` as returned by parse,
+        with the objects of the batch and their nested objects. The message record holds the fields that precede
+        the list and the indices of the objects of the batch.
+        Usage:
+        parser = RecordParser('filename')
+        for batch in parser.iter_batches(batch_size=50000):
+            rays = batch["RayTrack"]
+            first_hits = batch["Bounce"]["hit_pt"][rays.children["first_bounce"]]
+        """
+        name = self.message["type"]
+        steps = self._layouts[name]
+        lists = [i for i, step in enumerate(steps) if step[0] == "list"]
+        if not lists or any(step[0] == "object" for step in steps[: lists[0]]):
+            raise ValueError("The {} message has no list of objects that can be streamed.".format(name))
+        stream = lists[0]
+        root = _RecordsBuilder(steps)
+        root.new_record()
+        with open(self.filename, "rb") as file:
+            file.seek(self.idx)
+            buffer = bytearray()
+            while True:
+                block = file.read(block_size)
+                buffer.extend(block)
+                controls = {}
+                try:
+                    pos = self._scan_fields(steps[:stream], root.columns[:stream], 0, 0, {}, buffer, controls)
+                except struct.error:
+                    pos = len(buffer) + 1
+                if pos <= len(buffer):
+                    break
+                if not block:
+                    raise ValueError("The HDM file ends in the middle of the {} message.".format(name))
+            header = np.frombuffer(bytes(buffer[:pos]), dtype=np.uint8)
+            step = steps[stream]
+            count = 0
+            if not step[-1] or controls[step[-1][0]] & step[-1][1] == step[-1][2]:
+                count = step[3] if isinstance(step[3], int) else controls[step[3]]
+            data = np.frombuffer(buffer, dtype=np.uint8)
+            while count > 0:
+                start = pos
+                builders = dict((key, _RecordsBuilder(val)) for key, val in self._layouts.items())
+                items = array("q")
+                while len(items) < min(batch_size, count):
+                    marks = [(builder, builder.mark()) for builder in builders.values()]
+                    try:
+                        index, end = self._scan(step[2], pos, builders, data)
+                    except struct.error:
+                        end = len(buffer) + 1
+                    if end <= len(buffer):
+                        items.append(index)
+                        pos = end
+                        continue
+                    for builder, mark in marks:
+                        builder.rollback(mark)
+                    block = file.read(block_size)
+                    if not block:
+                        raise ValueError("The HDM file ends in the middle of a {} object.".format(step[2]))
+                    # Drop the previous batches from the buffer, keeping the objects already located
+                    buffer = buffer[start:] + block
+                    data = np.frombuffer(buffer, dtype=np.uint8)
+                    for builder in builders.values():
+                        builder.shift(start)
+                    pos -= start
+                    start = 0
+                count -= len(items)
+                root.columns[stream] = (array("q", [0]), array("q", [len(items)]), items)
+                batch = dict((key, builder.build(key, data)) for key, builder in builders.items())
+                batch[name] = root.build(name, header)
+                yield batch
+
+    def _scan(self, name, pos, builders, data):
+        """Record the position of an object and of its nested objects. Return its index and end position."""
+        builder = builders[name]
+        index = builder.new_record()
+        return index, self._scan_fields(builder.steps, builder.columns, index, pos, builders, data, {})
+
+    def _scan_fields(self, steps, columns, index, pos, builders, data, controls):
+        """Record the position of the fields of an object, following its layout steps. Return the end position."""
+        for step, step_columns in zip(steps, columns):
+            condition = step[-1]
+            if condition and controls[condition[0]] & condition[1] != condition[2]:
+                continue
+            if step[0] == "fixed":
+                step_columns[0][index] = pos
+                for field, reader, offset in step[2]:
+                    controls[field] = reader.unpack_from(data, pos + offset)[0]
+                pos += step[1].itemsize
+            elif step[0] == "object":
+                step_columns[0][index], pos = self._scan(step[2], pos, builders, data)
+            else:
+                size = step[3] if isinstance(step[3], int) else controls[step[3]]
+                step_columns[0][index] = pos if step[0] == "values" else len(step_columns[2])
+                step_columns[1][index] = size
+                if step[0] == "values":
+                    pos += size * step[2].itemsize
+                else:
+                    for _ in range(size):
+                        child, pos = self._scan(step[2], pos, builders, data)
+                        step_columns[2].append(child)
+        return pos
+
+    def _dtype(self, type_name):
+        """Return the numpy dtype of a type, or ``None`` if its size depends on the content."""
+        if type_name in self.dtypes:
+            return self.dtypes[type_name]
+        val = self.header["types"][type_name]
+        if val["type"] in _NUMPY_FORMATS:
+            dtype = np.dtype(_NUMPY_FORMATS[val["type"]][val["size"]])
+        elif val["type"] in ("vector", "list"):
+            dtype = self._array_dtype(val["base"], val["size"])
+        else:
+            # Guard against recursive types, such as a bounce holding the next bounce
+            self.dtypes[type_name] = None
+            fields = []
+            for entry in val["layout"]:
+                entry_dtype = self._entry_dtype(entry)
+                if entry_dtype is None or "optional" in entry:
+                    fields = None
+                    break
+                fields.extend((field, entry_dtype) for field in _field_names(entry))
+            dtype = np.dtype(fields) if fields is not None else None
+        self.dtypes[type_name] = dtype
+        return dtype
+
+    def _array_dtype(self, base, size):
+        """Return the numpy dtype of a vector or list, or ``None`` if its size depends on the content."""
+        dtype = self._dtype(base)
+        if dtype is None or isinstance(size, str):
+            return None
+        if size == 1:
+            return dtype
+        return np.dtype((dtype, (size,)))
+
+    def _entry_dtype(self, entry):
+        """Return the numpy dtype of a layout entry, or ``None`` if its size depends on the content."""
+        if entry["type"] in ("vector", "list"):
+            return self._array_dtype(entry["base"], entry["size"])
+        return self._dtype(entry["type"])
+
+    def _compile_layout(self, name):
+        """
+        Compile the layout of an object type into scanning steps. Consecutive fixed-size fields
+        are merged into a single structured dtype, read only for the fields that control
+        the size or presence of the next ones.
+        """
+        layout = self.header["types"][name]["layout"]
+        field_types = {}
+        controls = set()
+        for entry in layout:
+            for field in _field_names(entry):
+                field_types[field] = entry["type"]
+            if "optional" in entry:
+                controls.add(entry["optional"][0])
+            size = entry.get("size", self.header["types"].get(entry["type"], {}).get("size"))
+            if isinstance(size, str):
+                controls.add(size)
+
+        def fixed_step(fields, condition):
+            dtype = np.dtype(fields)
+            readers = [
+                (field, struct.Struct("<" + dtype.fields[field][0].char), dtype.fields[field][1])
+                for field in dtype.names
+                if field in controls
+            ]
+            return ("fixed", dtype, readers, condition)
+
+        steps = []
+        run = []
+        for entry in layout:
+            condition = None
+            if "optional" in entry:
+                var, cond = entry["optional"]
+                if field_types[var] in self.parser_flags:
+                    mask = self.parser_flags[field_types[var]][cond]
+                    condition = (var, mask, mask)
+                else:
+                    condition = (var, -1, self.parser_enums[field_types[var]][cond].value)
+            dtype = self._entry_dtype(entry)
+            fields = _field_names(entry)
+            if dtype is not None and condition is None:
+                run.extend((field, dtype) for field in fields)
+                continue
+            if run:
+                steps.append(fixed_step(run, None))
+                run = []
+            if dtype is not None:
+                steps.append(fixed_step([(field, dtype) for field in fields], condition))
+                continue
+            if entry["type"] in ("vector", "list"):
+                base, size = entry["base"], entry["size"]
+            elif self.header["types"][entry["type"]]["type"] in ("vector", "list"):
+                base, size = self.header["types"][entry["type"]]["base"], self.header["types"][entry["type"]]["size"]
+            else:
+                steps.extend(("object", field, entry["type"], condition) for field in fields)
+                continue
+            if self.header["types"][base]["type"] == "object":
+                steps.extend(("list", field, base, size, condition) for field in fields)
+            elif self._dtype(base) is not None:
+                steps.extend(("values", field, self._dtype(base), size, condition) for field in fields)
+            else:
+                raise ValueError("Lists of variable-size vectors in {} are not supported.".format(name))
+        if run:
+            steps.append(fixed_step(run, None))
+        return steps
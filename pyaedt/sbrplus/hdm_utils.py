@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def sort_bundle(bundle, monoPW_attrib="sweep_angle_index"):
     """
     In-place sorting utility for hdm ray exports.
@@ -44,3 +47,83 @@ def sort_bundle(bundle, monoPW_attrib="sweep_angle_index"):
                 ray.first_bounce.hit_pt.tolist(),
             )
         bundle.ray_tracks.sort(key=key)
+
+
+def get_ray_paths(rays, bounces, ray_indices=None, decimation=1, depths=None, bounding_box=None):
+    """
+    Vectorized geometry of SBR+ ray tracks, for plotting with ``pyvista``.
+
+    Each ray track is made of a segment from its source point, through its UTD bright point
+    if present, to its first bounce, with depth 1, and of one segment from each bounce to each
+    of its reflected and transmitted bounces, with the depth of the next bounce.
+    The bounce trees are walked one depth at a time on all the selected rays at once.
+
+    :param rays: ray track records from :class:`pyaedt.sbrplus.hdm_parser.RecordParser`
+    :param bounces: bounce records from :class:`pyaedt.sbrplus.hdm_parser.RecordParser`
+    :param ray_indices: indices, slice or boolean mask of the rays to include. The default is all rays.
+    :param int decimation: keep one ray out of ``decimation`` among the selected rays
+    :param depths: list of segment depths to include. The default is all depths.
+    :param bounding_box: ``[xmin, ymin, zmin, xmax, ymax, zmax]`` box in the units of the file.
+        Only the segments with at least one end in the box are included. The default is no box.
+    :return: points as a ``(2 * n, 3)`` array, VTK lines connectivity as a ``(3 * n,)`` array,
+        and the depth of each point, for ``n`` line segments.
+    """
+    selected = np.arange(len(rays))
+    if ray_indices is not None:
+        selected = selected[ray_indices]
+    selected = selected[:: max(int(decimation), 1)]
+    max_depth = max(depths) if depths else None
+    hit_points = bounces["hit_pt"]
+    starts = []
+    ends = []
+    segment_depths = []
+
+    def add_segments(start, end, depth):
+        if depths and depth not in depths:
+            return
+        starts.append(start)
+        ends.append(end)
+        segment_depths.append(np.full(len(start), depth, dtype=np.int32))
+
+    parents = rays.children["first_bounce"][selected]
+    source_points = rays["source_point"][selected]
+    first_hits = hit_points[parents]
+    if "utd_point" in rays:
+        utd = rays.present("utd_point")[selected]
+        utd_points = rays["utd_point"][selected][utd]
+        add_segments(source_points[utd], utd_points, 1)
+        add_segments(utd_points, first_hits[utd], 1)
+        add_segments(source_points[~utd], first_hits[~utd], 1)
+    else:
+        add_segments(source_points, first_hits, 1)
+
+    fields = [field for field in ("refl_bounce", "trans_bounce") if field in bounces.children]
+    depth = 1
+    while parents.size and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_parents = []
+        for field in fields:
+            children = bounces.children[field][parents]
+            present = children >= 0
+            add_segments(hit_points[parents[present]], hit_points[children[present]], depth)
+            next_parents.append(children[present])
+        parents = np.concatenate(next_parents) if next_parents else parents[:0]
+
+    starts = np.concatenate(starts) if starts else np.zeros((0, 3))
+    ends = np.concatenate(ends) if ends else np.zeros((0, 3))
+    segment_depths = np.concatenate(segment_depths) if segment_depths else np.zeros(0, dtype=np.int32)
+    if bounding_box is not None:
+        low = np.asarray(bounding_box[:3], dtype=float)
+        high = np.asarray(bounding_box[3:], dtype=float)
+        inside = np.all((starts >= low) & (starts <= high), axis=1) | np.all((ends >= low) & (ends <= high), axis=1)
+        starts, ends, segment_depths = starts[inside], ends[inside], segment_depths[inside]
+
+    num_segments = len(segment_depths)
+    points = np.empty((2 * num_segments, 3))
+    points[0::2] = starts
+    points[1::2] = ends
+    lines = np.empty((num_segments, 3), dtype=np.int64)
+    lines[:, 0] = 2
+    lines[:, 1] = np.arange(0, 2 * num_segments, 2)
+    lines[:, 2] = lines[:, 1] + 1
+    return points, lines.ravel(), np.repeat(segment_depths, 2)
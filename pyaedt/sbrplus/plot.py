@@ -23,12 +23,19 @@ class HDMPlotter(CommonPlotter):
     def __init__(self):
         CommonPlotter.__init__(self)
         self._bundle = None
+        self._bundle_file = None
+        self._records = None
+        self._rays = None
         self.show_as_standalone = True
         self.units = "meter"
 
     @property
     def hdm_data(self):
         """Return the ``hds`` Data parsed."""
+        if self._bundle is None and self._bundle_file:
+            from pyaedt.sbrplus.hdm_parser import Parser
+
+            self._bundle = Parser(filename=self._bundle_file).parse_message()
         return self._bundle
 
     @pyaedt_function_handler()
@@ -53,57 +60,47 @@ class HDMPlotter(CommonPlotter):
 
     @pyaedt_function_handler()
     def add_hdm_bundle_from_file(self, filename, units=None):
-        from pyaedt.sbrplus.hdm_parser import Parser
+        from pyaedt.sbrplus.hdm_parser import RecordParser
 
         if os.path.exists(filename):
-            self._bundle = Parser(filename=filename).parse_message()
+            parser = RecordParser(filename=filename)
+            self._records = parser.parse()
+            self._rays = self._records[parser.message["type"]].child_types["ray_tracks"]
+            self._bundle = None
+            self._bundle_file = filename
             self._bundle_units = units
 
     @pyaedt_function_handler()
-    def _add_rays(self):
-        from itertools import chain
+    def _add_rays(self, ray_indices=None, decimation=1, depths=None, bounding_box=None):
+        from pyaedt.sbrplus.hdm_utils import get_ray_paths
 
-        if not self._bundle:
+        if not self._records:
             return False
-        points = []
-        lines = []  # data structure for PyVista
-        depths = []  # track depth at each point in the track segments
-
-        def add_ray_segment(depth, bounce):
-            def add_ray_helper(depth, next_bounce):
-                lines.append([len(points) + i for i in range(2)])
-                depths.extend([depth, depth])
-                points.extend([bounce.hit_pt, next_bounce.hit_pt])
-                add_ray_segment(depth + 1, next_bounce)
-
-            # add more segments to the ray track rendering data
-            if bounce.refl_bounce:
-                add_ray_helper(depth, bounce.refl_bounce)
-            if bounce.trans_bounce:
-                add_ray_helper(depth, bounce.trans_bounce)
-
-        for track in self._bundle.ray_tracks:
-            if track.track_type == "UTD":
-                new_track_seg = [track.source_point, track.utd_point, track.first_bounce.hit_pt]
-            else:
-                new_track_seg = [track.source_point, track.first_bounce.hit_pt]
-            lines.append([len(points) + i for i in range(len(new_track_seg))])
-            depths.extend([1 for i in range(len(new_track_seg))])
-            points.extend(new_track_seg)
-            add_ray_segment(2, track.first_bounce)
-
-        lines = [[len(l), *l] for l in lines]
-        lines = [len(lines), *(chain.from_iterable(lines))]
-        return points, lines, depths
+        rays = self._records[self._rays]
+        bounces = self._records[rays.child_types["first_bounce"]]
+        return get_ray_paths(
+            rays, bounces, ray_indices=ray_indices, decimation=decimation, depths=depths, bounding_box=bounding_box
+        )
 
     @pyaedt_function_handler()
-    def plot_rays(self, snapshot_path=None):
+    def plot_rays(self, snapshot_path=None, ray_indices=None, decimation=1, depths=None, bounding_box=None):
         """Plot Rays read from an ``hdm`` file.
 
         Parameters
         ----------
         snapshot_path : str, optional
             Full path to exported image file. If ``None`` the plot will be shown.
+        ray_indices : list, slice, optional
+            Indices, slice or boolean mask of the rays to plot. The default is ``None``,
+            in which case all rays are plotted.
+        decimation : int, optional
+            Plot one ray out of ``decimation`` among the selected rays, to preview large bundles.
+            The default is ``1``.
+        depths : list, optional
+            Depths of the ray segments to plot. The default is ``None``, in which case all depths are plotted.
+        bounding_box : list, optional
+            ``[xmin, ymin, zmin, xmax, ymax, zmax]`` box in model units. Only the ray segments with at least
+            one end in the box are plotted. The default is ``None``.
 
         Returns
         -------
@@ -122,17 +119,20 @@ class HDMPlotter(CommonPlotter):
             self.pv = pv.Plotter(notebook=self.is_notebook, off_screen=self.off_screen, window_size=self.windows_size)
 
         self._add_objects()
-        points, lines, depths = self._add_rays()
         try:
             conv = 1 / AEDT_UNITS["Length"][self.units]
         except:
             conv = 1
-        points = [i * conv for i in points]
-        depth1 = pv.PolyData(points, lines=lines)
+        if bounding_box is not None:
+            bounding_box = [i / conv for i in bounding_box]
+        points, lines, point_depths = self._add_rays(
+            ray_indices=ray_indices, decimation=decimation, depths=depths, bounding_box=bounding_box
+        )
+        depth1 = pv.PolyData(points * conv, lines=lines)
         annotations = {i: str(i) for i in range(1, 7)}
         self.pv.add_mesh(
             depth1,
-            scalars=depths,
+            scalars=point_depths,
             annotations=annotations,
             clim=[0.5, 6.5],
             cmap=["green", "blue", "yellow", "red", "purple", "cyan"],
@@ -148,7 +148,7 @@ class HDMPlotter(CommonPlotter):
     @pyaedt_function_handler()
     def _first_bounce_currents(self):
         bounces = defaultdict(lambda: np.ndarray(3, np.complex128))
-        for track in self._bundle.ray_tracks:
+        for track in self.hdm_data.ray_tracks:
             bounce = track.first_bounce
             totalH = bounce.h_inc + bounce.h_refl
             if bounce.h_trans: